@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Synthetic and real-world-shaped modules for benchmarks."""
+
+import random
+from pathlib import Path
+from typing import final
+
+_FIXTURES = Path(__file__).parent / 'fixtures'
+_DECORATORS = (
+    '@final',
+    '@attrs.define(frozen=True)',
+    '@dataclass',
+    '@attrs.frozen',
+    '@dataclasses.dataclass(frozen=True)',
+    '@total_ordering',
+)
+_BASES = ('House', 'Protocol', 't.Protocol', 'Generic[T]', 'Enum', 'AppError', 'TypedDict', 'abc.ABC')
+_NAMES = ('House', 'Payment', 'Handler', 'Invoice', 'Consumer', 'Report', 'Reader', 'Account')
+
+
+@final
+class ModuleShape:
+    """Shape of synthetic module."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        classes: int,
+        methods: int,
+        ctor_size: int,
+        decorators: int,
+        bases: int,
+        depth: int,
+    ) -> None:
+        """Ctor.
+
+        :param classes: top-level classes in module
+        :param methods: methods in each class
+        :param ctor_size: statements in each __init__
+        :param decorators: decorators of each class
+        :param bases: bases of each class
+        :param depth: nesting depth of classes inside classes and functions
+        """
+        self.classes = classes
+        self.methods = methods
+        self.ctor_size = ctor_size
+        self.decorators = decorators
+        self.bases = bases
+        self.depth = depth
+
+
+def synthetic_module(shape: ModuleShape, seed: int) -> str:
+    """Source of module with given shape, same for same seed.
+
+    :param shape: ModuleShape
+    :param seed: random seed
+    :return: str
+    """
+    rnd = random.Random(seed)
+    lines = ['import attrs', 'from typing import final', '']
+    for idx in range(shape.classes):
+        lines.extend(_class_lines(shape, rnd, '{0}{1}'.format(rnd.choice(_NAMES), idx), shape.depth, ''))
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def synthetic_corpus(shape: ModuleShape, files: int, seed: int = 0) -> list[str]:
+    """Sources of synthetic modules.
+
+    :param shape: ModuleShape
+    :param files: count of modules
+    :param seed: random seed
+    :return: list[str]
+    """
+    return [synthetic_module(shape, seed + idx) for idx in range(files)]
+
+
+def fixture_corpus() -> dict[str, str]:
+    """Sources of real-world-shaped modules by file name.
+
+    :return: dict[str, str]
+    """
+    return {path.name: path.read_text() for path in sorted(_FIXTURES.glob('*.py'))}
+
+
+def _class_lines(shape: ModuleShape, rnd: random.Random, name: str, depth: int, indent: str) -> list[str]:
+    lines = [
+        '{0}{1}'.format(indent, deco)
+        for deco in rnd.sample(_DECORATORS, min(shape.decorators, len(_DECORATORS)))
+    ]
+    bases = rnd.sample(_BASES, min(shape.bases, len(_BASES)))
+    lines.append('{0}class {1}({2}):'.format(indent, name, ', '.join(bases)))
+    body = indent + '    '
+    lines.extend([
+        '{0}"""{1}."""'.format(body, name),
+        '',
+        '{0}{1}: int = 0'.format(body, rnd.choice(('limit', '_limit'))),
+        '',
+        '{0}def __init__(self, first, second):'.format(body),
+    ])
+    lines.extend(_ctor_lines(shape.ctor_size, rnd, body + '    '))
+    for idx in range(shape.methods):
+        lines.append('')
+        lines.extend(_method_lines(rnd, idx, body))
+    if depth > 0:
+        lines.append('')
+        if rnd.random() < 0.5:
+            lines.extend(_class_lines(shape, rnd, '{0}Nested'.format(name), depth - 1, body))
+        else:
+            lines.append('{0}def factory(self, first):'.format(body))
+            lines.extend(_class_lines(shape, rnd, '{0}Local'.format(name), depth - 1, body + '    '))
+            lines.append('{0}    return first'.format(body))
+    return lines
+
+
+def _ctor_lines(size: int, rnd: random.Random, indent: str) -> list[str]:
+    templates = (
+        'self._first = first',
+        'self._second: int = second',
+        'self._items = []',
+        'self._total = first + second',
+        'print(first)',
+        'self._limit = 10',
+    )
+    return ['{0}{1}'.format(indent, rnd.choice(templates)) for _ in range(max(size, 1))]
+
+
+def _method_lines(rnd: random.Random, idx: int, indent: str) -> list[str]:
+    body = indent + '    '
+    kind = rnd.randrange(5)
+    if kind == 0:
+        return [
+            '{0}@property'.format(indent),
+            '{0}def value{1}(self):'.format(indent, idx),
+            '{0}return self._value'.format(body),
+        ]
+    elif kind == 1:
+        return [
+            '{0}def get_value{1}(self, key):'.format(indent, idx),
+            '{0}return self._values[key]'.format(body),
+        ]
+    elif kind == 2:
+        return [
+            '{0}@classmethod'.format(indent),
+            '{0}def secondary{1}(cls, first):'.format(indent, idx),
+            '{0}return cls(first, Default())'.format(body),
+        ]
+    elif kind == 3:
+        return [
+            '{0}def area{1}(self):'.format(indent, idx),
+            '{0}if self._first:'.format(body),
+            '{0}    return self._first'.format(body),
+            '{0}return self._second'.format(body),
+        ]
+    return [
+        '{0}def total{1}(self, items):'.format(indent, idx),
+        '{0}result = 0'.format(body),
+        '{0}for item in items:'.format(body),
+        '{0}    result += item.price() * {1} + len(str(item))'.format(body, idx),
+        '{0}return {{"total": result, "items": [item.name() for item in items]}}'.format(body),
+    ]
@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Real-world-shaped module: elegant objects style domain code."""
+
+import enum
+from collections.abc import Sequence
+from typing import Protocol, final
+
+import attrs
+
+
+class Price(Protocol):
+    """Price."""
+
+    def amount(self) -> int:
+        """Amount in cents."""
+
+    def currency(self) -> str:
+        """Currency code."""
+
+
+class Cart(Protocol):
+    """Cart."""
+
+    def total(self) -> Price:
+        """Total price."""
+
+
+class Currency(enum.Enum):
+    """Currencies."""
+
+    rub = 'RUB'
+    usd = 'USD'
+
+
+class PriceMismatchError(Exception):
+    """Prices in different currencies."""
+
+
+@final
+@attrs.define(frozen=True)
+class FkPrice(Price):
+    """Fake price."""
+
+    _amount: int
+    _currency: str = 'RUB'
+
+    def amount(self) -> int:
+        """Amount in cents."""
+        return self._amount
+
+    def currency(self) -> str:
+        """Currency code."""
+        return self._currency
+
+
+@final
+@attrs.define(frozen=True)
+class SumPrice(Price):
+    """Sum of prices."""
+
+    _prices: Sequence[Price]
+
+    @classmethod
+    def of_amounts(cls, amounts: Sequence[int]) -> Price:
+        """Secondary ctor."""
+        return cls([FkPrice(amount) for amount in amounts])
+
+    def amount(self) -> int:
+        """Amount in cents."""
+        self._check_currencies()
+        return sum(price.amount() for price in self._prices)
+
+    def currency(self) -> str:
+        """Currency code."""
+        return self._prices[0].currency() if self._prices else Currency.rub.value
+
+    def _check_currencies(self) -> None:
+        if len({price.currency() for price in self._prices}) > 1:
+            raise PriceMismatchError
+
+
+@final
+@attrs.define(frozen=True)
+class DiscountedPrice(Price):
+    """Price with discount."""
+
+    _origin: Price
+    _percent: int
+
+    def amount(self) -> int:
+        """Amount in cents."""
+        return self._origin.amount() * (100 - self._percent) // 100
+
+    def currency(self) -> str:
+        """Currency code."""
+        return self._origin.currency()
+
+
+@final
+class PgCart(Cart):
+    """Cart stored in postgres."""
+
+    def __init__(self, pgsql, cart_id: int) -> None:
+        """Ctor."""
+        self._pgsql = pgsql
+        self._cart_id = cart_id
+
+    def total(self) -> Price:
+        """Total price."""
+        rows = self._pgsql.fetch_all('SELECT amount FROM items WHERE cart_id = :id', {'id': self._cart_id})
+        return SumPrice.of_amounts([row['amount'] for row in rows])
+
+
+@final
+class CachedCart(Cart):
+    """Cart with cached total."""
+
+    def __init__(self, origin: Cart) -> None:
+        """Ctor."""
+        self._origin = origin
+        self._cache: list[Price] = []
+
+    def total(self) -> Price:
+        """Total price."""
+        if not self._cache:
+            self._cache.append(self._origin.total())
+        return self._cache[0]
@@ -0,0 +1,1071 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Real-world-shaped module: generated API client with large literal tables."""
+
+from typing import Any
+
+
+ERROR_CODES = {
+    1000: ('E1000', 'Error number 0', {'retry': True, 'status': 400}),
+    1001: ('E1001', 'Error number 1', {'retry': False, 'status': 401}),
+    1002: ('E1002', 'Error number 2', {'retry': False, 'status': 402}),
+    1003: ('E1003', 'Error number 3', {'retry': True, 'status': 403}),
+    1004: ('E1004', 'Error number 4', {'retry': False, 'status': 404}),
+    1005: ('E1005', 'Error number 5', {'retry': False, 'status': 405}),
+    1006: ('E1006', 'Error number 6', {'retry': True, 'status': 406}),
+    1007: ('E1007', 'Error number 7', {'retry': False, 'status': 407}),
+    1008: ('E1008', 'Error number 8', {'retry': False, 'status': 408}),
+    1009: ('E1009', 'Error number 9', {'retry': True, 'status': 409}),
+    1010: ('E1010', 'Error number 10', {'retry': False, 'status': 410}),
+    1011: ('E1011', 'Error number 11', {'retry': False, 'status': 411}),
+    1012: ('E1012', 'Error number 12', {'retry': True, 'status': 412}),
+    1013: ('E1013', 'Error number 13', {'retry': False, 'status': 413}),
+    1014: ('E1014', 'Error number 14', {'retry': False, 'status': 414}),
+    1015: ('E1015', 'Error number 15', {'retry': True, 'status': 415}),
+    1016: ('E1016', 'Error number 16', {'retry': False, 'status': 416}),
+    1017: ('E1017', 'Error number 17', {'retry': False, 'status': 417}),
+    1018: ('E1018', 'Error number 18', {'retry': True, 'status': 418}),
+    1019: ('E1019', 'Error number 19', {'retry': False, 'status': 419}),
+    1020: ('E1020', 'Error number 20', {'retry': False, 'status': 420}),
+    1021: ('E1021', 'Error number 21', {'retry': True, 'status': 421}),
+    1022: ('E1022', 'Error number 22', {'retry': False, 'status': 422}),
+    1023: ('E1023', 'Error number 23', {'retry': False, 'status': 423}),
+    1024: ('E1024', 'Error number 24', {'retry': True, 'status': 424}),
+    1025: ('E1025', 'Error number 25', {'retry': False, 'status': 425}),
+    1026: ('E1026', 'Error number 26', {'retry': False, 'status': 426}),
+    1027: ('E1027', 'Error number 27', {'retry': True, 'status': 427}),
+    1028: ('E1028', 'Error number 28', {'retry': False, 'status': 428}),
+    1029: ('E1029', 'Error number 29', {'retry': False, 'status': 429}),
+    1030: ('E1030', 'Error number 30', {'retry': True, 'status': 430}),
+    1031: ('E1031', 'Error number 31', {'retry': False, 'status': 431}),
+    1032: ('E1032', 'Error number 32', {'retry': False, 'status': 432}),
+    1033: ('E1033', 'Error number 33', {'retry': True, 'status': 433}),
+    1034: ('E1034', 'Error number 34', {'retry': False, 'status': 434}),
+    1035: ('E1035', 'Error number 35', {'retry': False, 'status': 435}),
+    1036: ('E1036', 'Error number 36', {'retry': True, 'status': 436}),
+    1037: ('E1037', 'Error number 37', {'retry': False, 'status': 437}),
+    1038: ('E1038', 'Error number 38', {'retry': False, 'status': 438}),
+    1039: ('E1039', 'Error number 39', {'retry': True, 'status': 439}),
+    1040: ('E1040', 'Error number 40', {'retry': False, 'status': 440}),
+    1041: ('E1041', 'Error number 41', {'retry': False, 'status': 441}),
+    1042: ('E1042', 'Error number 42', {'retry': True, 'status': 442}),
+    1043: ('E1043', 'Error number 43', {'retry': False, 'status': 443}),
+    1044: ('E1044', 'Error number 44', {'retry': False, 'status': 444}),
+    1045: ('E1045', 'Error number 45', {'retry': True, 'status': 445}),
+    1046: ('E1046', 'Error number 46', {'retry': False, 'status': 446}),
+    1047: ('E1047', 'Error number 47', {'retry': False, 'status': 447}),
+    1048: ('E1048', 'Error number 48', {'retry': True, 'status': 448}),
+    1049: ('E1049', 'Error number 49', {'retry': False, 'status': 449}),
+    1050: ('E1050', 'Error number 50', {'retry': False, 'status': 450}),
+    1051: ('E1051', 'Error number 51', {'retry': True, 'status': 451}),
+    1052: ('E1052', 'Error number 52', {'retry': False, 'status': 452}),
+    1053: ('E1053', 'Error number 53', {'retry': False, 'status': 453}),
+    1054: ('E1054', 'Error number 54', {'retry': True, 'status': 454}),
+    1055: ('E1055', 'Error number 55', {'retry': False, 'status': 455}),
+    1056: ('E1056', 'Error number 56', {'retry': False, 'status': 456}),
+    1057: ('E1057', 'Error number 57', {'retry': True, 'status': 457}),
+    1058: ('E1058', 'Error number 58', {'retry': False, 'status': 458}),
+    1059: ('E1059', 'Error number 59', {'retry': False, 'status': 459}),
+    1060: ('E1060', 'Error number 60', {'retry': True, 'status': 460}),
+    1061: ('E1061', 'Error number 61', {'retry': False, 'status': 461}),
+    1062: ('E1062', 'Error number 62', {'retry': False, 'status': 462}),
+    1063: ('E1063', 'Error number 63', {'retry': True, 'status': 463}),
+    1064: ('E1064', 'Error number 64', {'retry': False, 'status': 464}),
+    1065: ('E1065', 'Error number 65', {'retry': False, 'status': 465}),
+    1066: ('E1066', 'Error number 66', {'retry': True, 'status': 466}),
+    1067: ('E1067', 'Error number 67', {'retry': False, 'status': 467}),
+    1068: ('E1068', 'Error number 68', {'retry': False, 'status': 468}),
+    1069: ('E1069', 'Error number 69', {'retry': True, 'status': 469}),
+    1070: ('E1070', 'Error number 70', {'retry': False, 'status': 470}),
+    1071: ('E1071', 'Error number 71', {'retry': False, 'status': 471}),
+    1072: ('E1072', 'Error number 72', {'retry': True, 'status': 472}),
+    1073: ('E1073', 'Error number 73', {'retry': False, 'status': 473}),
+    1074: ('E1074', 'Error number 74', {'retry': False, 'status': 474}),
+    1075: ('E1075', 'Error number 75', {'retry': True, 'status': 475}),
+    1076: ('E1076', 'Error number 76', {'retry': False, 'status': 476}),
+    1077: ('E1077', 'Error number 77', {'retry': False, 'status': 477}),
+    1078: ('E1078', 'Error number 78', {'retry': True, 'status': 478}),
+    1079: ('E1079', 'Error number 79', {'retry': False, 'status': 479}),
+    1080: ('E1080', 'Error number 80', {'retry': False, 'status': 480}),
+    1081: ('E1081', 'Error number 81', {'retry': True, 'status': 481}),
+    1082: ('E1082', 'Error number 82', {'retry': False, 'status': 482}),
+    1083: ('E1083', 'Error number 83', {'retry': False, 'status': 483}),
+    1084: ('E1084', 'Error number 84', {'retry': True, 'status': 484}),
+    1085: ('E1085', 'Error number 85', {'retry': False, 'status': 485}),
+    1086: ('E1086', 'Error number 86', {'retry': False, 'status': 486}),
+    1087: ('E1087', 'Error number 87', {'retry': True, 'status': 487}),
+    1088: ('E1088', 'Error number 88', {'retry': False, 'status': 488}),
+    1089: ('E1089', 'Error number 89', {'retry': False, 'status': 489}),
+    1090: ('E1090', 'Error number 90', {'retry': True, 'status': 490}),
+    1091: ('E1091', 'Error number 91', {'retry': False, 'status': 491}),
+    1092: ('E1092', 'Error number 92', {'retry': False, 'status': 492}),
+    1093: ('E1093', 'Error number 93', {'retry': True, 'status': 493}),
+    1094: ('E1094', 'Error number 94', {'retry': False, 'status': 494}),
+    1095: ('E1095', 'Error number 95', {'retry': False, 'status': 495}),
+    1096: ('E1096', 'Error number 96', {'retry': True, 'status': 496}),
+    1097: ('E1097', 'Error number 97', {'retry': False, 'status': 497}),
+    1098: ('E1098', 'Error number 98', {'retry': False, 'status': 498}),
+    1099: ('E1099', 'Error number 99', {'retry': True, 'status': 499}),
+    1100: ('E1100', 'Error number 100', {'retry': False, 'status': 400}),
+    1101: ('E1101', 'Error number 101', {'retry': False, 'status': 401}),
+    1102: ('E1102', 'Error number 102', {'retry': True, 'status': 402}),
+    1103: ('E1103', 'Error number 103', {'retry': False, 'status': 403}),
+    1104: ('E1104', 'Error number 104', {'retry': False, 'status': 404}),
+    1105: ('E1105', 'Error number 105', {'retry': True, 'status': 405}),
+    1106: ('E1106', 'Error number 106', {'retry': False, 'status': 406}),
+    1107: ('E1107', 'Error number 107', {'retry': False, 'status': 407}),
+    1108: ('E1108', 'Error number 108', {'retry': True, 'status': 408}),
+    1109: ('E1109', 'Error number 109', {'retry': False, 'status': 409}),
+    1110: ('E1110', 'Error number 110', {'retry': False, 'status': 410}),
+    1111: ('E1111', 'Error number 111', {'retry': True, 'status': 411}),
+    1112: ('E1112', 'Error number 112', {'retry': False, 'status': 412}),
+    1113: ('E1113', 'Error number 113', {'retry': False, 'status': 413}),
+    1114: ('E1114', 'Error number 114', {'retry': True, 'status': 414}),
+    1115: ('E1115', 'Error number 115', {'retry': False, 'status': 415}),
+    1116: ('E1116', 'Error number 116', {'retry': False, 'status': 416}),
+    1117: ('E1117', 'Error number 117', {'retry': True, 'status': 417}),
+    1118: ('E1118', 'Error number 118', {'retry': False, 'status': 418}),
+    1119: ('E1119', 'Error number 119', {'retry': False, 'status': 419}),
+    1120: ('E1120', 'Error number 120', {'retry': True, 'status': 420}),
+    1121: ('E1121', 'Error number 121', {'retry': False, 'status': 421}),
+    1122: ('E1122', 'Error number 122', {'retry': False, 'status': 422}),
+    1123: ('E1123', 'Error number 123', {'retry': True, 'status': 423}),
+    1124: ('E1124', 'Error number 124', {'retry': False, 'status': 424}),
+    1125: ('E1125', 'Error number 125', {'retry': False, 'status': 425}),
+    1126: ('E1126', 'Error number 126', {'retry': True, 'status': 426}),
+    1127: ('E1127', 'Error number 127', {'retry': False, 'status': 427}),
+    1128: ('E1128', 'Error number 128', {'retry': False, 'status': 428}),
+    1129: ('E1129', 'Error number 129', {'retry': True, 'status': 429}),
+    1130: ('E1130', 'Error number 130', {'retry': False, 'status': 430}),
+    1131: ('E1131', 'Error number 131', {'retry': False, 'status': 431}),
+    1132: ('E1132', 'Error number 132', {'retry': True, 'status': 432}),
+    1133: ('E1133', 'Error number 133', {'retry': False, 'status': 433}),
+    1134: ('E1134', 'Error number 134', {'retry': False, 'status': 434}),
+    1135: ('E1135', 'Error number 135', {'retry': True, 'status': 435}),
+    1136: ('E1136', 'Error number 136', {'retry': False, 'status': 436}),
+    1137: ('E1137', 'Error number 137', {'retry': False, 'status': 437}),
+    1138: ('E1138', 'Error number 138', {'retry': True, 'status': 438}),
+    1139: ('E1139', 'Error number 139', {'retry': False, 'status': 439}),
+    1140: ('E1140', 'Error number 140', {'retry': False, 'status': 440}),
+    1141: ('E1141', 'Error number 141', {'retry': True, 'status': 441}),
+    1142: ('E1142', 'Error number 142', {'retry': False, 'status': 442}),
+    1143: ('E1143', 'Error number 143', {'retry': False, 'status': 443}),
+    1144: ('E1144', 'Error number 144', {'retry': True, 'status': 444}),
+    1145: ('E1145', 'Error number 145', {'retry': False, 'status': 445}),
+    1146: ('E1146', 'Error number 146', {'retry': False, 'status': 446}),
+    1147: ('E1147', 'Error number 147', {'retry': True, 'status': 447}),
+    1148: ('E1148', 'Error number 148', {'retry': False, 'status': 448}),
+    1149: ('E1149', 'Error number 149', {'retry': False, 'status': 449}),
+    1150: ('E1150', 'Error number 150', {'retry': True, 'status': 450}),
+    1151: ('E1151', 'Error number 151', {'retry': False, 'status': 451}),
+    1152: ('E1152', 'Error number 152', {'retry': False, 'status': 452}),
+    1153: ('E1153', 'Error number 153', {'retry': True, 'status': 453}),
+    1154: ('E1154', 'Error number 154', {'retry': False, 'status': 454}),
+    1155: ('E1155', 'Error number 155', {'retry': False, 'status': 455}),
+    1156: ('E1156', 'Error number 156', {'retry': True, 'status': 456}),
+    1157: ('E1157', 'Error number 157', {'retry': False, 'status': 457}),
+    1158: ('E1158', 'Error number 158', {'retry': False, 'status': 458}),
+    1159: ('E1159', 'Error number 159', {'retry': True, 'status': 459}),
+    1160: ('E1160', 'Error number 160', {'retry': False, 'status': 460}),
+    1161: ('E1161', 'Error number 161', {'retry': False, 'status': 461}),
+    1162: ('E1162', 'Error number 162', {'retry': True, 'status': 462}),
+    1163: ('E1163', 'Error number 163', {'retry': False, 'status': 463}),
+    1164: ('E1164', 'Error number 164', {'retry': False, 'status': 464}),
+    1165: ('E1165', 'Error number 165', {'retry': True, 'status': 465}),
+    1166: ('E1166', 'Error number 166', {'retry': False, 'status': 466}),
+    1167: ('E1167', 'Error number 167', {'retry': False, 'status': 467}),
+    1168: ('E1168', 'Error number 168', {'retry': True, 'status': 468}),
+    1169: ('E1169', 'Error number 169', {'retry': False, 'status': 469}),
+    1170: ('E1170', 'Error number 170', {'retry': False, 'status': 470}),
+    1171: ('E1171', 'Error number 171', {'retry': True, 'status': 471}),
+    1172: ('E1172', 'Error number 172', {'retry': False, 'status': 472}),
+    1173: ('E1173', 'Error number 173', {'retry': False, 'status': 473}),
+    1174: ('E1174', 'Error number 174', {'retry': True, 'status': 474}),
+    1175: ('E1175', 'Error number 175', {'retry': False, 'status': 475}),
+    1176: ('E1176', 'Error number 176', {'retry': False, 'status': 476}),
+    1177: ('E1177', 'Error number 177', {'retry': True, 'status': 477}),
+    1178: ('E1178', 'Error number 178', {'retry': False, 'status': 478}),
+    1179: ('E1179', 'Error number 179', {'retry': False, 'status': 479}),
+    1180: ('E1180', 'Error number 180', {'retry': True, 'status': 480}),
+    1181: ('E1181', 'Error number 181', {'retry': False, 'status': 481}),
+    1182: ('E1182', 'Error number 182', {'retry': False, 'status': 482}),
+    1183: ('E1183', 'Error number 183', {'retry': True, 'status': 483}),
+    1184: ('E1184', 'Error number 184', {'retry': False, 'status': 484}),
+    1185: ('E1185', 'Error number 185', {'retry': False, 'status': 485}),
+    1186: ('E1186', 'Error number 186', {'retry': True, 'status': 486}),
+    1187: ('E1187', 'Error number 187', {'retry': False, 'status': 487}),
+    1188: ('E1188', 'Error number 188', {'retry': False, 'status': 488}),
+    1189: ('E1189', 'Error number 189', {'retry': True, 'status': 489}),
+    1190: ('E1190', 'Error number 190', {'retry': False, 'status': 490}),
+    1191: ('E1191', 'Error number 191', {'retry': False, 'status': 491}),
+    1192: ('E1192', 'Error number 192', {'retry': True, 'status': 492}),
+    1193: ('E1193', 'Error number 193', {'retry': False, 'status': 493}),
+    1194: ('E1194', 'Error number 194', {'retry': False, 'status': 494}),
+    1195: ('E1195', 'Error number 195', {'retry': True, 'status': 495}),
+    1196: ('E1196', 'Error number 196', {'retry': False, 'status': 496}),
+    1197: ('E1197', 'Error number 197', {'retry': False, 'status': 497}),
+    1198: ('E1198', 'Error number 198', {'retry': True, 'status': 498}),
+    1199: ('E1199', 'Error number 199', {'retry': False, 'status': 499}),
+    1200: ('E1200', 'Error number 200', {'retry': False, 'status': 400}),
+    1201: ('E1201', 'Error number 201', {'retry': True, 'status': 401}),
+    1202: ('E1202', 'Error number 202', {'retry': False, 'status': 402}),
+    1203: ('E1203', 'Error number 203', {'retry': False, 'status': 403}),
+    1204: ('E1204', 'Error number 204', {'retry': True, 'status': 404}),
+    1205: ('E1205', 'Error number 205', {'retry': False, 'status': 405}),
+    1206: ('E1206', 'Error number 206', {'retry': False, 'status': 406}),
+    1207: ('E1207', 'Error number 207', {'retry': True, 'status': 407}),
+    1208: ('E1208', 'Error number 208', {'retry': False, 'status': 408}),
+    1209: ('E1209', 'Error number 209', {'retry': False, 'status': 409}),
+    1210: ('E1210', 'Error number 210', {'retry': True, 'status': 410}),
+    1211: ('E1211', 'Error number 211', {'retry': False, 'status': 411}),
+    1212: ('E1212', 'Error number 212', {'retry': False, 'status': 412}),
+    1213: ('E1213', 'Error number 213', {'retry': True, 'status': 413}),
+    1214: ('E1214', 'Error number 214', {'retry': False, 'status': 414}),
+    1215: ('E1215', 'Error number 215', {'retry': False, 'status': 415}),
+    1216: ('E1216', 'Error number 216', {'retry': True, 'status': 416}),
+    1217: ('E1217', 'Error number 217', {'retry': False, 'status': 417}),
+    1218: ('E1218', 'Error number 218', {'retry': False, 'status': 418}),
+    1219: ('E1219', 'Error number 219', {'retry': True, 'status': 419}),
+    1220: ('E1220', 'Error number 220', {'retry': False, 'status': 420}),
+    1221: ('E1221', 'Error number 221', {'retry': False, 'status': 421}),
+    1222: ('E1222', 'Error number 222', {'retry': True, 'status': 422}),
+    1223: ('E1223', 'Error number 223', {'retry': False, 'status': 423}),
+    1224: ('E1224', 'Error number 224', {'retry': False, 'status': 424}),
+    1225: ('E1225', 'Error number 225', {'retry': True, 'status': 425}),
+    1226: ('E1226', 'Error number 226', {'retry': False, 'status': 426}),
+    1227: ('E1227', 'Error number 227', {'retry': False, 'status': 427}),
+    1228: ('E1228', 'Error number 228', {'retry': True, 'status': 428}),
+    1229: ('E1229', 'Error number 229', {'retry': False, 'status': 429}),
+    1230: ('E1230', 'Error number 230', {'retry': False, 'status': 430}),
+    1231: ('E1231', 'Error number 231', {'retry': True, 'status': 431}),
+    1232: ('E1232', 'Error number 232', {'retry': False, 'status': 432}),
+    1233: ('E1233', 'Error number 233', {'retry': False, 'status': 433}),
+    1234: ('E1234', 'Error number 234', {'retry': True, 'status': 434}),
+    1235: ('E1235', 'Error number 235', {'retry': False, 'status': 435}),
+    1236: ('E1236', 'Error number 236', {'retry': False, 'status': 436}),
+    1237: ('E1237', 'Error number 237', {'retry': True, 'status': 437}),
+    1238: ('E1238', 'Error number 238', {'retry': False, 'status': 438}),
+    1239: ('E1239', 'Error number 239', {'retry': False, 'status': 439}),
+    1240: ('E1240', 'Error number 240', {'retry': True, 'status': 440}),
+    1241: ('E1241', 'Error number 241', {'retry': False, 'status': 441}),
+    1242: ('E1242', 'Error number 242', {'retry': False, 'status': 442}),
+    1243: ('E1243', 'Error number 243', {'retry': True, 'status': 443}),
+    1244: ('E1244', 'Error number 244', {'retry': False, 'status': 444}),
+    1245: ('E1245', 'Error number 245', {'retry': False, 'status': 445}),
+    1246: ('E1246', 'Error number 246', {'retry': True, 'status': 446}),
+    1247: ('E1247', 'Error number 247', {'retry': False, 'status': 447}),
+    1248: ('E1248', 'Error number 248', {'retry': False, 'status': 448}),
+    1249: ('E1249', 'Error number 249', {'retry': True, 'status': 449}),
+    1250: ('E1250', 'Error number 250', {'retry': False, 'status': 450}),
+    1251: ('E1251', 'Error number 251', {'retry': False, 'status': 451}),
+    1252: ('E1252', 'Error number 252', {'retry': True, 'status': 452}),
+    1253: ('E1253', 'Error number 253', {'retry': False, 'status': 453}),
+    1254: ('E1254', 'Error number 254', {'retry': False, 'status': 454}),
+    1255: ('E1255', 'Error number 255', {'retry': True, 'status': 455}),
+    1256: ('E1256', 'Error number 256', {'retry': False, 'status': 456}),
+    1257: ('E1257', 'Error number 257', {'retry': False, 'status': 457}),
+    1258: ('E1258', 'Error number 258', {'retry': True, 'status': 458}),
+    1259: ('E1259', 'Error number 259', {'retry': False, 'status': 459}),
+    1260: ('E1260', 'Error number 260', {'retry': False, 'status': 460}),
+    1261: ('E1261', 'Error number 261', {'retry': True, 'status': 461}),
+    1262: ('E1262', 'Error number 262', {'retry': False, 'status': 462}),
+    1263: ('E1263', 'Error number 263', {'retry': False, 'status': 463}),
+    1264: ('E1264', 'Error number 264', {'retry': True, 'status': 464}),
+    1265: ('E1265', 'Error number 265', {'retry': False, 'status': 465}),
+    1266: ('E1266', 'Error number 266', {'retry': False, 'status': 466}),
+    1267: ('E1267', 'Error number 267', {'retry': True, 'status': 467}),
+    1268: ('E1268', 'Error number 268', {'retry': False, 'status': 468}),
+    1269: ('E1269', 'Error number 269', {'retry': False, 'status': 469}),
+    1270: ('E1270', 'Error number 270', {'retry': True, 'status': 470}),
+    1271: ('E1271', 'Error number 271', {'retry': False, 'status': 471}),
+    1272: ('E1272', 'Error number 272', {'retry': False, 'status': 472}),
+    1273: ('E1273', 'Error number 273', {'retry': True, 'status': 473}),
+    1274: ('E1274', 'Error number 274', {'retry': False, 'status': 474}),
+    1275: ('E1275', 'Error number 275', {'retry': False, 'status': 475}),
+    1276: ('E1276', 'Error number 276', {'retry': True, 'status': 476}),
+    1277: ('E1277', 'Error number 277', {'retry': False, 'status': 477}),
+    1278: ('E1278', 'Error number 278', {'retry': False, 'status': 478}),
+    1279: ('E1279', 'Error number 279', {'retry': True, 'status': 479}),
+    1280: ('E1280', 'Error number 280', {'retry': False, 'status': 480}),
+    1281: ('E1281', 'Error number 281', {'retry': False, 'status': 481}),
+    1282: ('E1282', 'Error number 282', {'retry': True, 'status': 482}),
+    1283: ('E1283', 'Error number 283', {'retry': False, 'status': 483}),
+    1284: ('E1284', 'Error number 284', {'retry': False, 'status': 484}),
+    1285: ('E1285', 'Error number 285', {'retry': True, 'status': 485}),
+    1286: ('E1286', 'Error number 286', {'retry': False, 'status': 486}),
+    1287: ('E1287', 'Error number 287', {'retry': False, 'status': 487}),
+    1288: ('E1288', 'Error number 288', {'retry': True, 'status': 488}),
+    1289: ('E1289', 'Error number 289', {'retry': False, 'status': 489}),
+    1290: ('E1290', 'Error number 290', {'retry': False, 'status': 490}),
+    1291: ('E1291', 'Error number 291', {'retry': True, 'status': 491}),
+    1292: ('E1292', 'Error number 292', {'retry': False, 'status': 492}),
+    1293: ('E1293', 'Error number 293', {'retry': False, 'status': 493}),
+    1294: ('E1294', 'Error number 294', {'retry': True, 'status': 494}),
+    1295: ('E1295', 'Error number 295', {'retry': False, 'status': 495}),
+    1296: ('E1296', 'Error number 296', {'retry': False, 'status': 496}),
+    1297: ('E1297', 'Error number 297', {'retry': True, 'status': 497}),
+    1298: ('E1298', 'Error number 298', {'retry': False, 'status': 498}),
+    1299: ('E1299', 'Error number 299', {'retry': False, 'status': 499}),
+}
+
+
+class PetModel:
+    """Pet model."""
+
+    openapi_types = {
+        'id': 'str',
+        'name': 'str',
+        'status': 'str',
+        'created': 'str',
+        'updated': 'str',
+        'tags': 'str',
+    }
+
+    def __init__(self, id=None, name=None, status=None, created=None, updated=None, tags=None):
+        self._id = None
+        self._name = None
+        self._status = None
+        self._created = None
+        self._updated = None
+        self._tags = None
+        if id is not None:
+            self.id = id
+        if name is not None:
+            self.name = name
+        if status is not None:
+            self.status = status
+        if created is not None:
+            self.created = created
+        if updated is not None:
+            self.updated = updated
+        if tags is not None:
+            self.tags = tags
+
+    @property
+    def id(self):
+        return self._id
+
+    @id.setter
+    def id(self, id):
+        self._id = id
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        self._status = status
+
+    @property
+    def created(self):
+        return self._created
+
+    @created.setter
+    def created(self, created):
+        self._created = created
+
+    @property
+    def updated(self):
+        return self._updated
+
+    @updated.setter
+    def updated(self, updated):
+        self._updated = updated
+
+    @property
+    def tags(self):
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags):
+        self._tags = tags
+
+    def to_dict(self) -> dict[str, Any]:
+        result = {}
+        for attr in self.openapi_types:
+            value = getattr(self, attr)
+            result[attr] = value.to_dict() if hasattr(value, "to_dict") else value
+        return result
+
+
+class OwnerModel:
+    """Owner model."""
+
+    openapi_types = {
+        'id': 'str',
+        'name': 'str',
+        'status': 'str',
+        'created': 'str',
+        'updated': 'str',
+        'tags': 'str',
+    }
+
+    def __init__(self, id=None, name=None, status=None, created=None, updated=None, tags=None):
+        self._id = None
+        self._name = None
+        self._status = None
+        self._created = None
+        self._updated = None
+        self._tags = None
+        if id is not None:
+            self.id = id
+        if name is not None:
+            self.name = name
+        if status is not None:
+            self.status = status
+        if created is not None:
+            self.created = created
+        if updated is not None:
+            self.updated = updated
+        if tags is not None:
+            self.tags = tags
+
+    @property
+    def id(self):
+        return self._id
+
+    @id.setter
+    def id(self, id):
+        self._id = id
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        self._status = status
+
+    @property
+    def created(self):
+        return self._created
+
+    @created.setter
+    def created(self, created):
+        self._created = created
+
+    @property
+    def updated(self):
+        return self._updated
+
+    @updated.setter
+    def updated(self, updated):
+        self._updated = updated
+
+    @property
+    def tags(self):
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags):
+        self._tags = tags
+
+    def to_dict(self) -> dict[str, Any]:
+        result = {}
+        for attr in self.openapi_types:
+            value = getattr(self, attr)
+            result[attr] = value.to_dict() if hasattr(value, "to_dict") else value
+        return result
+
+
+class OrderModel:
+    """Order model."""
+
+    openapi_types = {
+        'id': 'str',
+        'name': 'str',
+        'status': 'str',
+        'created': 'str',
+        'updated': 'str',
+        'tags': 'str',
+    }
+
+    def __init__(self, id=None, name=None, status=None, created=None, updated=None, tags=None):
+        self._id = None
+        self._name = None
+        self._status = None
+        self._created = None
+        self._updated = None
+        self._tags = None
+        if id is not None:
+            self.id = id
+        if name is not None:
+            self.name = name
+        if status is not None:
+            self.status = status
+        if created is not None:
+            self.created = created
+        if updated is not None:
+            self.updated = updated
+        if tags is not None:
+            self.tags = tags
+
+    @property
+    def id(self):
+        return self._id
+
+    @id.setter
+    def id(self, id):
+        self._id = id
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        self._status = status
+
+    @property
+    def created(self):
+        return self._created
+
+    @created.setter
+    def created(self, created):
+        self._created = created
+
+    @property
+    def updated(self):
+        return self._updated
+
+    @updated.setter
+    def updated(self, updated):
+        self._updated = updated
+
+    @property
+    def tags(self):
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags):
+        self._tags = tags
+
+    def to_dict(self) -> dict[str, Any]:
+        result = {}
+        for attr in self.openapi_types:
+            value = getattr(self, attr)
+            result[attr] = value.to_dict() if hasattr(value, "to_dict") else value
+        return result
+
+
+class TagModel:
+    """Tag model."""
+
+    openapi_types = {
+        'id': 'str',
+        'name': 'str',
+        'status': 'str',
+        'created': 'str',
+        'updated': 'str',
+        'tags': 'str',
+    }
+
+    def __init__(self, id=None, name=None, status=None, created=None, updated=None, tags=None):
+        self._id = None
+        self._name = None
+        self._status = None
+        self._created = None
+        self._updated = None
+        self._tags = None
+        if id is not None:
+            self.id = id
+        if name is not None:
+            self.name = name
+        if status is not None:
+            self.status = status
+        if created is not None:
+            self.created = created
+        if updated is not None:
+            self.updated = updated
+        if tags is not None:
+            self.tags = tags
+
+    @property
+    def id(self):
+        return self._id
+
+    @id.setter
+    def id(self, id):
+        self._id = id
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        self._status = status
+
+    @property
+    def created(self):
+        return self._created
+
+    @created.setter
+    def created(self, created):
+        self._created = created
+
+    @property
+    def updated(self):
+        return self._updated
+
+    @updated.setter
+    def updated(self, updated):
+        self._updated = updated
+
+    @property
+    def tags(self):
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags):
+        self._tags = tags
+
+    def to_dict(self) -> dict[str, Any]:
+        result = {}
+        for attr in self.openapi_types:
+            value = getattr(self, attr)
+            result[attr] = value.to_dict() if hasattr(value, "to_dict") else value
+        return result
+
+
+class CategoryModel:
+    """Category model."""
+
+    openapi_types = {
+        'id': 'str',
+        'name': 'str',
+        'status': 'str',
+        'created': 'str',
+        'updated': 'str',
+        'tags': 'str',
+    }
+
+    def __init__(self, id=None, name=None, status=None, created=None, updated=None, tags=None):
+        self._id = None
+        self._name = None
+        self._status = None
+        self._created = None
+        self._updated = None
+        self._tags = None
+        if id is not None:
+            self.id = id
+        if name is not None:
+            self.name = name
+        if status is not None:
+            self.status = status
+        if created is not None:
+            self.created = created
+        if updated is not None:
+            self.updated = updated
+        if tags is not None:
+            self.tags = tags
+
+    @property
+    def id(self):
+        return self._id
+
+    @id.setter
+    def id(self, id):
+        self._id = id
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        self._status = status
+
+    @property
+    def created(self):
+        return self._created
+
+    @created.setter
+    def created(self, created):
+        self._created = created
+
+    @property
+    def updated(self):
+        return self._updated
+
+    @updated.setter
+    def updated(self, updated):
+        self._updated = updated
+
+    @property
+    def tags(self):
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags):
+        self._tags = tags
+
+    def to_dict(self) -> dict[str, Any]:
+        result = {}
+        for attr in self.openapi_types:
+            value = getattr(self, attr)
+            result[attr] = value.to_dict() if hasattr(value, "to_dict") else value
+        return result
+
+
+class AddressModel:
+    """Address model."""
+
+    openapi_types = {
+        'id': 'str',
+        'name': 'str',
+        'status': 'str',
+        'created': 'str',
+        'updated': 'str',
+        'tags': 'str',
+    }
+
+    def __init__(self, id=None, name=None, status=None, created=None, updated=None, tags=None):
+        self._id = None
+        self._name = None
+        self._status = None
+        self._created = None
+        self._updated = None
+        self._tags = None
+        if id is not None:
+            self.id = id
+        if name is not None:
+            self.name = name
+        if status is not None:
+            self.status = status
+        if created is not None:
+            self.created = created
+        if updated is not None:
+            self.updated = updated
+        if tags is not None:
+            self.tags = tags
+
+    @property
+    def id(self):
+        return self._id
+
+    @id.setter
+    def id(self, id):
+        self._id = id
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        self._status = status
+
+    @property
+    def created(self):
+        return self._created
+
+    @created.setter
+    def created(self, created):
+        self._created = created
+
+    @property
+    def updated(self):
+        return self._updated
+
+    @updated.setter
+    def updated(self, updated):
+        self._updated = updated
+
+    @property
+    def tags(self):
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags):
+        self._tags = tags
+
+    def to_dict(self) -> dict[str, Any]:
+        result = {}
+        for attr in self.openapi_types:
+            value = getattr(self, attr)
+            result[attr] = value.to_dict() if hasattr(value, "to_dict") else value
+        return result
+
+
+class UserModel:
+    """User model."""
+
+    openapi_types = {
+        'id': 'str',
+        'name': 'str',
+        'status': 'str',
+        'created': 'str',
+        'updated': 'str',
+        'tags': 'str',
+    }
+
+    def __init__(self, id=None, name=None, status=None, created=None, updated=None, tags=None):
+        self._id = None
+        self._name = None
+        self._status = None
+        self._created = None
+        self._updated = None
+        self._tags = None
+        if id is not None:
+            self.id = id
+        if name is not None:
+            self.name = name
+        if status is not None:
+            self.status = status
+        if created is not None:
+            self.created = created
+        if updated is not None:
+            self.updated = updated
+        if tags is not None:
+            self.tags = tags
+
+    @property
+    def id(self):
+        return self._id
+
+    @id.setter
+    def id(self, id):
+        self._id = id
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        self._status = status
+
+    @property
+    def created(self):
+        return self._created
+
+    @created.setter
+    def created(self, created):
+        self._created = created
+
+    @property
+    def updated(self):
+        return self._updated
+
+    @updated.setter
+    def updated(self, updated):
+        self._updated = updated
+
+    @property
+    def tags(self):
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags):
+        self._tags = tags
+
+    def to_dict(self) -> dict[str, Any]:
+        result = {}
+        for attr in self.openapi_types:
+            value = getattr(self, attr)
+            result[attr] = value.to_dict() if hasattr(value, "to_dict") else value
+        return result
+
+
+class InvoiceModel:
+    """Invoice model."""
+
+    openapi_types = {
+        'id': 'str',
+        'name': 'str',
+        'status': 'str',
+        'created': 'str',
+        'updated': 'str',
+        'tags': 'str',
+    }
+
+    def __init__(self, id=None, name=None, status=None, created=None, updated=None, tags=None):
+        self._id = None
+        self._name = None
+        self._status = None
+        self._created = None
+        self._updated = None
+        self._tags = None
+        if id is not None:
+            self.id = id
+        if name is not None:
+            self.name = name
+        if status is not None:
+            self.status = status
+        if created is not None:
+            self.created = created
+        if updated is not None:
+            self.updated = updated
+        if tags is not None:
+            self.tags = tags
+
+    @property
+    def id(self):
+        return self._id
+
+    @id.setter
+    def id(self, id):
+        self._id = id
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        self._status = status
+
+    @property
+    def created(self):
+        return self._created
+
+    @created.setter
+    def created(self, created):
+        self._created = created
+
+    @property
+    def updated(self):
+        return self._updated
+
+    @updated.setter
+    def updated(self, updated):
+        self._updated = updated
+
+    @property
+    def tags(self):
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags):
+        self._tags = tags
+
+    def to_dict(self) -> dict[str, Any]:
+        result = {}
+        for attr in self.openapi_types:
+            value = getattr(self, attr)
+            result[attr] = value.to_dict() if hasattr(value, "to_dict") else value
+        return result
+
+
+class ApiClient:
+    """Api client."""
+
+    def __init__(self, configuration=None):
+        self.configuration = configuration
+        self.default_headers = {}
+
+    def get_pet_by_id(self, pet_id, **kwargs):
+        return self.call_api('/pet/{id}', 'GET', path_params={'id': pet_id}, response_type='PetModel', **kwargs)
+
+    def update_pet(self, body, **kwargs):
+        return self.call_api('/pet', 'PUT', body=body, response_type='PetModel', **kwargs)
+
+    def get_owner_by_id(self, owner_id, **kwargs):
+        return self.call_api('/owner/{id}', 'GET', path_params={'id': owner_id}, response_type='OwnerModel', **kwargs)
+
+    def update_owner(self, body, **kwargs):
+        return self.call_api('/owner', 'PUT', body=body, response_type='OwnerModel', **kwargs)
+
+    def get_order_by_id(self, order_id, **kwargs):
+        return self.call_api('/order/{id}', 'GET', path_params={'id': order_id}, response_type='OrderModel', **kwargs)
+
+    def update_order(self, body, **kwargs):
+        return self.call_api('/order', 'PUT', body=body, response_type='OrderModel', **kwargs)
+
+    def get_tag_by_id(self, tag_id, **kwargs):
+        return self.call_api('/tag/{id}', 'GET', path_params={'id': tag_id}, response_type='TagModel', **kwargs)
+
+    def update_tag(self, body, **kwargs):
+        return self.call_api('/tag', 'PUT', body=body, response_type='TagModel', **kwargs)
+
+    def get_category_by_id(self, category_id, **kwargs):
+        return self.call_api('/category/{id}', 'GET', path_params={'id': category_id}, response_type='CategoryModel', **kwargs)
+
+    def update_category(self, body, **kwargs):
+        return self.call_api('/category', 'PUT', body=body, response_type='CategoryModel', **kwargs)
+
+    def get_address_by_id(self, address_id, **kwargs):
+        return self.call_api('/address/{id}', 'GET', path_params={'id': address_id}, response_type='AddressModel', **kwargs)
+
+    def update_address(self, body, **kwargs):
+        return self.call_api('/address', 'PUT', body=body, response_type='AddressModel', **kwargs)
+
+    def get_user_by_id(self, user_id, **kwargs):
+        return self.call_api('/user/{id}', 'GET', path_params={'id': user_id}, response_type='UserModel', **kwargs)
+
+    def update_user(self, body, **kwargs):
+        return self.call_api('/user', 'PUT', body=body, response_type='UserModel', **kwargs)
+
+    def get_invoice_by_id(self, invoice_id, **kwargs):
+        return self.call_api('/invoice/{id}', 'GET', path_params={'id': invoice_id}, response_type='InvoiceModel', **kwargs)
+
+    def update_invoice(self, body, **kwargs):
+        return self.call_api('/invoice', 'PUT', body=body, response_type='InvoiceModel', **kwargs)
+
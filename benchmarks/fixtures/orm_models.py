@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Real-world-shaped module: ORM models with admin and serializers."""
+
+from django.contrib import admin
+from django.db import models
+from rest_framework import serializers
+
+
+class Customer(models.Model):
+    """Customer of shop."""
+
+    name = models.CharField(max_length=255)
+    email = models.EmailField(unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'customer'
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def display_name(self):
+        return '{0} <{1}>'.format(self.name, self.email)
+
+    def get_absolute_url(self):
+        return '/customers/{0}/'.format(self.pk)
+
+    def deactivate(self):
+        self.is_active = False
+        self.save(update_fields=['is_active'])
+
+
+class Order(models.Model):
+    """Order of customer."""
+
+    customer = models.ForeignKey(Customer, on_delete=models.CASCADE, related_name='orders')
+    total = models.DecimalField(max_digits=10, decimal_places=2)
+    status = models.CharField(max_length=32, default='new')
+
+    class Meta:
+        ordering = ['-pk']
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._original_status = self.status
+
+    def get_total(self):
+        return self.total
+
+    def status_changed(self):
+        return self._original_status != self.status
+
+    def items_total(self):
+        result = 0
+        for item in self.items.all():
+            result += item.price * item.quantity
+        return result
+
+
+class OrderItem(models.Model):
+    """Item of order."""
+
+    order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name='items')
+    name = models.CharField(max_length=255)
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    quantity = models.PositiveIntegerField(default=1)
+
+    def cost(self):
+        return self.price * self.quantity
+
+
+class OrderStatus(models.TextChoices):
+    """Statuses of order."""
+
+    NEW = 'new'
+    PAID = 'paid'
+    SHIPPED = 'shipped'
+
+
+class CustomerSerializer(serializers.ModelSerializer):
+    """Serializer of customer."""
+
+    orders_count = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Customer
+        fields = ['id', 'name', 'email', 'orders_count']
+
+    def get_orders_count(self, obj):
+        return obj.orders.count()
+
+
+class OrderSerializer(serializers.ModelSerializer):
+    """Serializer of order."""
+
+    customer = CustomerSerializer(read_only=True)
+
+    class Meta:
+        model = Order
+        fields = ['id', 'customer', 'total', 'status']
+
+    def validate_total(self, value):
+        if value < 0:
+            raise serializers.ValidationError('Negative total')
+        return value
+
+
+@admin.register(Customer)
+class CustomerAdmin(admin.ModelAdmin):
+    """Admin of customers."""
+
+    list_display = ['name', 'email', 'created_at', 'is_active']
+    search_fields = ['name', 'email']
+    list_filter = ['is_active']
+
+    @admin.action(description='Deactivate customers')
+    def deactivate(self, request, queryset):
+        for customer in queryset:
+            customer.deactivate()
+
+
+@admin.register(Order)
+class OrderAdmin(admin.ModelAdmin):
+    """Admin of orders."""
+
+    list_display = ['id', 'customer', 'total', 'status']
+    raw_id_fields = ['customer']
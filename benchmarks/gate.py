@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Benchmark regression gate, run with ``python -m benchmarks.gate``.
+
+Timings are divided by timing of plain ``ast.NodeVisitor`` walk over the same corpus,
+measured in the same process, so baseline recorded on one machine is comparable on another.
+Baseline keeps allowed slowdown of each target, derived from its noise, when baseline was recorded.
+"""
+
+import argparse
+import ast
+import gc
+import json
+import math
+import statistics
+import sys
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from benchmarks.harness import benchmark_targets, corpus_sources, harness_parser, measure, parsed_modules, plugin_options
+
+_BASELINE = Path(__file__).parent / 'baseline.json'
+_REFERENCE = 'ast.NodeVisitor'
+
+
+def relative_timings(
+    targets: dict[str, Callable[[ast.AST, list[str]], object]],
+    modules: Sequence[tuple[ast.AST, list[str]]],
+    warmup: int,
+    repeat: int,
+) -> dict[str, dict[str, float]]:
+    """Median and interquartile range of each target, relative to reference walk.
+
+    Each round runs reference and all targets one after another with disabled garbage collector,
+    target timing is divided by reference timing of the same round,
+    so drift of machine load between rounds is cancelled out.
+
+    :param targets: measured callables by name
+    :param modules: parsed trees with source lines
+    :param warmup: not measured runs of each target
+    :param repeat: measured runs of each target
+    :return: dict[str, dict[str, float]]
+    """
+    targets = {_REFERENCE: lambda tree, lines: ast.NodeVisitor().visit(tree), **targets}
+    for target in targets.values():
+        measure(target, modules, warmup)
+    relative: dict[str, list[float]] = {name: [] for name in targets if name != _REFERENCE}
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            rounds = {name: measure(target, modules, 1)[0] for name, target in targets.items()}
+            for name, runs in relative.items():
+                runs.append(rounds[name] / rounds[_REFERENCE])
+    finally:
+        gc.enable()
+    results = {}
+    for name, runs in relative.items():
+        quartiles = statistics.quantiles(runs, n=4)
+        results[name] = {
+            'q1': quartiles[0],
+            'median': quartiles[1],
+            'iqr': quartiles[2] - quartiles[0],
+        }
+    return results
+
+
+def regressions(
+    baseline: dict[str, dict[str, float]],
+    current: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """Descriptions of targets, that became slower than allowed.
+
+    Target regresses only when even its first quartile is slower than baseline median,
+    so single noisy runs don't fail the gate.
+
+    :param baseline: relative timings from baseline file
+    :param current: relative timings of current run
+    :param threshold: allowed slowdown in percents of targets without own ``allowed`` in baseline
+    :return: list[str]
+    """
+    found = []
+    for name, base in baseline.items():
+        if name not in current:
+            continue
+        allowed = base.get('allowed', threshold)
+        slowdown = (current[name]['q1'] / base['median'] - 1) * 100
+        if slowdown > allowed:
+            found.append('{0}: {1:.1f}% slower than baseline (first quartile {2:.1f}%, allowed {3:.1f}%)'.format(
+                name,
+                (current[name]['median'] / base['median'] - 1) * 100,
+                slowdown,
+                allowed,
+            ))
+    return found
+
+
+def allowed_slowdowns(current: dict[str, dict[str, float]], threshold: float) -> dict[str, dict[str, float]]:
+    """Relative timings with allowed slowdown of each target: relative IQR, but not less than threshold.
+
+    Targets with short timings, e.g. single rules, are noisier, so they get wider margin.
+
+    :param current: relative timings
+    :param threshold: least allowed slowdown in percents
+    :return: dict[str, dict[str, float]]
+    """
+    return {
+        name: {**result, 'allowed': max(threshold, math.ceil(result['iqr'] / result['median'] * 100))}
+        for name, result in current.items()
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry.
+
+    :param argv: command line arguments
+    :return: exit code
+    """
+    options = _parser().parse_args(argv)
+    modules = parsed_modules(corpus_sources(options))
+    current = relative_timings(benchmark_targets(plugin_options()), modules, options.warmup, options.repeat)
+    for name, result in current.items():
+        sys.stdout.write('{0:<28} median {1:8.3f} iqr {2:7.3f}\n'.format(name, result['median'], result['iqr']))
+    if options.update:
+        options.baseline.write_text('{0}\n'.format(json.dumps(
+            allowed_slowdowns(current, options.threshold), indent=2, sort_keys=True,
+        )))
+        return 0
+    found = regressions(json.loads(options.baseline.read_text()), current, options.threshold)
+    for line in found:
+        sys.stdout.write('REGRESSION {0}\n'.format(line))
+    return int(bool(found))
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = harness_parser()
+    parser.description = __doc__
+    parser.set_defaults(files=15, repeat=15)
+    parser.add_argument('--warmup', type=int, default=2, help='not measured runs of each target (default: %(default)s)')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=10,
+        help=(
+            'allowed slowdown in percents, the least one for targets on --update '
+            'and the one for targets without own in baseline (default: %(default)s)'
+        ),
+    )
+    parser.add_argument('--baseline', type=Path, default=_BASELINE, help='baseline file (default: %(default)s)')
+    parser.add_argument('--update', action='store_true', help='write current timings to baseline file')
+    return parser
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,189 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Benchmark of Plugin.run and of each rule, run with ``python -m benchmarks.harness``."""
+
+import argparse
+import ast
+import json
+import sys
+import time
+from collections.abc import Callable, Sequence
+
+from benchmarks.corpus import ModuleShape, fixture_corpus, synthetic_corpus
+from pyeo.config import Config
+from pyeo.utils.class_info import ClassInfo, class_info
+from pyeo.utils.definitions import definitions
+from pyeo.main import Plugin
+from pyeo.rules import ALL_CODES, compiled_config
+from pyeo.visitor_protocol import VisitorWithProblems
+
+
+def plugin_options(available_er_names: Sequence[str] = ()) -> argparse.Namespace:
+    """Options of plugin without cache and profiling.
+
+    :param available_er_names: whitelist of "er" names
+    :return: argparse.Namespace
+    """
+    return argparse.Namespace(
+        select=None,
+        extend_select=None,
+        ignore=None,
+        extend_ignore=None,
+        extended_default_select=['PEO'],
+        extended_default_ignore=[],
+        available_er_names=list(available_er_names),
+        pyeo_cache_dir='',
+        pyeo_cache_size=0,
+        pyeo_profile='',
+        pyeo_max_violations=0,
+        pyeo_baseline='',
+        pyeo_diff_against='',
+    )
+
+
+def benchmark_targets(options: argparse.Namespace) -> dict[str, Callable[[ast.AST, list[str]], object]]:
+    """Measured callables by name: whole plugin and each rule alone.
+
+    Each rule gets classes and functions with ClassInfo, like from ``FusedVisitor`` in plugin,
+    but they are collected once per tree before measurement, so timing of rule is its own checks only,
+    and slowdown of ``check_class`` or ``check_function`` is not hidden behind walk of tree.
+
+    :param options: plugin options
+    :return: dict[str, Callable[[ast.AST, list[str]], object]]
+    """
+    Plugin.parse_options(options)
+    targets: dict[str, Callable[[ast.AST, list[str]], object]] = {
+        'Plugin.run': lambda tree, lines: list(Plugin(tree, lines, 'module.py').run()),
+    }
+    config = compiled_config(options, ALL_CODES)
+    for rule in config.rules:
+        targets[getattr(rule, '__name__', str(rule))] = _rule_target(rule, config)
+    return targets
+
+
+def measure(
+    target: Callable[[ast.AST, list[str]], object],
+    modules: Sequence[tuple[ast.AST, list[str]]],
+    repeat: int,
+) -> list[float]:
+    """Seconds of each run of target over all modules.
+
+    :param target: measured callable
+    :param modules: parsed trees with source lines
+    :param repeat: count of runs
+    :return: list[float]
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for tree, lines in modules:
+            target(tree, lines)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def parsed_modules(sources: Sequence[str]) -> list[tuple[ast.AST, list[str]]]:
+    """Parsed trees with source lines.
+
+    :param sources: sources of modules
+    :return: list[tuple[ast.AST, list[str]]]
+    """
+    return [(ast.parse(source), source.splitlines(keepends=True)) for source in sources]
+
+
+def corpus_sources(options: argparse.Namespace) -> list[str]:
+    """Sources of synthetic modules and fixtures by command line options.
+
+    :param options: harness options
+    :return: list[str]
+    """
+    shape = ModuleShape(
+        classes=options.classes,
+        methods=options.methods,
+        ctor_size=options.ctor_size,
+        decorators=options.decorators,
+        bases=options.bases,
+        depth=options.depth,
+    )
+    sources = synthetic_corpus(shape, options.files, options.seed)
+    if not options.no_fixtures:
+        sources.extend(fixture_corpus().values())
+    return sources
+
+
+def harness_parser() -> argparse.ArgumentParser:
+    """Command line options of corpus and measurement.
+
+    :return: argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=200, help='synthetic modules (default: %(default)s)')
+    parser.add_argument('--classes', type=int, default=10, help='classes in module (default: %(default)s)')
+    parser.add_argument('--methods', type=int, default=8, help='methods in class (default: %(default)s)')
+    parser.add_argument('--ctor-size', type=int, default=4, help='statements in __init__ (default: %(default)s)')
+    parser.add_argument('--decorators', type=int, default=2, help='decorators of class (default: %(default)s)')
+    parser.add_argument('--bases', type=int, default=1, help='bases of class (default: %(default)s)')
+    parser.add_argument('--depth', type=int, default=2, help='nesting depth of classes (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed (default: %(default)s)')
+    parser.add_argument('--no-fixtures', action='store_true', help='skip real-world-shaped fixtures')
+    parser.add_argument('--repeat', type=int, default=5, help='runs of each target (default: %(default)s)')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry.
+
+    :param argv: command line arguments
+    :return: exit code
+    """
+    options = harness_parser().parse_args(argv)
+    modules = parsed_modules(corpus_sources(options))
+    nodes = sum(1 for tree, _ in modules for _ in ast.walk(tree))
+    results = {}
+    for name, target in benchmark_targets(plugin_options()).items():
+        best = min(measure(target, modules, options.repeat))
+        results[name] = {
+            'files_per_sec': len(modules) / best,
+            'us_per_node': best * 1e6 / nodes,
+        }
+    if options.json:
+        sys.stdout.write('{0}\n'.format(json.dumps(results, indent=2)))
+        return 0
+    sys.stdout.write('{0} files, {1} nodes, best of {2} runs\n'.format(len(modules), nodes, options.repeat))
+    sys.stdout.write('{0:<28} {1:>12} {2:>10}\n'.format('target', 'files/sec', 'us/node'))
+    for name, result in results.items():
+        sys.stdout.write('{0:<28} {1:>12.1f} {2:>10.4f}\n'.format(
+            name, result['files_per_sec'], result['us_per_node'],
+        ))
+    return 0
+
+
+def _rule_target(
+    rule: Callable[[Config], VisitorWithProblems],
+    config: Config,
+) -> Callable[[ast.AST, list[str]], object]:
+    dispatched: dict[int, list[tuple[ast.ClassDef | ast.FunctionDef, ClassInfo | None]]] = {}
+
+    def _target(tree: ast.AST, lines: list[str]) -> object:  # noqa: WPS430
+        nodes = dispatched.get(id(tree))
+        if nodes is None:
+            nodes = [
+                (node, class_info(node) if isinstance(node, ast.ClassDef) else None)
+                for node in definitions(tree)
+            ]
+            dispatched[id(tree)] = nodes
+        checked = rule(config)
+        for node, info in nodes:
+            if info is None:
+                if hasattr(checked, 'check_function'):
+                    checked.check_function(node)
+            elif hasattr(checked, 'check_class'):
+                checked.check_class(node, info)
+        return checked.problems
+    return _target
+
+
+if __name__ == '__main__':
+    sys.exit(main())
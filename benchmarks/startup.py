@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Import cost of plugin, run with ``python -m benchmarks.startup``.
+
+Plugin is imported by ``python -X importtime`` in fresh interpreter, after modules of flake8,
+that are already loaded, when flake8 loads plugins, so only cost of pyeo is measured.
+Gate fails, when the best run exceeds budget, or when modules of rules are imported with plugin.
+"""
+
+import argparse
+import subprocess  # noqa: S404
+import sys
+from collections.abc import Sequence
+
+_HOST = 'import flake8.main.application, flake8.checker, flake8.style_guide'
+_PLUGIN = 'pyeo.main'
+_DEFERRED = ('pyeo.features', 'pyeo.check', 'pyeo.result_cache')
+
+
+def import_times(module: str, host: str = _HOST) -> dict[str, tuple[int, int]]:
+    """Self and cumulative microseconds of module and of modules, that it imports first.
+
+    Modules, imported by host statements before, are not imported by module again, so they are not counted.
+
+    :param module: imported module
+    :param host: statements, that run before import of module
+    :return: dict[str, tuple[int, int]]
+    """
+    stderr = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-c', '{0}\nimport {1}'.format(host, module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if line.startswith('import time:') and 'self [us]' not in line:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            rows.append((int(self_us), int(cumulative_us), name[1:].rstrip()))
+    # Output is in post-order: modules, imported by module, precede it with deeper indentation.
+    end = next(number for number, row in enumerate(rows) if row[2].strip() == module and row[2] == row[2].lstrip())
+    start = end
+    while start > 0 and rows[start - 1][2].startswith(' '):
+        start -= 1
+    return {name.strip(): (self_us, cumulative_us) for self_us, cumulative_us, name in rows[start:end + 1]}
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry.
+
+    :param argv: command line arguments
+    :return: exit code
+    """
+    options = _parser().parse_args(argv)
+    runs = [import_times(_PLUGIN) for _ in range(options.repeat)]
+    best = min(times[_PLUGIN][1] for times in runs)
+    sys.stdout.write('import {0}: best {1:.1f} ms of {2} runs, budget {3:.1f} ms\n'.format(
+        _PLUGIN, best / 1000, options.repeat, options.budget,
+    ))
+    for name, (self_us, _) in sorted(runs[0].items(), key=lambda item: item[1][0], reverse=True)[:options.top]:
+        sys.stdout.write('{0:>10.2f} ms  {1}\n'.format(self_us / 1000, name))
+    failures = sorted(
+        name for name in runs[0] if any(name == prefix or name.startswith(prefix + '.') for prefix in _DEFERRED)
+    )
+    for name in failures:
+        sys.stdout.write('EAGER {0} is imported with plugin\n'.format(name))
+    if best > options.budget * 1000:
+        sys.stdout.write('REGRESSION import of {0} exceeds budget\n'.format(_PLUGIN))
+        failures.append(_PLUGIN)
+    return int(bool(failures))
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--budget',
+        type=float,
+        default=15,
+        help='allowed cumulative import time of plugin in milliseconds (default: %(default)s)',
+    )
+    parser.add_argument('--repeat', type=int, default=7, help='fresh interpreters (default: %(default)s)')
+    parser.add_argument('--top', type=int, default=10, help='printed slowest modules (default: %(default)s)')
+    return parser
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,8 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import sys
+
+from pyeo.cli import main
+
+sys.exit(main())
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Baseline of known problems, that are not reported."""
+
+import ast
+import hashlib
+import json
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+
+from pyeo.utils.definitions import scopes
+from pyeo.utils.normalized_path import normalized_path
+from pyeo.violations import Record, record_code
+
+_VERSION = 1
+
+
+def fingerprint_of(tree: ast.AST, lines: Sequence[str], filename: str) -> Callable[[Record], str]:
+    """Fingerprint of problem, that survives line shifts.
+
+    Fingerprint consists of file path, code of problem, qualified name of enclosing class or function
+    and hash of problem line without whitespace.
+
+    :param tree: parsed module
+    :param lines: lines of module
+    :param filename: path to module
+    :return: function of record
+    """
+    path = normalized_path(filename)
+    owners = [''] * (len(lines) + 2)
+    for qualname, node in scopes(tree):
+        end = min(node.end_lineno or node.lineno, len(owners) - 1)
+        owners[node.lineno:end + 1] = [qualname] * (end + 1 - node.lineno)
+
+    def _fingerprint(record: Record) -> str:  # noqa: WPS430
+        line = record[0]
+        snippet = ''.join(lines[line - 1].split()) if 0 < line <= len(lines) else ''
+        return '{0}:{1}:{2}:{3}'.format(
+            path,
+            record_code(record),
+            owners[line] if line < len(owners) else '',
+            hashlib.blake2b(snippet.encode('utf-8', 'surrogatepass'), digest_size=8).hexdigest(),
+        )
+    return _fingerprint
+
+
+def load_baseline(path: Path) -> frozenset[str]:
+    """Fingerprints from baseline file.
+
+    :param path: baseline file
+    :return: frozenset[str]
+    :raises ValueError: file is not baseline of supported version
+    """
+    try:
+        document = json.loads(path.read_bytes())
+    except ValueError as err:
+        raise ValueError('{0}: baseline is not valid JSON: {1}'.format(path, err)) from err
+    version = document.get('version') if isinstance(document, dict) else None
+    if version != _VERSION:
+        raise ValueError('{0}: unsupported baseline version {1!r}'.format(path, version))
+    fingerprints = document.get('fingerprints')
+    if not isinstance(fingerprints, list):
+        raise ValueError('{0}: baseline has no list of fingerprints'.format(path))
+    return frozenset(fingerprints)
+
+
+def save_baseline(path: Path, fingerprints: Iterable[str]) -> None:
+    """Write baseline file, sorted for readable diffs.
+
+    :param path: baseline file
+    :param fingerprints: fingerprints of known problems
+    """
+    path.write_text(json.dumps(
+        {'version': _VERSION, 'fingerprints': sorted(set(fingerprints))},
+        indent=1,
+    ) + '\n')
@@ -0,0 +1,304 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Checks of trees, sources and files without flake8."""
+
+import ast
+import contextlib
+import importlib.util
+import itertools
+import mmap
+import os
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+from pyeo.baseline import fingerprint_of
+from pyeo.class_results import ClassResults
+from pyeo.class_rule_protocol import ClassRule
+from pyeo.config import Config
+from pyeo.function_rule_protocol import FunctionRule
+from pyeo.fused_visitor import FusedVisitor
+from pyeo.git_diff import touched_by
+from pyeo.profiled_class_rule import ProfiledClassRule
+from pyeo.profiled_function_rule import ProfiledFunctionRule
+from pyeo.rule_profile import RuleProfile, rule_profile
+from pyeo.utils.node_positions import indexed, positioned, positioned_nodes, structure_key
+from pyeo.utils.normalized_path import normalized_path
+from pyeo.utils.source_lines import source_lines
+from pyeo.violations import Record, Violations, code_ids
+from pyeo.visitor_protocol import VisitorWithProblems
+
+if TYPE_CHECKING:
+    from pyeo.result_cache import ResultCache
+
+_STRUCTURE = b'\0structure\0'
+_MAPPED_SIZE = 256 * 1024
+
+
+def tree_problems(
+    tree: ast.AST,
+    lines: Sequence[str],
+    filename: str,
+    config: Config,
+    classes: ClassResults | None = None,
+) -> Violations:
+    """Problems with enabled codes, at most ``config.max_violations`` of them.
+
+    :param tree: parsed module
+    :param lines: lines of module
+    :param filename: path to module
+    :param config: compiled options
+    :param classes: stored problems of classes, checked with the same config, None to check all classes
+    :return: Violations
+    """
+    return Violations(itertools.islice(
+        streamed_problems(tree, lines, filename, config, classes),
+        config.max_violations or None,
+    ))
+
+
+def streamed_problems(
+    tree: ast.AST,
+    lines: Sequence[str],
+    filename: str,
+    config: Config,
+    classes: ClassResults | None = None,
+) -> Iterator[Record]:
+    """Unformatted problems with enabled codes in order of traversal.
+
+    Rules without enabled codes are not created and don't take part in traversal.
+    Traversal goes on only while caller takes problems.
+    Problems with fingerprints from baseline are skipped.
+    In diff mode unchanged files are not checked, and only problems of changed classes and functions are kept.
+    Problems of top-level classes are taken from ``classes``, when class with the same structure was checked.
+
+    :param tree: parsed module
+    :param lines: lines of module
+    :param filename: path to module
+    :param config: compiled options
+    :param classes: stored problems of classes, checked with the same config, None to check all classes
+    :yield: problem
+    """
+    ranges = None
+    if config.changed is not None:
+        ranges = config.changed.get(normalized_path(filename))
+        if not ranges:
+            return
+    if not config.rules:
+        return
+    if classes is None or config.profile:
+        records = _rule_records(tree, config)
+    else:
+        records = classes.records(tree, lambda node: _rule_records(node, config))
+    if ranges:
+        records = filter(touched_by(tree, ranges), records)
+    if config.baseline:
+        fingerprint = fingerprint_of(tree, lines, filename)
+        records = (record for record in records if fingerprint(record) not in config.baseline)
+    yield from records
+
+
+def _rule_records(tree: ast.AST, config: Config) -> Iterator[Record]:
+    rules = [rule(config) for rule in config.rules]
+    if config.profile:
+        rules = _profiled(rules, rule_profile(config.profile))
+    enabled = code_ids(config.codes)
+    return (record for record in FusedVisitor(rules).problems(tree) if record[2] in enabled)
+
+
+def _profiled(rules: list[VisitorWithProblems], profile: RuleProfile) -> list[VisitorWithProblems]:
+    profiled: list[VisitorWithProblems] = []
+    for rule in rules:
+        if hasattr(rule, 'check_class'):
+            profiled.append(ProfiledClassRule(cast(ClassRule, rule), profile))
+        if hasattr(rule, 'check_function'):
+            profiled.append(ProfiledFunctionRule(cast(FunctionRule, rule), profile))
+    profile.add_file()
+    return profiled
+
+
+def source_problems(
+    source: bytes,
+    filename: str,
+    config: Config,
+    tree: ast.AST | None = None,
+    classes: ClassResults | None = None,
+) -> Violations:
+    """Problems of module source, sorted by position.
+
+    Syntax error and code, that is too deeply nested for parser, are reported as E999 problem, like flake8 does.
+
+    :param source: module source
+    :param filename: name of file for error messages
+    :param config: compiled options
+    :param tree: parsed source, None to parse it
+    :param classes: stored problems of classes, checked with the same config, None to check all classes
+    :return: Violations
+    """
+    try:
+        tree = tree or ast.parse(source, filename)
+    except (SyntaxError, ValueError, RecursionError, MemoryError) as err:
+        problems = Violations()
+        problems.add(
+            getattr(err, 'lineno', None) or 1,
+            max((getattr(err, 'offset', None) or 1) - 1, 0),
+            'E999',
+            '{0}: {1}'.format(type(err).__name__, getattr(err, 'msg', None) or err),
+        )
+        return problems
+    return tree_problems(tree, source_lines(importlib.util.decode_source(source)), filename, config, classes).sorted()
+
+
+def file_problems(
+    path: Path,
+    config: Config,
+    cache: 'ResultCache | None',
+    source: bytes | None = None,
+    classes: ClassResults | None = None,
+) -> Violations:
+    """Problems of python file, sorted by position.
+
+    Cached files are not parsed at all, reformatted files are parsed, but not checked.
+    With parse cache, skeletons of files are checked, see ``ResultCache.tree``.
+    Files without bytes, that problems of enabled rules need, e.g. ``class`` keyword,
+    are neither parsed nor hashed, see ``Config.prefilter``.
+    Long-running callers, e.g. daemon, pass ``classes``, so only changed top-level classes are checked.
+    File, that can not be read, is reported as E902 problem, like flake8 does.
+
+    :param path: path to file
+    :param config: compiled options
+    :param cache: result cache, None if caching is disabled
+    :param source: content of file, e.g. staged blob, None to read file from disk
+    :param classes: stored problems of classes, checked with the same config, None to check all classes
+    :return: Violations
+    """
+    if source is None:
+        try:
+            source = _candidate_source(path, config)
+        except OSError as err:
+            problems = Violations()
+            problems.add(0, 0, 'E902', '{0}: {1}'.format(type(err).__name__, err))
+            return problems
+    elif config.prefilter.search(source) is None:
+        source = None
+    if source is None:
+        return Violations()
+    return cached_problems(
+        cache_key(source, str(path), config),
+        cache,
+        lambda tree: source_problems(cast(bytes, source), str(path), config, tree, classes),
+        config.max_violations,
+        lambda: _parsed(cast(bytes, source), str(path), cast('ResultCache', cache)),
+        not config.baseline,
+    )
+
+
+def file_fingerprints(path: Path, config: Config) -> list[str]:
+    """Fingerprints of all problems of python file, see ``fingerprint_of``.
+
+    Files, that can not be read or parsed, have no fingerprints.
+
+    :param path: path to file
+    :param config: compiled options
+    :return: list[str]
+    """
+    try:
+        source = _candidate_source(path, config)
+    except OSError:
+        return []
+    if source is None:
+        return []
+    try:
+        tree = ast.parse(source, str(path))
+    except (SyntaxError, ValueError, RecursionError, MemoryError):
+        return []
+    lines = source_lines(importlib.util.decode_source(source))
+    return list(map(fingerprint_of(tree, lines, str(path)), streamed_problems(tree, lines, str(path), config)))
+
+
+def _candidate_source(path: Path, config: Config) -> bytes | None:
+    with path.open('rb') as module:
+        if os.fstat(module.fileno()).st_size < _MAPPED_SIZE:
+            source = module.read()
+            return None if config.prefilter.search(source) is None else source
+        with mmap.mmap(module.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return None if config.prefilter.search(mapped) is None else mapped[:]
+
+
+def cache_key(source: bytes, filename: str, config: Config) -> bytes:
+    """Key of source in result cache.
+
+    Baseline fingerprints contain file path, so with baseline the same source
+    in other file may have other problems.
+
+    :param source: module source
+    :param filename: path to module
+    :param config: compiled options
+    :return: bytes
+    """
+    if not config.baseline:
+        return source
+    return filename.encode('utf-8', 'surrogateescape') + b'\0' + source
+
+
+def cached_problems(
+    source: bytes,
+    cache: 'ResultCache | None',
+    problems: Callable[[ast.AST | None], Violations],
+    limit: int = 0,
+    tree: Callable[[], ast.AST | None] | None = None,
+    structural: bool = True,
+) -> Violations:
+    """Cached problems of source, computed and saved on cache miss.
+
+    When source is missed, problems are also looked up by structure of its tree
+    without positions, see ``structure_key``, so reformatted source is not checked again.
+    Such entries keep indexes of nodes, and positions are taken from the new tree.
+    Computation, that reached the limit, may be cut, so it is not saved.
+
+    :param source: module source or other cache key, see ``cache_key``
+    :param cache: result cache, None if caching is disabled
+    :param problems: computation of problems of parsed source on cache miss, at most ``limit`` of them
+    :param limit: max count of problems, 0 is unlimited
+    :param tree: parsed source, None on syntax error
+    :param structural: look up problems by structure, False when problems depend on text of lines
+    :return: Violations
+    """
+    if cache is None:
+        return problems(None)
+    cached = cache.problems(source)
+    if cached is not None:
+        return _limited(cached, limit)
+    parsed = None if tree is None else tree()
+    structure = b''
+    if parsed is not None and structural:
+        structure = _STRUCTURE + structure_key(parsed)
+        stored = cache.problems(structure)
+        if stored is not None:
+            with contextlib.suppress(IndexError):
+                cached = Violations(positioned(positioned_nodes(parsed), stored)).sorted()
+                cache.save(source, cached)
+                return _limited(cached, limit)
+    cached = problems(parsed)
+    if not limit or len(cached) < limit:
+        cache.save(source, cached)
+        stored = indexed(positioned_nodes(parsed), cached.records()) if parsed is not None and structure else None
+        if stored is not None:
+            cache.save(structure, stored)
+    return cached
+
+
+def _limited(problems: Violations, limit: int) -> Violations:
+    return Violations(itertools.islice(problems.records(), limit)) if limit else problems
+
+
+def _parsed(source: bytes, filename: str, cache: 'ResultCache') -> ast.AST | None:
+    tree = cache.tree(source)
+    if tree is not None:
+        return tree
+    try:
+        tree = ast.parse(source, filename)
+    except (SyntaxError, ValueError, RecursionError, MemoryError):
+        return None
+    return cache.save_tree(source, tree)
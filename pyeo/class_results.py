@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""ClassResults."""
+
+import ast
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from typing import final
+
+from pyeo.utils.node_positions import indexed, positioned, positioned_nodes, structure_key
+from pyeo.violations import Record, Violations
+
+
+@final
+class ClassResults:
+    """Problems of top-level classes, keyed by structure of class without positions.
+
+    Rules look inside one class at a time, so problems of class depend only on its structure.
+    Problems are stored with index of node instead of position, and positions
+    are taken from the same node of new tree, so moved or reformatted class is not checked again.
+    Results depend on rules, so one instance serves one config.
+    """
+
+    def __init__(self, size: int = 4096) -> None:
+        """Ctor.
+
+        :param size: max count of stored classes, least recently used are dropped
+        """
+        self._size = size
+        self._results: OrderedDict[bytes, Violations] = OrderedDict()
+
+    def records(self, tree: ast.AST, checked: Callable[[ast.AST], Iterable[Record]]) -> Iterator[Record]:
+        """Problems of module in order of traversal, only new classes and other statements are checked.
+
+        :param tree: parsed module
+        :param checked: problems of statement
+        :yield: problem
+        """
+        for stmt in getattr(tree, 'body', ()):
+            if isinstance(stmt, ast.ClassDef):
+                yield from self._class_records(stmt, checked)
+            else:
+                yield from checked(stmt)
+
+    def _class_records(self, node: ast.ClassDef, checked: Callable[[ast.AST], Iterable[Record]]) -> list[Record]:
+        key = structure_key(node)
+        nodes = positioned_nodes(node)
+        stored = self._results.get(key)
+        if stored is not None:
+            self._results.move_to_end(key)
+            return list(positioned(nodes, stored))
+        records = list(checked(node))
+        stored = indexed(nodes, records)
+        if stored is not None:
+            self._results[key] = stored
+            if len(self._results) > self._size:
+                self._results.popitem(last=False)
+        return records
@@ -0,0 +1,19 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Protocol for rules, that check classes."""
+
+import ast
+from typing import Protocol
+
+from pyeo.utils.class_info import ClassInfo
+from pyeo.violations import Record
+
+
+class ClassRule(Protocol):
+    """Protocol for rules, that check classes."""
+
+    problems: list[Record]
+
+    def check_class(self, node: ast.ClassDef, info: ClassInfo) -> None:
+        """Check class without visiting nested nodes."""
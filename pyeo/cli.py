@@ -0,0 +1,473 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Standalone command line interface, that checks files without flake8.
+
+Commands import checks, caches and servers, that they use, when they run,
+so thin commands like ``pyeo daemon check`` start fast.
+"""
+
+import argparse
+import contextlib
+import itertools
+import os
+import sys
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar, cast
+
+from pyeo.daemon import request, serve
+
+if TYPE_CHECKING:
+    from pyeo.class_results import ClassResults
+    from pyeo.config import Config
+    from pyeo.result_cache import ResultCache
+    from pyeo.violations import Violations
+
+_DEFAULT_EXCLUDE = ('.svn', 'CVS', '.bzr', '.hg', '.git', '__pycache__', '.tox', '.nox', '.eggs', '*.egg')
+# Options and cache of pool worker, set by _init_worker.
+_worker_config: 'Config | None' = None
+_worker_cache: 'ResultCache | None' = None
+_File = TypeVar('_File')
+_Result = TypeVar('_Result')
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry.
+
+    :param argv: command line arguments
+    :return: exit code
+    """
+    options = _parser().parse_args(argv)
+    return options.command(options)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='pyeo', description='Elegant Objects checks for python code.')
+    subparsers = parser.add_subparsers(required=True, metavar='COMMAND')
+    rules = _rules_parser()
+    files = _files_parser(rules)
+    caches = _cache_parser()
+    check = subparsers.add_parser('check', parents=[files, caches], help='check python files')
+    check.add_argument('--no-cache', action='store_true', help='do not read and write result cache')
+    check.add_argument(
+        '--parse-cache',
+        action='store_true',
+        help='keep skeletons of parsed files in result cache, so that files are not parsed after change of options',
+    )
+    check.add_argument(
+        '--profile',
+        dest='pyeo_profile',
+        default=os.environ.get('PYEO_PROFILE', ''),
+        help='write timings and counters of rules to JSON file (default: $PYEO_PROFILE or disabled)',
+    )
+    check.add_argument(
+        '--max-violations',
+        dest='pyeo_max_violations',
+        type=int,
+        default=0,
+        help='stop after this count of problems in a file and in all files (default: 0, unlimited)',
+    )
+    check.add_argument(
+        '--baseline',
+        dest='pyeo_baseline',
+        default='',
+        help='do not report problems, recorded by "pyeo baseline create" to this file (default: disabled)',
+    )
+    changes = check.add_mutually_exclusive_group()
+    changes.add_argument(
+        '--staged',
+        action='store_true',
+        help='check staged content of python files from git index instead of working tree, e.g. in pre-commit hook',
+    )
+    changes.add_argument(
+        '--diff-against',
+        dest='pyeo_diff_against',
+        default='',
+        metavar='REVISION',
+        help='check only files, changed since git revision, and report problems only in changed classes and functions',
+    )
+    check.set_defaults(command=_check)
+    baseline = subparsers.add_parser('baseline', help='manage baseline of known problems')
+    baseline_commands = baseline.add_subparsers(required=True, metavar='COMMAND')
+    create = baseline_commands.add_parser(
+        'create',
+        parents=[files],
+        help='record current problems, so that they are not reported',
+    )
+    create.add_argument(
+        '-o',
+        '--output',
+        type=Path,
+        default=Path('.pyeo_baseline.json'),
+        help='baseline file (default: .pyeo_baseline.json)',
+    )
+    create.set_defaults(
+        command=_create_baseline,
+        pyeo_profile='',
+        pyeo_max_violations=0,
+        pyeo_baseline='',
+        pyeo_diff_against='',
+    )
+    _add_cache_parsers(subparsers, caches)
+    _add_daemon_parsers(subparsers, files)
+    lsp = subparsers.add_parser('lsp', parents=[rules], help='run language server on stdin and stdout')
+    lsp.set_defaults(
+        command=_lsp,
+        pyeo_profile='',
+        pyeo_max_violations=0,
+        pyeo_baseline='',
+        pyeo_diff_against='',
+    )
+    return parser
+
+
+def _add_cache_parsers(subparsers: argparse._SubParsersAction, caches: argparse.ArgumentParser) -> None:
+    cache = subparsers.add_parser('cache', help='move result cache between machines, e.g. CI runners')
+    cache_commands = cache.add_subparsers(required=True, metavar='COMMAND')
+    export = cache_commands.add_parser('export', parents=[caches], help='write all cached results to one archive')
+    export.add_argument('archive', type=Path, metavar='ARCHIVE')
+    export.set_defaults(command=_export_cache)
+    restore = cache_commands.add_parser(
+        'import',
+        parents=[caches],
+        help='add results from archive, made by "pyeo cache export", to result cache',
+    )
+    restore.add_argument('archive', type=Path, metavar='ARCHIVE')
+    restore.set_defaults(command=_import_cache)
+
+
+def _cache_parser() -> argparse.ArgumentParser:
+    caches = argparse.ArgumentParser(add_help=False)
+    caches.add_argument(
+        '--cache-dir',
+        type=Path,
+        default=Path('.pyeo_cache'),
+        help='directory of result cache (default: .pyeo_cache)',
+    )
+    caches.add_argument(
+        '--cache-size',
+        type=int,
+        default=256,
+        help='size limit of result cache in megabytes (default: 256)',
+    )
+    return caches
+
+
+def _add_daemon_parsers(subparsers: argparse._SubParsersAction, files: argparse.ArgumentParser) -> None:
+    sockets = argparse.ArgumentParser(add_help=False)
+    sockets.add_argument(
+        '--socket',
+        type=Path,
+        default=Path('.pyeo.sock'),
+        help='unix socket of daemon (default: .pyeo.sock)',
+    )
+    daemon = subparsers.add_parser('daemon', help='keep problems in memory and answer checks over unix socket')
+    daemon_commands = daemon.add_subparsers(required=True, metavar='COMMAND')
+    start = daemon_commands.add_parser(
+        'start',
+        parents=[files, sockets],
+        help='check files, watch them for changes and answer requests in foreground',
+    )
+    start.add_argument(
+        '--interval',
+        type=float,
+        default=1.0,
+        help='seconds between polls of modification times (default: 1.0)',
+    )
+    start.set_defaults(
+        command=_start_daemon,
+        pyeo_profile='',
+        pyeo_max_violations=0,
+        pyeo_baseline='',
+        pyeo_diff_against='',
+    )
+    daemon_check = daemon_commands.add_parser('check', parents=[sockets], help='get problems from running daemon')
+    daemon_check.add_argument('paths', nargs='*', default=[Path('.')], type=Path, metavar='PATH')
+    daemon_check.set_defaults(command=_daemon_check)
+    stop = daemon_commands.add_parser('stop', parents=[sockets], help='stop running daemon')
+    stop.set_defaults(command=_stop_daemon)
+
+
+def _files_parser(rules: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    files = argparse.ArgumentParser(add_help=False, parents=[rules])
+    files.add_argument('paths', nargs='*', default=[Path('.')], type=Path, metavar='PATH')
+    files.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='number of worker processes (default: number of CPUs)',
+    )
+    files.add_argument(
+        '--exclude',
+        type=_comma_separated,
+        default=list(_DEFAULT_EXCLUDE),
+        help='comma-separated list of excluded names and glob patterns',
+    )
+    return files
+
+
+def _rules_parser() -> argparse.ArgumentParser:
+    rules = argparse.ArgumentParser(add_help=False)
+    rules.add_argument(
+        '--available-er-names',
+        type=_comma_separated,
+        default=[],
+        help='Available "er" names, suffixes or glob patterns like "*Serializer"',
+    )
+    rules.add_argument(
+        '--select',
+        type=_comma_separated,
+        default=['PEO'],
+        help='comma-separated list of selected code prefixes (default: PEO)',
+    )
+    rules.add_argument(
+        '--ignore',
+        type=_comma_separated,
+        default=[],
+        help='comma-separated list of ignored code prefixes, rules without selected codes are not run',
+    )
+    return rules
+
+
+def _comma_separated(value: str) -> list[str]:
+    return [elem.strip() for elem in value.split(',') if elem.strip()]
+
+
+def _check(options: argparse.Namespace) -> int:
+    from pyeo.result_cache import ResultCache, cache_salt  # noqa: WPS433
+    from pyeo.rule_profile import rule_profile  # noqa: WPS433
+    if options.pyeo_profile:
+        rule_profile(options.pyeo_profile)
+    try:
+        config = _config(options)
+    except (OSError, ValueError) as err:
+        sys.stderr.write('can not load baseline: {0}\n'.format(err))
+        return 2
+    except RuntimeError as err:
+        sys.stderr.write('can not find changed lines: {0}\n'.format(err))
+        return 2
+    staged = None
+    if options.staged:
+        try:
+            staged = _staged_files(options)
+        except RuntimeError as err:
+            sys.stderr.write('can not read staged files: {0}\n'.format(err))
+            return 2
+    cache = None
+    if not options.no_cache and config.changed is None:
+        cache = ResultCache(
+            options.cache_dir,
+            options.cache_size * 1024 * 1024,
+            cache_salt(config),
+            skeletons=options.parse_cache,
+        )
+    found = False
+    with contextlib.closing(_checked_sources(options, config, cache, staged)) as checked:
+        reports = ((path, problem) for path, problems in checked for problem in problems)
+        for path, (line, col, message) in itertools.islice(reports, config.max_violations or None):
+            found = True
+            sys.stdout.write('{0}:{1}:{2}: {3}\n'.format(path, line, col + 1, message))
+    if cache is not None:
+        cache.evict()
+    return int(found)
+
+
+def _staged_files(options: argparse.Namespace) -> list[tuple[Path, bytes]]:
+    from pyeo.git_diff import staged_sources  # noqa: WPS433
+    from pyeo.python_files import excluded  # noqa: WPS433
+    return [
+        (Path(path), source)
+        for path, source in staged_sources([str(path) for path in options.paths])
+        if not any(excluded(part, options.exclude) for part in Path(path).parts)
+    ]
+
+
+def _checked_sources(
+    options: argparse.Namespace,
+    config: 'Config',
+    cache: 'ResultCache | None',
+    staged: list[tuple[Path, bytes]] | None,
+) -> Iterator[tuple[Path, 'Violations']]:
+    from pyeo.python_files import python_files  # noqa: WPS433
+    from pyeo.utils.normalized_path import normalized_path  # noqa: WPS433
+    if staged is not None:
+        checked = _checked_files(staged, options.jobs, config, cache, _worker_staged_problems)
+        with contextlib.closing(checked):
+            yield from ((path, problems) for (path, _), problems in checked)
+        return
+    paths = list(python_files(options.paths, options.exclude))
+    if config.changed is not None:
+        paths = [path for path in paths if normalized_path(str(path)) in config.changed]
+    yield from _checked_files(paths, options.jobs, config, cache, _worker_problems)
+
+
+def _start_daemon(options: argparse.Namespace) -> int:
+    from pyeo.class_results import ClassResults  # noqa: WPS433
+    from pyeo.watched_files import WatchedFiles  # noqa: WPS433
+    config = _config(options)
+    classes = ClassResults()
+    try:
+        serve(
+            options.socket,
+            WatchedFiles(
+                options.paths,
+                options.exclude,
+                lambda paths: _daemon_checked(paths, options.jobs, config, classes),
+            ),
+            options.interval,
+        )
+    except RuntimeError as err:
+        sys.stderr.write('can not start pyeo daemon: {0}\n'.format(err))
+        return 2
+    return 0
+
+
+def _daemon_checked(
+    paths: list[Path],
+    jobs: int,
+    config: 'Config',
+    classes: 'ClassResults',
+) -> Iterator[tuple[Path, 'Violations']]:
+    """Problems of changed files of daemon.
+
+    Many files, e.g. on start, are checked by worker processes.
+    Files, that are changed by edit, are checked in daemon process, where ``classes`` outlive checks,
+    so only changed top-level classes of module are checked again.
+
+    :param paths: changed files
+    :param jobs: count of worker processes
+    :param config: compiled options
+    :param classes: stored problems of classes, checked in daemon process
+    :return: iterator of files with their problems
+    """
+    if jobs > 1 and len(paths) >= jobs:
+        return _checked_files(paths, jobs, config, None, _worker_problems)
+    from pyeo.check import file_problems  # noqa: WPS433
+    return ((path, file_problems(path, config, None, classes=classes)) for path in paths)
+
+
+def _daemon_check(options: argparse.Namespace) -> int:
+    try:
+        response = request(options.socket, {
+            'command': 'check',
+            'paths': [str(path.absolute()) for path in options.paths],
+            'cwd': os.getcwd(),
+        })
+    except OSError as err:
+        sys.stderr.write('pyeo daemon is not available on {0}: {1}\n'.format(options.socket, err))
+        return 2
+    for path, line, col, message in response['problems']:
+        sys.stdout.write('{0}:{1}:{2}: {3}\n'.format(path, line, col + 1, message))
+    return int(bool(response['problems']))
+
+
+def _stop_daemon(options: argparse.Namespace) -> int:
+    try:
+        request(options.socket, {'command': 'stop'})
+    except OSError as err:
+        sys.stderr.write('pyeo daemon is not available on {0}: {1}\n'.format(options.socket, err))
+        return 2
+    return 0
+
+
+def _export_cache(options: argparse.Namespace) -> int:
+    from pyeo.packed_store import PackedStore  # noqa: WPS433
+    try:
+        count = PackedStore(options.cache_dir).export_archive(options.archive)
+    except OSError as err:
+        sys.stderr.write('can not export result cache: {0}\n'.format(err))
+        return 2
+    sys.stdout.write('{0}: {1} results exported\n'.format(options.archive, count))
+    return 0
+
+
+def _import_cache(options: argparse.Namespace) -> int:
+    from pyeo.packed_store import PackedStore  # noqa: WPS433
+    store = PackedStore(options.cache_dir)
+    try:
+        count = store.import_archive(options.archive)
+    except (OSError, ValueError) as err:
+        sys.stderr.write('can not import result cache: {0}\n'.format(err))
+        return 2
+    store.evict(options.cache_size * 1024 * 1024)
+    sys.stdout.write('{0}: {1} results imported\n'.format(options.archive, count))
+    return 0
+
+
+def _lsp(options: argparse.Namespace) -> int:
+    from pyeo.lsp_session import LspSession  # noqa: WPS433
+    return LspSession(_config(options), sys.stdin.buffer, sys.stdout.buffer).serve()
+
+
+def _create_baseline(options: argparse.Namespace) -> int:
+    from pyeo.baseline import save_baseline  # noqa: WPS433
+    from pyeo.python_files import python_files  # noqa: WPS433
+    config = _config(options)
+    paths = list(python_files(options.paths, options.exclude))
+    fingerprints = [
+        fingerprint
+        for _, file_fingerprints in _checked_files(paths, options.jobs, config, None, _worker_fingerprints)
+        for fingerprint in file_fingerprints
+    ]
+    save_baseline(options.output, fingerprints)
+    sys.stdout.write('{0}: {1} problems recorded\n'.format(options.output, len(fingerprints)))
+    return 0
+
+
+def _config(options: argparse.Namespace) -> 'Config':
+    from pyeo.rules import compiled_config, selected_codes  # noqa: WPS433
+    return compiled_config(options, selected_codes(options.select, options.ignore))
+
+
+def _init_worker(config: 'Config', cache: 'ResultCache | None') -> None:
+    global _worker_config, _worker_cache  # noqa: WPS420
+    _worker_config = config
+    _worker_cache = cache
+
+
+def _worker_problems(path: Path) -> 'Violations':
+    from pyeo.check import file_problems  # noqa: WPS433
+    return file_problems(path, cast('Config', _worker_config), _worker_cache)
+
+
+def _worker_staged_problems(staged: tuple[Path, bytes]) -> 'Violations':
+    from pyeo.check import file_problems  # noqa: WPS433
+    return file_problems(staged[0], cast('Config', _worker_config), _worker_cache, staged[1])
+
+
+def _worker_fingerprints(path: Path) -> list[str]:
+    from pyeo.check import file_fingerprints  # noqa: WPS433
+    return file_fingerprints(path, cast('Config', _worker_config))
+
+
+def _checked_files(
+    files: list[_File],
+    jobs: int,
+    config: 'Config',
+    cache: 'ResultCache | None',
+    task: Callable[[_File], _Result],
+) -> Iterator[tuple[_File, _Result]]:
+    """Results of task for each file in order of files.
+
+    Workers receive paths or staged sources and return compact results,
+    so trees and message texts never cross process boundary.
+
+    :param files: python files, paths or pairs of path and source
+    :param jobs: count of worker processes
+    :param config: compiled options
+    :param cache: result cache, None if caching is disabled
+    :param task: module level function of file, that uses worker's config and cache
+    :yield: file with its result
+    """
+    jobs = min(jobs, len(files))
+    if jobs <= 1:
+        _init_worker(config, cache)
+        yield from ((file, task(file)) for file in files)
+        return
+    import multiprocessing  # noqa: WPS433
+    with multiprocessing.Pool(jobs, initializer=_init_worker, initargs=(config, cache)) as pool:
+        yield from zip(files, pool.imap(task, files, chunksize=max(len(files) // (jobs * 4), 1)))
+        pool.close()
+        pool.join()
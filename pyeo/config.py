@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Config."""
+
+import dataclasses
+import re
+from collections.abc import Callable
+from typing import final
+
+from pyeo.utils.er_names import ErNames
+from pyeo.visitor_protocol import VisitorWithProblems
+
+
+@final
+@dataclasses.dataclass(frozen=True)
+class Config:
+    """Options, compiled once per process.
+
+    Config is immutable and picklable, so flake8 and ``pyeo check`` workers share it
+    and files are checked without any setup of options.
+    Source can have problems of enabled rules, only when ``prefilter`` finds something in its bytes.
+    """
+
+    codes: frozenset[str]
+    rules: tuple[Callable[['Config'], VisitorWithProblems], ...]
+    er_whitelist: frozenset[str]
+    profile: str
+    max_violations: int
+    baseline: frozenset[str]
+    changed: dict[str, tuple[tuple[int, int], ...]] | None
+    prefilter: re.Pattern[bytes]
+    er_names: ErNames = dataclasses.field(compare=False)
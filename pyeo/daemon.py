@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Daemon, that answers check requests over unix socket.
+
+Request and response are single lines of JSON. Requests are:
+``{"command": "check", "paths": [...], "cwd": "..."}`` with absolute paths
+and ``{"command": "stop"}``.
+"""
+
+import contextlib
+import json
+import os
+import socket
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pyeo.watched_files import WatchedFiles
+
+_CONNECTION_TIMEOUT = 10.0
+
+
+def serve(socket_path: Path, files: 'WatchedFiles', interval: float) -> None:
+    """Check files and answer requests until stop request.
+
+    Files are polled for changes while daemon waits for requests and before each check request.
+
+    :param socket_path: path of unix socket
+    :param files: watched files
+    :param interval: seconds between polls
+    :raises RuntimeError: other daemon listens on socket
+    """
+    with contextlib.suppress(OSError):
+        request(socket_path, {'command': 'ping'})
+        raise RuntimeError('pyeo daemon already listens on {0}'.format(socket_path))
+    with contextlib.suppress(FileNotFoundError):
+        socket_path.unlink()
+    files.refresh()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(socket_path))
+        server.listen()
+        server.settimeout(interval)
+        try:
+            _accept_requests(server, files)
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                socket_path.unlink()
+
+
+def request(socket_path: Path, message: dict[str, Any]) -> dict[str, Any]:
+    """Send request to daemon and wait for response.
+
+    :param socket_path: path of unix socket
+    :param message: request
+    :return: response
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(_CONNECTION_TIMEOUT)
+        client.connect(str(socket_path))
+        client.sendall(json.dumps(message).encode() + b'\n')
+        with client.makefile('rb') as stream:
+            return json.loads(stream.readline())
+
+
+def _accept_requests(server: socket.socket, files: 'WatchedFiles') -> None:
+    while True:
+        try:
+            connection, _ = server.accept()
+        except TimeoutError:
+            files.refresh()
+            continue
+        stop = False
+        with connection, contextlib.suppress(OSError, ValueError, KeyError, TypeError):
+            connection.settimeout(_CONNECTION_TIMEOUT)
+            with connection.makefile('rb') as stream:
+                message = json.loads(stream.readline())
+            stop = message['command'] == 'stop'
+            connection.sendall(json.dumps(_response(message, files)).encode() + b'\n')
+        if stop:
+            return
+
+
+def _response(message: dict[str, Any], files: 'WatchedFiles') -> dict[str, Any]:
+    command = message['command']
+    if command == 'check':
+        files.refresh()
+        cwd = message['cwd']
+        return {'problems': [
+            [os.path.relpath(path, cwd), line, col, text]
+            for path, problems in files.problems([Path(requested) for requested in message['paths']])
+            for line, col, text in problems
+        ]}
+    if command in {'stop', 'ping'}:
+        return {}
+    return {'error': 'unknown command {0!r}'.format(command)}
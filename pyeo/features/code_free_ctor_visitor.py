@@ -3,44 +3,46 @@
 
 """AssignmentOnlyCtorVisitor."""
 
-import argparse
 import ast
 from typing import final
 
+from pyeo.config import Config
+from pyeo.utils.class_info import ClassInfo, class_info
+from pyeo.utils.class_kind import ClassKind
+from pyeo.violations import Record, problem_record
+
 
 @final
 class CodeFreeCtorVisitor(ast.NodeVisitor):
     """CodeFreeCtorVisitor."""
 
-    def __init__(self, options: argparse.Namespace) -> None:
+    def __init__(self, config: Config) -> None:
         """Ctor."""
-        self.problems: list[tuple[int, int, str]] = []
+        self.problems: list[Record] = []
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802, WPS231, C901
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
         """Visit by classes.
 
         :param node: ast.ClassDef
         """
-        if self._is_enum_class(node):
-            self.generic_visit(node)
+        self.check_class(node, class_info(node))
+        self.generic_visit(node)
+
+    def check_class(self, node: ast.ClassDef, info: ClassInfo) -> None:  # noqa: WPS231, C901
+        """Check class without visiting nested nodes.
+
+        :param node: ast.ClassDef
+        :param info: ClassInfo
+        """
+        if info.kind & ClassKind.ENUM:
             return
         for elem in node.body:
             if not isinstance(elem, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 continue
             if elem.name == '__init__':
-                self._check_constructor_body(elem, 'PEO101 __init__ method should contain only assignments')
+                self._check_constructor_body(elem, 'PEO101')
             elif self._is_classmethod(elem):
-                self._check_constructor_body(elem, 'PEO102 @classmethod should contain only cls() call')
-        self.generic_visit(node)
-
-    def _is_enum_class(self, node: ast.ClassDef) -> bool:
-        for base in node.bases:
-            if (
-                (isinstance(base, ast.Name) and base.id.endswith('Enum'))
-                or (isinstance(base, ast.Attribute) and base.attr.endswith('Enum'))
-            ):
-                return True
-        return False
+                self._check_constructor_body(elem, 'PEO102')
 
     def _is_classmethod(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
         for decorator in node.decorator_list:
@@ -51,26 +53,26 @@ class CodeFreeCtorVisitor(ast.NodeVisitor):
                 return True
         return False
 
-    def _check_constructor_body(self, node: ast.FunctionDef | ast.AsyncFunctionDef, error_message: str) -> None:
+    def _check_constructor_body(self, node: ast.FunctionDef | ast.AsyncFunctionDef, code: str) -> None:
         for body_elem in node.body:
             if isinstance(body_elem, (ast.Assign, ast.AnnAssign)):
                 if node.name == '__init__' and not self._is_valid_assignment(body_elem, node):
-                    self.problems.append((body_elem.lineno, body_elem.col_offset, error_message))
+                    self.problems.append(problem_record(body_elem.lineno, body_elem.col_offset, code))
                 continue
             elif isinstance(body_elem, ast.Return):
                 if body_elem.value is None:
                     if node.name == '__init__':
                         continue
                     else:
-                        self.problems.append((body_elem.lineno, body_elem.col_offset, error_message))
+                        self.problems.append(problem_record(body_elem.lineno, body_elem.col_offset, code))
                 else:
                     if self._is_classmethod(node) and isinstance(body_elem.value, ast.Call):
                         if self._is_valid_cls_call(body_elem.value, node) or self._is_constructor_call(body_elem.value):
                             continue
                         else:
-                            self.problems.append((body_elem.lineno, body_elem.col_offset, error_message))
+                            self.problems.append(problem_record(body_elem.lineno, body_elem.col_offset, code))
                     else:
-                        self.problems.append((body_elem.lineno, body_elem.col_offset, error_message))
+                        self.problems.append(problem_record(body_elem.lineno, body_elem.col_offset, code))
             elif (
                 isinstance(body_elem, ast.Expr)
                 and isinstance(body_elem.value, ast.Constant)
@@ -78,7 +80,7 @@ class CodeFreeCtorVisitor(ast.NodeVisitor):
             ):
                 continue
             else:
-                self.problems.append((body_elem.lineno, body_elem.col_offset, error_message))
+                self.problems.append(problem_record(body_elem.lineno, body_elem.col_offset, code))
 
     def _is_valid_cls_call(self, node: ast.Call, func_node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
         if not isinstance(node.func, ast.Name) or node.func.id != 'cls':
@@ -3,25 +3,34 @@
 
 """ForbiddenDecoratorVisitor."""
 
-import argparse
 import ast
 from typing import final
 
+from pyeo.config import Config
+from pyeo.violations import Record, problem_record
+
 
 @final
 class ForbiddenDecoratorVisitor(ast.NodeVisitor):
     """ForbiddenDecoratorVisitor."""
 
-    def __init__(self, options: argparse.Namespace) -> None:
+    def __init__(self, config: Config) -> None:
         """Ctor."""
-        self.problems: list[tuple[int, int, str]] = []
+        self.problems: list[Record] = []
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802, WPS231, C901
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
         """Visit by methods.
 
-        :param node: ast.ClassDef
+        :param node: ast.FunctionDef
+        """
+        self.check_function(node)
+        self.generic_visit(node)
+
+    def check_function(self, node: ast.FunctionDef) -> None:
+        """Check function without visiting nested nodes.
+
+        :param node: ast.FunctionDef
         """
         for deco in node.decorator_list:
             if isinstance(deco, ast.Name) and deco.id == 'staticmethod':
-                self.problems.append((node.lineno, node.col_offset, 'PEO400 Staticmethod is forbidden'))
-        self.generic_visit(node)
+                self.problems.append(problem_record(node.lineno, node.col_offset, 'PEO400'))
@@ -3,34 +3,36 @@
 
 """NoErSuffix."""
 
-import argparse
 import ast
 from typing import final
 
+from pyeo.config import Config
+from pyeo.utils.class_info import ClassInfo, class_info
+from pyeo.violations import Record, problem_record
+
 
 @final
 class NoErSuffix(ast.NodeVisitor):
     """NoErSuffix."""
 
-    def __init__(self, options: argparse.Namespace) -> None:
+    def __init__(self, config: Config) -> None:
         """Ctor."""
-        self._options = options
-        self.problems: list[tuple[int, int, str]] = []
-        self._whitelist = {
-            'User',
-            'Identifier',
-        } | set(self._options.available_er_names)
-
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802, WPS231, C901
+        self.problems: list[Record] = []
+        self._er_names = config.er_names
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
         """Visit by classes.
 
         :param node: ast.ClassDef
         """
-        class_name = node.name
-        if class_name.endswith('er'):
-            for whitelist_suffix in self._whitelist:
-                if class_name.endswith(whitelist_suffix):
-                    break
-            else:
-                self.problems.append((node.lineno, node.col_offset, 'PEO300 "er" suffix forbidden'))
+        self.check_class(node, class_info(node))
         self.generic_visit(node)
+
+    def check_class(self, node: ast.ClassDef, info: ClassInfo) -> None:
+        """Check class without visiting nested nodes.
+
+        :param node: ast.ClassDef
+        :param info: ClassInfo
+        """
+        if node.name.endswith('er') and not self._er_names.allows(node.name):
+            self.problems.append(problem_record(node.lineno, node.col_offset, 'PEO300'))
@@ -3,45 +3,44 @@
 
 """NoGetterMethodsVisitor."""
 
-import argparse
 import ast
 from typing import final
 
+from pyeo.config import Config
+from pyeo.violations import Record, problem_record
+
 
 @final
 class NoGetterMethodsVisitor(ast.NodeVisitor):
     """Visitor that forbids methods that return object attributes (getter methods)."""
 
-    def __init__(self, options: argparse.Namespace) -> None:
+    def __init__(self, config: Config) -> None:
         """Ctor."""
-        self.problems: list[tuple[int, int, str]] = []
+        self.problems: list[Record] = []
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
         """Visit function definitions to check for getter methods.
 
+        :param node: ast.FunctionDef
+        """
+        self.check_function(node)
+        self.generic_visit(node)
+
+    def check_function(self, node: ast.FunctionDef) -> None:
+        """Check function without visiting nested nodes.
+
         :param node: ast.FunctionDef
         """
         # Skip if function is not a method (no self parameter)
         if not self._is_method(node):
-            self.generic_visit(node)
             return
 
         # Check if method name starts with "get" or "get_"
         if self._is_getter_by_name(node.name):
-            self.problems.append((
-                node.lineno,
-                node.col_offset,
-                f'PEO601 Method "{node.name}" starts with "get" and should be avoided',
-            ))
+            self.problems.append(problem_record(node.lineno, node.col_offset, 'PEO601', node.name))
         # Only check for simple getters if method name doesn't start with "get"
         elif len(node.args.args) == 1 and self._is_simple_getter(node):
-            self.problems.append((
-                node.lineno,
-                node.col_offset,
-                f'PEO602 Method "{node.name}" is a getter and should be avoided',
-            ))
-
-        self.generic_visit(node)
+            self.problems.append(problem_record(node.lineno, node.col_offset, 'PEO602', node.name))
 
     def _is_method(self, node: ast.FunctionDef) -> bool:
         """Check if function is a method (has self parameter).
@@ -3,79 +3,38 @@
 
 """NoMutableObjectsVisitor."""
 
-import argparse
 import ast
 from typing import final
 
-from pyeo.utils.class_is_protocol import class_is_not_obj_factory
+from pyeo.config import Config
+from pyeo.utils.class_info import ClassInfo, class_info
+from pyeo.utils.class_kind import ClassKind
+from pyeo.violations import Record, problem_record
 
 
 @final
 class NoMutableObjectsVisitor(ast.NodeVisitor):
     """NoMutableObjectsVisitor."""
 
-    def __init__(self, options: argparse.Namespace) -> None:
+    def __init__(self, config: Config) -> None:
         """Ctor."""
-        self._options = options
-        self.problems: list[tuple[int, int, str]] = []
+        self.problems: list[Record] = []
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802, WPS231, C901
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
         """Visit by classes.
 
         :param node: ast.ClassDef
         """
-        frozen_found = False
-        if class_is_not_obj_factory(node):
-            self.generic_visit(node)
-            return
-        for deco in node.decorator_list:
-            if isinstance(deco, ast.Name) and deco.id == 'frozen':
-                frozen_found = True
-                break
-            elif (
-                isinstance(deco, ast.Attribute)
-                and deco.attr == 'frozen'
-                and isinstance(deco.value, ast.Name)
-                and deco.value.id == 'attrs'
-            ):
-                frozen_found = True
-                break
-            elif isinstance(deco, ast.Call):
-                if (
-                    isinstance(deco.func, ast.Attribute)
-                    and hasattr(deco.func, 'id')
-                    and isinstance(deco.func, ast.Name)
-                    and deco.func.id == 'define'
-                ):
-                    for keyword in deco.keywords:
-                        if keyword.arg == 'frozen' and isinstance(keyword.value, ast.Constant) and keyword.value.value:
-                            frozen_found = True
-                            break
-                elif isinstance(deco.func, ast.Attribute) and deco.func.attr == 'define':
-                    frozen_found = self._frozen(deco.keywords)
-                elif isinstance(deco.func, ast.Name) and deco.func.id == 'define':
-                    frozen_found = self._frozen(deco.keywords)
-                elif isinstance(deco.func, ast.Name) and deco.func.id == 'frozen':
-                    frozen_found = True
-                    break
-                elif isinstance(deco.func, ast.Attribute) and deco.func.attr == 'dataclass':
-                    frozen_found = self._frozen(deco.keywords)
-                elif isinstance(deco.func, ast.Name) and deco.func.id == 'dataclass':
-                    frozen_found = self._frozen(deco.keywords)
-                elif (
-                    isinstance(deco.func, ast.Attribute)
-                    and isinstance(deco.func.value, ast.Name)
-                    and deco.func.value.id == 'attrs'
-                    and deco.func.attr == 'frozen'
-                ):
-                    frozen_found = True
-                    break
-        if not frozen_found:
-            self.problems.append((node.lineno, node.col_offset, 'PEO200 class must be frozen'))
+        self.check_class(node, class_info(node))
         self.generic_visit(node)
 
-    def _frozen(self, keywords: list[ast.keyword]) -> bool:
-        for keyword in keywords:
-            if keyword.arg == 'frozen' and isinstance(keyword.value, ast.Constant) and keyword.value.value:
-                return True
-        return False
+    def check_class(self, node: ast.ClassDef, info: ClassInfo) -> None:
+        """Check class without visiting nested nodes.
+
+        :param node: ast.ClassDef
+        :param info: ClassInfo
+        """
+        if info.kind != ClassKind.PLAIN:
+            return
+        if not info.frozen:
+            self.problems.append(problem_record(node.lineno, node.col_offset, 'PEO200'))
@@ -3,29 +3,34 @@
 
 """NoPropertyDecoratorVisitor."""
 
-import argparse
 import ast
 from typing import final
 
+from pyeo.config import Config
+from pyeo.violations import Record, problem_record
+
 
 @final
 class NoPropertyDecoratorVisitor(ast.NodeVisitor):
     """Visitor that forbids the use of @property decorator."""
 
-    def __init__(self, options: argparse.Namespace) -> None:
+    def __init__(self, config: Config) -> None:
         """Ctor."""
-        self.problems: list[tuple[int, int, str]] = []
+        self.problems: list[Record] = []
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
         """Visit function definitions to check for @property decorator.
 
+        :param node: ast.FunctionDef
+        """
+        self.check_function(node)
+        self.generic_visit(node)
+
+    def check_function(self, node: ast.FunctionDef) -> None:
+        """Check function without visiting nested nodes.
+
         :param node: ast.FunctionDef
         """
         for decorator in node.decorator_list:
             if isinstance(decorator, ast.Name) and decorator.id == 'property':
-                self.problems.append((
-                    node.lineno,
-                    node.col_offset,
-                    'PEO500 @property decorator is forbidden',
-                ))
-        self.generic_visit(node)
+                self.problems.append(problem_record(node.lineno, node.col_offset, 'PEO500'))
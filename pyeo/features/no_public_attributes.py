@@ -3,48 +3,44 @@
 
 """NoPublicAttributesVisitor."""
 
-import argparse
 import ast
 from typing import final
 
-from pyeo.utils.class_is_protocol import class_is_enum, class_is_exception, class_is_typeddict
+from pyeo.config import Config
+from pyeo.utils.class_info import ClassInfo, class_info
+from pyeo.utils.class_kind import ClassKind
+from pyeo.violations import Record, problem_record
 
 
 @final
 class NoPublicAttributesVisitor(ast.NodeVisitor):
     """NoPublicAttributesVisitor."""
 
-    def __init__(self, options: argparse.Namespace) -> None:
+    def __init__(self, config: Config) -> None:
         """Ctor."""
-        self._options = options
-        self.problems: list[tuple[int, int, str]] = []
+        self.problems: list[Record] = []
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802, WPS231
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
         """Visit by classes.
 
         :param node: ast.ClassDef
         """
-        if self._should_skip_class(node):
-            self.generic_visit(node)
+        self.check_class(node, class_info(node))
+        self.generic_visit(node)
+
+    def check_class(self, node: ast.ClassDef, info: ClassInfo) -> None:  # noqa: WPS231
+        """Check class without visiting nested nodes.
+
+        :param node: ast.ClassDef
+        :param info: ClassInfo
+        """
+        if info.kind & (ClassKind.ENUM | ClassKind.EXCEPTION | ClassKind.TYPEDDICT):
             return
         for elem in node.body:
             if isinstance(elem, ast.Assign):
                 self._check_assign_attributes(elem)
             elif isinstance(elem, ast.AnnAssign):
                 self._check_ann_assign_attributes(elem)
-        self.generic_visit(node)
-
-    def _should_skip_class(self, node: ast.ClassDef) -> bool:
-        """Check if class should be skipped from public attributes check.
-
-        :param node: ast.ClassDef
-        :return: True if class should be skipped
-        """
-        return any([
-            class_is_enum(node),
-            class_is_exception(node),
-            class_is_typeddict(node),
-        ])
 
     def _check_assign_attributes(self, node: ast.Assign) -> None:
         """Check assign attributes for public names.
@@ -54,11 +50,7 @@ class NoPublicAttributesVisitor(ast.NodeVisitor):
         for target in node.targets:
             if isinstance(target, ast.Name):
                 if not target.id.startswith('_'):
-                    self.problems.append((
-                        node.lineno,
-                        node.col_offset,
-                        f'PEO300 class attribute "{target.id}" should be private',
-                    ))
+                    self.problems.append(problem_record(node.lineno, node.col_offset, 'PEO700', target.id))
 
     def _check_ann_assign_attributes(self, node: ast.AnnAssign) -> None:
         """Check annotated assign attributes for public names.
@@ -67,8 +59,4 @@ class NoPublicAttributesVisitor(ast.NodeVisitor):
         """
         if isinstance(node.target, ast.Name):
             if not node.target.id.startswith('_'):
-                self.problems.append((
-                    node.lineno,
-                    node.col_offset,
-                    f'PEO300 class attribute "{node.target.id}" should be private',
-                ))
+                self.problems.append(problem_record(node.lineno, node.col_offset, 'PEO700', node.target.id))
@@ -7,6 +7,7 @@ import ast
 from collections.abc import Generator
 from typing import final
 
+from pyeo.violations import formatted
 from pyeo.visitor_protocol import VisitorWithProblems
 
 
@@ -23,5 +24,5 @@ class FkPlugin:
         """Entry."""
         for visitor in self._visitors:
             visitor.visit(self._tree)
-            for line in visitor.problems:  # noqa: WPS526
+            for line in map(formatted, visitor.problems):  # noqa: WPS526
                 yield (line[0], line[1], line[2], type(self))
@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Protocol for rules, that check functions."""
+
+import ast
+from typing import Protocol
+
+from pyeo.violations import Record
+
+
+class FunctionRule(Protocol):
+    """Protocol for rules, that check functions."""
+
+    problems: list[Record]
+
+    def check_function(self, node: ast.FunctionDef) -> None:
+        """Check function without visiting nested nodes."""
@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""FusedVisitor."""
+
+import ast
+from collections.abc import Iterator, Sequence
+from typing import cast, final
+
+from pyeo.class_rule_protocol import ClassRule
+from pyeo.function_rule_protocol import FunctionRule
+from pyeo.utils.class_info import class_info
+from pyeo.utils.definitions import definitions
+from pyeo.violations import Record
+from pyeo.visitor_protocol import VisitorWithProblems
+
+
+@final
+class FusedVisitor:
+    """Visitor, that walks tree once and sends nodes to each subscribed rule.
+
+    Rules keep collecting problems in own ``problems`` lists,
+    so results are the same as after separate ``rule.visit(tree)`` calls.
+    Each class is classified once and all rules share its ClassInfo.
+    Only statement blocks are walked, see ``definitions``.
+    """
+
+    def __init__(self, rules: Sequence[VisitorWithProblems]) -> None:
+        """Ctor."""
+        self._class_rules = [cast(ClassRule, rule) for rule in rules if hasattr(rule, 'check_class')]
+        self._function_rules = [cast(FunctionRule, rule) for rule in rules if hasattr(rule, 'check_function')]
+        self._problem_lists = list({id(rule.problems): rule.problems for rule in rules}.values())
+
+    def visit(self, tree: ast.AST) -> None:
+        """Send classes and functions of tree to rules.
+
+        :param tree: parsed module
+        """
+        for node in definitions(tree):
+            self._check(node)
+
+    def problems(self, tree: ast.AST) -> Iterator[Record]:
+        """Unformatted problems, emitted while tree is walked.
+
+        Emitted problems are taken out of rules' lists, and traversal stops,
+        when caller stops iteration.
+
+        :param tree: parsed module
+        :yield: problem
+        """
+        for node in definitions(tree):
+            self._check(node)
+            for problems in self._problem_lists:
+                if problems:
+                    yield from problems
+                    problems.clear()
+
+    def _check(self, node: ast.ClassDef | ast.FunctionDef) -> None:
+        if isinstance(node, ast.ClassDef):
+            info = class_info(node)
+            for class_rule in self._class_rules:
+                class_rule.check_class(node, info)
+        else:
+            for function_rule in self._function_rules:
+                function_rule.check_function(node)
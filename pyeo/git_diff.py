@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Changes of python files by local git."""
+
+import ast
+import bisect
+import os
+import re
+import subprocess  # noqa: S404
+from collections.abc import Callable, Iterator, Sequence
+from typing import IO, cast
+
+from pyeo.utils.definitions import scopes
+from pyeo.violations import Record
+
+_HUNK = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+_NEW_FILE = '+++ '
+_NEW_PREFIX = 'b/'
+_ESCAPE = re.compile(rb'\\([0-7]{3}|.)')
+_ESCAPES = {b'a': b'\a', b'b': b'\b', b'f': b'\f', b'n': b'\n', b'r': b'\r', b't': b'\t', b'v': b'\v'}
+_BLOB_MODES = frozenset((b'100644', b'100755'))
+
+
+def changed_lines(revision: str) -> dict[str, tuple[tuple[int, int], ...]]:
+    """Changed line ranges of python files under current directory, compared with revision.
+
+    Paths are relative to current directory, ranges are inclusive and sorted.
+    Removed lines touch lines around them.
+    Prefixes and quoting of paths are fixed, so ``diff.noprefix`` and ``diff.mnemonicPrefix`` of user do not matter.
+
+    :param revision: git revision, e.g. origin/main
+    :return: dict[str, tuple[tuple[int, int], ...]]
+    """
+    diff = _git_output(
+        'git diff against {0!r}'.format(revision),
+        '-c', 'core.quotePath=false',
+        'diff', '--src-prefix=a/', '--dst-prefix={0}'.format(_NEW_PREFIX), '--unified=0', '--no-color',
+        '--no-ext-diff', '--relative', '--diff-filter=d', revision, '--', '*.py',
+    )
+    return _parsed_diff(diff.decode('utf-8', 'surrogateescape').split('\n'))
+
+
+def staged_sources(pathspecs: Sequence[str]) -> Iterator[tuple[str, bytes]]:
+    """Staged python files and their contents from git object store.
+
+    All blobs are read through one ``git cat-file --batch`` process, nothing is written to disk.
+
+    :param pathspecs: git pathspecs, e.g. directories
+    :yield: path relative to current directory and content of staged blob
+    """
+    raw = _git_output(
+        'git diff --cached',
+        'diff', '--cached', '--raw', '-z', '--no-abbrev', '--no-renames', '--relative', '--diff-filter=d',
+        '--', *pathspecs,
+    ).split(b'\0')
+    staged = [
+        (os.fsdecode(path), meta.split()[3])
+        for meta, path in zip(raw[::2], raw[1::2])
+        if path.endswith(b'.py') and meta.split()[1] in _BLOB_MODES
+    ]
+    if not staged:
+        return
+    with subprocess.Popen(  # noqa: S603, S607
+        ['git', 'cat-file', '--batch'],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    ) as batch:
+        stdin, stdout = cast(IO[bytes], batch.stdin), cast(IO[bytes], batch.stdout)
+        try:
+            for path, oid in staged:
+                stdin.write(oid + b'\n')
+                stdin.flush()
+                header = stdout.readline().split()
+                if len(header) != 3 or header[1] != b'blob':
+                    raise RuntimeError('git cat-file: unexpected answer for {0}: {1!r}'.format(path, header))
+                source = stdout.read(int(header[2]))
+                stdout.read(1)
+                yield path, source
+        finally:
+            stdin.close()
+
+
+def _git_output(action: str, *args: str) -> bytes:
+    try:
+        return subprocess.run(  # noqa: S603, S607
+            ['git', *args],
+            capture_output=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError) as err:
+        stderr = getattr(err, 'stderr', None)
+        raise RuntimeError('{0} failed: {1}'.format(
+            action,
+            (stderr.decode(errors='replace') if stderr else str(err)).strip(),
+        )) from err
+
+
+def _parsed_diff(diff: Sequence[str]) -> dict[str, tuple[tuple[int, int], ...]]:
+    changed: dict[str, list[tuple[int, int]]] = {}
+    ranges: list[tuple[int, int]] = []
+    for line in diff:
+        if line.startswith(_NEW_FILE):
+            ranges = changed.setdefault(_new_path(line[len(_NEW_FILE):]), [])
+            continue
+        hunk = _HUNK.match(line)
+        if hunk is None:
+            continue
+        start = int(hunk.group(1))
+        count = 1 if hunk.group(2) is None else int(hunk.group(2))
+        if count:
+            ranges.append((start, start + count - 1))
+        else:
+            ranges.append((start, start + 1))
+    return {path: tuple(sorted(file_ranges)) for path, file_ranges in changed.items()}
+
+
+def _new_path(header: str) -> str:
+    # Git appends tab to names with spaces and quotes names with special characters in C style.
+    path = header.removesuffix('\t')
+    if path.startswith('"') and path.endswith('"'):
+        path = _ESCAPE.sub(_unescaped, path[1:-1].encode('utf-8', 'surrogateescape')).decode('utf-8', 'surrogateescape')
+    return path.removeprefix(_NEW_PREFIX)
+
+
+def _unescaped(escape: re.Match[bytes]) -> bytes:
+    char = escape.group(1)
+    if len(char) == 3:
+        return bytes((int(char, 8),))
+    return _ESCAPES.get(char, char)
+
+
+def touched_by(tree: ast.AST, ranges: Sequence[tuple[int, int]]) -> Callable[[Record], bool]:
+    """Problem is inside changed class or function, or on changed line outside of them.
+
+    Class or function is changed, when changed range overlaps its lines, including decorators.
+
+    :param tree: parsed module
+    :param ranges: sorted inclusive changed line ranges
+    :return: function of record
+    """
+    ends = [end for _, end in ranges]
+    spans: dict[int, tuple[int, int]] = {}
+    for _, node in scopes(tree):
+        start = min([node.lineno] + [decorator.lineno for decorator in node.decorator_list])
+        span = (start, node.end_lineno or node.lineno)
+        for line in range(node.lineno, span[1] + 1):
+            spans[line] = span
+
+    def _overlaps(start: int, end: int) -> bool:  # noqa: WPS430
+        idx = bisect.bisect_left(ends, start)
+        return idx < len(ranges) and ranges[idx][0] <= end
+
+    def _touched(record: Record) -> bool:  # noqa: WPS430
+        return _overlaps(*spans.get(record[0], (record[0], record[0])))
+    return _touched
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""IncrementalModule."""
+
+import ast
+from typing import final
+
+from pyeo.check import source_problems, streamed_problems
+from pyeo.class_results import ClassResults
+from pyeo.config import Config
+from pyeo.utils.source_lines import source_lines
+from pyeo.violations import Violations
+
+
+@final
+class IncrementalModule:
+    """Problems of edited module, that rechecks only changed top-level classes.
+
+    Problems of top-level classes are kept in ClassResults, so class, that is only moved
+    or reformatted by edit, is not checked again.
+    Other top-level statements are cheap and are checked on each edit.
+    """
+
+    def __init__(self, config: Config, filename: str) -> None:
+        """Ctor.
+
+        :param config: compiled options
+        :param filename: path to module
+        """
+        self._config = config
+        self._filename = filename
+        self._classes = ClassResults()
+
+    def problems(self, source: str) -> Violations:
+        """Problems of new version of module, sorted by position.
+
+        :param source: text of module
+        :return: Violations
+        """
+        try:
+            tree = ast.parse(source, self._filename)
+        except (SyntaxError, ValueError, RecursionError, MemoryError):
+            return source_problems(source.encode('utf-8', 'surrogatepass'), self._filename, self._config)
+        return Violations(
+            streamed_problems(tree, source_lines(source), self._filename, self._config, self._classes),
+        ).sorted()
@@ -0,0 +1,151 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""LspSession."""
+
+import json
+from typing import IO, Any, final
+from urllib.parse import unquote, urlparse
+
+from pyeo.config import Config
+from pyeo.incremental_module import IncrementalModule
+from pyeo.utils.source_lines import source_lines
+
+_FULL_SYNC = 1
+_ERROR = 1
+_WARNING = 2
+_PARSE_ERROR = -32700
+_INVALID_REQUEST = -32600
+_METHOD_NOT_FOUND = -32601
+_INTERNAL_ERROR = -32603
+
+
+@final
+class LspSession:
+    """Session of language server over pair of streams, that publishes PEO problems of open python documents.
+
+    Documents are synchronized in full, each document keeps own IncrementalModule,
+    so only changed top-level classes are checked after edit.
+    Failure of one message doesn't stop server: request gets error response,
+    and failed notification is logged to client.
+    """
+
+    def __init__(self, config: Config, reader: IO[bytes], writer: IO[bytes]) -> None:
+        """Ctor.
+
+        :param config: compiled options
+        :param reader: stream of client messages
+        :param writer: stream of server messages
+        """
+        self._config = config
+        self._reader = reader
+        self._writer = writer
+        self._modules: dict[str, IncrementalModule] = {}
+        self._shutdown = False
+
+    def serve(self) -> int:
+        """Handle messages until exit notification or end of stream.
+
+        :return: exit code, 0 after shutdown request
+        """
+        while True:
+            try:
+                message = self._message()
+            except ValueError as err:
+                self._send({'id': None, 'error': {'code': _PARSE_ERROR, 'message': 'broken message: {0}'.format(err)}})
+                continue
+            if message is None:
+                return 0 if self._shutdown else 1
+            if not isinstance(message, dict):
+                self._send({'id': None, 'error': {'code': _INVALID_REQUEST, 'message': 'message is not an object'}})
+                continue
+            if message.get('method') == 'exit':
+                return 0 if self._shutdown else 1
+            try:
+                self._handle(message)
+            except Exception as err:
+                self._report(message, err)
+
+    def _handle(self, message: dict[str, Any]) -> None:
+        method = message.get('method')
+        params = message.get('params') or {}
+        if method == 'initialize':
+            self._respond(message, {
+                'capabilities': {'textDocumentSync': {'openClose': True, 'change': _FULL_SYNC}},
+                'serverInfo': {'name': 'pyeo'},
+            })
+        elif method == 'shutdown':
+            self._shutdown = True
+            self._respond(message, None)
+        elif method == 'textDocument/didOpen':
+            document = params['textDocument']
+            self._publish(document['uri'], document['text'])
+        elif method == 'textDocument/didChange':
+            self._publish(params['textDocument']['uri'], params['contentChanges'][-1]['text'])
+        elif method == 'textDocument/didClose':
+            uri = params['textDocument']['uri']
+            self._modules.pop(uri, None)
+            self._send({'method': 'textDocument/publishDiagnostics', 'params': {'uri': uri, 'diagnostics': []}})
+        elif 'id' in message:
+            self._send({
+                'id': message['id'],
+                'error': {'code': _METHOD_NOT_FOUND, 'message': 'unsupported method {0}'.format(method)},
+            })
+
+    def _report(self, message: dict[str, Any], err: Exception) -> None:
+        description = '{0} failed: {1}: {2}'.format(message.get('method'), type(err).__name__, err)
+        if 'id' in message:
+            self._send({'id': message['id'], 'error': {'code': _INTERNAL_ERROR, 'message': description}})
+        else:
+            self._send({'method': 'window/logMessage', 'params': {'type': _ERROR, 'message': description}})
+
+    def _publish(self, uri: str, text: str) -> None:
+        module = self._modules.get(uri)
+        if module is None:
+            module = IncrementalModule(self._config, unquote(urlparse(uri).path))
+            self._modules[uri] = module
+        lines = source_lines(text)
+        diagnostics = []
+        for line, col, message in module.problems(text):
+            character = _utf16_offset(lines[line - 1], col) if 0 < line <= len(lines) else 0
+            end = len(lines[line - 1].encode('utf-16-le')) // 2 if 0 < line <= len(lines) else 0
+            code, text_of_message = message.split(' ', 1)
+            diagnostics.append({
+                'range': {
+                    'start': {'line': line - 1, 'character': character},
+                    'end': {'line': line - 1, 'character': max(end, character)},
+                },
+                'severity': _WARNING,
+                'source': 'pyeo',
+                'code': code,
+                'message': text_of_message,
+            })
+        self._send({'method': 'textDocument/publishDiagnostics', 'params': {'uri': uri, 'diagnostics': diagnostics}})
+
+    def _message(self) -> dict[str, Any] | None:
+        length = None
+        while True:
+            header = self._reader.readline()
+            if not header:
+                return None
+            if header in {b'\r\n', b'\n'}:
+                break
+            name, _, value = header.decode('ascii').partition(':')
+            if name.strip().lower() == 'content-length':
+                length = int(value)
+        if length is None:
+            return None
+        return json.loads(self._reader.read(length))
+
+    def _respond(self, request: dict[str, Any], result: Any) -> None:
+        self._send({'id': request['id'], 'result': result})
+
+    def _send(self, message: dict[str, Any]) -> None:
+        body = json.dumps({'jsonrpc': '2.0', **message}).encode()
+        self._writer.write(b'Content-Length: ' + str(len(body)).encode() + b'\r\n\r\n' + body)
+        self._writer.flush()
+
+
+def _utf16_offset(line: str, col: int) -> int:
+    prefix = line.encode('utf-8', 'surrogatepass')[:col].decode('utf-8', 'replace')
+    return len(prefix.encode('utf-16-le', 'surrogatepass')) // 2
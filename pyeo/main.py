@@ -5,57 +5,130 @@
 
 import argparse
 import ast
+import itertools
+import os
 from collections.abc import Generator
-from typing import final
+from pathlib import Path
+from typing import TYPE_CHECKING, final
 
-from flake8.options.manager import OptionManager
+from flake8.style_guide import Decision, DecisionEngine
 
-from pyeo.features.code_free_ctor_visitor import CodeFreeCtorVisitor
-from pyeo.features.no_er_suffix import NoErSuffix
-from pyeo.features.no_getter_methods import NoGetterMethodsVisitor
-from pyeo.features.no_mutable_objects import NoMutableObjectsVisitor
-from pyeo.features.no_property_decorator import NoPropertyDecoratorVisitor
-from pyeo.features.no_public_attributes import NoPublicAttributesVisitor
-from pyeo.visitor_protocol import VisitorWithProblems
+from pyeo.config import Config
+from pyeo.rules import ALL_CODES, compiled_config
+
+if TYPE_CHECKING:
+    from flake8.options.manager import OptionManager
+
+    from pyeo.result_cache import ResultCache
 
 
 @final
 class Plugin:
-    """Flake8 plugin."""
+    """Flake8 plugin.
+
+    Flake8 loads plugin even when PEO codes are not selected, so checks, cache and rules
+    are imported only when at least one rule is enabled.
+    """
 
-    _options: argparse.Namespace
+    _config: Config
+    _cache: 'ResultCache | None' = None
 
     @classmethod
     def parse_options(cls, options: argparse.Namespace) -> None:
-        """Parse registered options for providing them to each visitor."""
-        cls._options = options
+        """Compile registered options once for all checked files."""
+        decisions = DecisionEngine(options)
+        cls._config = compiled_config(
+            options,
+            frozenset(code for code in ALL_CODES if decisions.decision_for(code) is Decision.Selected),
+        )
+        cls._cache = None
+        if cls._config.rules and options.pyeo_cache_dir and cls._config.changed is None:
+            from pyeo.result_cache import ResultCache, cache_salt  # noqa: WPS433
+            cls._cache = ResultCache(
+                Path(options.pyeo_cache_dir),
+                options.pyeo_cache_size * 1024 * 1024,
+                cache_salt(cls._config),
+            )
+            cls._cache.evict()
+        if cls._config.profile:
+            from pyeo.rule_profile import rule_profile  # noqa: WPS433
+            rule_profile(cls._config.profile)
 
-    def __init__(self, tree: ast.AST) -> None:
+    def __init__(self, tree: ast.AST, lines: list[str], filename: str) -> None:
         """Ctor."""
         self._tree = tree
-        self._visitors: list[VisitorWithProblems] = [
-            CodeFreeCtorVisitor(self._options),
-            NoMutableObjectsVisitor(self._options),
-            NoErSuffix(self._options),
-            NoPublicAttributesVisitor(self._options),
-            NoPropertyDecoratorVisitor(self._options),
-            NoGetterMethodsVisitor(self._options),
-        ]
+        self._lines = lines
+        self._filename = filename
 
     @classmethod
-    def add_options(cls, parser: OptionManager) -> None:
+    def add_options(cls, parser: 'OptionManager') -> None:
         """Add command line options to the parser."""
         parser.add_option(
             long_option_name='--available-er-names',
             default=[],
             comma_separated_list=True,
-            help='Available "er" names',
+            help='Available "er" names, suffixes or glob patterns like "*Serializer"',
+            parse_from_config=True,
+        )
+        parser.add_option(
+            long_option_name='--pyeo-cache-dir',
+            default='',
+            help='Directory of PEO result cache, unchanged files are not checked again (default: disabled)',
+            parse_from_config=True,
+        )
+        parser.add_option(
+            long_option_name='--pyeo-cache-size',
+            default=256,
+            type=int,
+            help='Size limit of PEO result cache in megabytes (default: %(default)s)',
             parse_from_config=True,
         )
+        parser.add_option(
+            long_option_name='--pyeo-profile',
+            default=os.environ.get('PYEO_PROFILE', ''),
+            help='Write timings and counters of PEO rules to JSON file (default: $PYEO_PROFILE or disabled)',
+        )
+        parser.add_option(
+            long_option_name='--pyeo-max-violations',
+            default=0,
+            type=int,
+            help='Stop checking file after this count of PEO problems (default: 0, unlimited)',
+            parse_from_config=True,
+        )
+        parser.add_option(
+            long_option_name='--pyeo-baseline',
+            default='',
+            help='Do not report PEO problems, recorded by "pyeo baseline create" to this file (default: disabled)',
+            parse_from_config=True,
+        )
+        parser.add_option(
+            long_option_name='--pyeo-diff-against',
+            default='',
+            help=(
+                'Report PEO problems only in classes and functions, changed since this git revision, '
+                'result cache is not used (default: disabled)'
+            ),
+        )
 
     def run(self) -> Generator[tuple[int, int, str, type], None, None]:
         """Entry."""
-        for visitor in self._visitors:
-            visitor.visit(self._tree)
-            for line in visitor.problems:  # noqa: WPS526
-                yield (line[0], line[1], line[2], type(self))
+        if not self._config.rules:
+            return
+        from pyeo.check import cache_key, cached_problems, streamed_problems, tree_problems  # noqa: WPS433
+        from pyeo.violations import formatted  # noqa: WPS433
+        if self._cache is None:
+            problems = map(formatted, itertools.islice(
+                streamed_problems(self._tree, self._lines, self._filename, self._config),
+                self._config.max_violations or None,
+            ))
+        else:
+            problems = iter(cached_problems(
+                cache_key(''.join(self._lines).encode('utf-8', 'surrogatepass'), self._filename, self._config),
+                self._cache,
+                lambda _: tree_problems(self._tree, self._lines, self._filename, self._config).sorted(),
+                self._config.max_violations,
+                lambda: self._tree,
+                not self._config.baseline,
+            ))
+        for line in problems:  # noqa: WPS526
+            yield (line[0], line[1], line[2], type(self))
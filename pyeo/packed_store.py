@@ -0,0 +1,326 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""PackedStore."""
+
+import contextlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any, final
+
+if sys.platform == 'win32':  # pragma: no cover
+    import msvcrt
+else:
+    import fcntl
+
+_MAGIC = b'PEOIDX01'
+_ARCHIVE_MAGIC = b'PEOPACK1'
+_HEADER = struct.Struct('<8sIII4x')
+_SLOT = struct.Struct('<16sIIQQ')
+_SLOT_FIELDS = struct.Struct('<IIQQ')
+_USED = struct.Struct('<Q')
+_RECORD = struct.Struct('<16sI')
+_EMPTY = bytes(16)
+_INITIAL_CAPACITY = 1024
+_SEGMENT_SIZE = 64 * 1024 * 1024
+_KEY_SIZE = 16
+
+_Slot = tuple[bytes, int, int, int, int]
+
+
+@final
+class PackedStore:
+    """Content-addressed store of small values in a few files, shared by concurrent processes.
+
+    File ``index`` is memory-mapped open-addressing hash table of 16-byte keys,
+    values are appended to segment files ``pack-NNNNNN``.
+    Readers take no locks: key of slot is written after its other fields, and each record
+    repeats its key and length, so torn or stale slot is a miss.
+    Writers are serialized by lock of file ``lock``. Index is grown and segments are compacted
+    into new files, that replace old ones atomically, so readers never see partial files.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Ctor.
+
+        :param directory: directory of store
+        """
+        self._directory = directory
+        self._index: mmap.mmap | None = None
+        self._index_id = (0, 0)
+        self._capacity = 0
+        self._segments: dict[int, IO[bytes]] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Only directory is sent to other processes, mapping and files are opened again.
+
+        :return: state
+        """
+        return {'directory': self._directory}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore store, sent from other process.
+
+        :param state: state
+        """
+        self.__init__(state['directory'])  # type: ignore[misc]
+
+    def find(self, key: bytes) -> bytes | None:
+        """Value of key, None on miss, hit marks entry as recently used.
+
+        :param key: 16-byte key
+        :return: bytes | None
+        """
+        found = self._found(key)
+        if found is None and self._remapped():
+            found = self._found(key)
+        if found is None:
+            return None
+        position, slot = found
+        value = self._value(slot)
+        if value is not None:
+            _USED.pack_into(self._mapped_index(), position + _SLOT.size - _USED.size, time.time_ns())
+        return value
+
+    def put(self, key: bytes, value: bytes) -> None:
+        """Save value of key, that is not saved yet.
+
+        :param key: 16-byte key
+        :param value: value
+        """
+        self._appended(((key, value),))
+
+    def evict(self, max_size: int) -> None:
+        """Compact segments into most recently used entries, when they exceed size limit.
+
+        Compaction rewrites kept entries, so it leaves a quarter of limit for new entries.
+
+        :param max_size: size limit of segments in bytes
+        """
+        if sum(size for _, size in self._segment_sizes()) <= max_size:
+            return
+        with self._locked():
+            self._remapped()
+            old = self._segment_sizes()
+            slots = sorted(self._slots(), key=lambda slot: slot[4], reverse=True)
+            kept: list[tuple[bytes, bytes, int]] = []
+            total = 0
+            for slot in slots:
+                value = self._value(slot)
+                if value is None:
+                    continue
+                total += _RECORD.size + len(value)
+                if total > max_size * 3 // 4:
+                    break
+                kept.append((slot[0], value, slot[4]))
+            segment = max((number for number, _ in old), default=-1) + 1
+            self._rebuild(max(_INITIAL_CAPACITY, len(kept) * 2), [], segment)
+            self._write_records(kept)
+            for number, _ in old:
+                pack = self._segments.pop(number, None)
+                if pack is not None:
+                    pack.close()
+                with contextlib.suppress(OSError):
+                    (self._directory / _segment_name(number)).unlink()
+
+    def export_archive(self, archive: Path) -> int:
+        """Write all entries to one file, see ``import_archive``.
+
+        :param archive: path to archive
+        :return: count of exported entries
+        """
+        self._remapped()
+        count = 0
+        archive.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=archive.parent, delete=False) as tmp:
+            tmp.write(_ARCHIVE_MAGIC)
+            for slot in self._slots():
+                value = self._value(slot)
+                if value is not None:
+                    tmp.write(_RECORD.pack(slot[0], len(value)) + value)
+                    count += 1
+        os.replace(tmp.name, archive)
+        return count
+
+    def import_archive(self, archive: Path) -> int:
+        """Add entries of archive, made by ``export_archive``, that are not saved yet.
+
+        :param archive: path to archive
+        :return: count of added entries
+        :raises ValueError: file is not archive of store
+        """
+        data = archive.read_bytes()
+        if not data.startswith(_ARCHIVE_MAGIC):
+            raise ValueError('{0} is not pyeo cache archive'.format(archive))
+        records = []
+        position = len(_ARCHIVE_MAGIC)
+        while position < len(data):
+            if position + _RECORD.size > len(data):
+                raise ValueError('{0} is truncated'.format(archive))
+            key, length = _RECORD.unpack_from(data, position)
+            position += _RECORD.size + length
+            if position > len(data):
+                raise ValueError('{0} is truncated'.format(archive))
+            records.append((key, data[position - length:position]))
+        return self._appended(records)
+
+    def _appended(self, records: Iterable[tuple[bytes, bytes]]) -> int:
+        with self._locked():
+            self._remapped()
+            return self._write_records(
+                (key, value, time.time_ns()) for key, value in records if self._found(key) is None
+            )
+
+    def _write_records(self, records: Iterable[tuple[bytes, bytes, int]]) -> int:
+        if self._index is None:
+            self._rebuild(_INITIAL_CAPACITY, [], 0)
+        count = 0
+        segment = _HEADER.unpack_from(self._mapped_index())[3]
+        pack = (self._directory / _segment_name(segment)).open('ab')
+        try:
+            for key, value, used in records:
+                if pack.tell() >= _SEGMENT_SIZE:
+                    pack.close()
+                    segment += 1
+                    pack = (self._directory / _segment_name(segment)).open('ab')
+                _, capacity, stored, _ = _HEADER.unpack_from(self._mapped_index())
+                if (stored + 1) * 2 > capacity:
+                    self._rebuild(capacity * 2, list(self._slots()), segment)
+                offset = pack.tell()
+                pack.write(_RECORD.pack(key, len(value)) + value)
+                pack.flush()
+                self._insert(self._mapped_index(), (key, segment, len(value), offset, used))
+                count += 1
+        finally:
+            pack.close()
+        return count
+
+    def _insert(self, index: mmap.mmap | bytearray, slot: _Slot) -> None:
+        _, capacity, stored, _ = _HEADER.unpack_from(index)
+        number = int.from_bytes(slot[0][:8], 'little') % capacity
+        while index[_HEADER.size + number * _SLOT.size:_HEADER.size + number * _SLOT.size + _KEY_SIZE] != _EMPTY:
+            number = (number + 1) % capacity
+        position = _HEADER.size + number * _SLOT.size
+        _SLOT_FIELDS.pack_into(index, position + _KEY_SIZE, *slot[1:])
+        index[position:position + _KEY_SIZE] = slot[0]
+        header = _HEADER.unpack_from(index)
+        _HEADER.pack_into(index, 0, _MAGIC, capacity, stored + 1, max(header[3], slot[1]))
+
+    def _rebuild(self, capacity: int, slots: list[_Slot], segment: int) -> None:
+        index = bytearray(_HEADER.size + capacity * _SLOT.size)
+        _HEADER.pack_into(index, 0, _MAGIC, capacity, 0, segment)
+        for slot in slots:
+            self._insert(index, slot)
+        gitignore = self._directory / '.gitignore'
+        if not gitignore.exists():
+            gitignore.write_text('*\n')
+        with tempfile.NamedTemporaryFile('wb', dir=self._directory, delete=False) as tmp:
+            tmp.write(index)
+        os.replace(tmp.name, self._directory / 'index')
+        self._remapped()
+
+    def _found(self, key: bytes) -> tuple[int, _Slot] | None:
+        index = self._index
+        if index is None:
+            return None
+        capacity = self._capacity
+        number = int.from_bytes(key[:8], 'little') % capacity
+        for _ in range(capacity):
+            position = _HEADER.size + number * _SLOT.size
+            slot = _SLOT.unpack_from(index, position)
+            if slot[0] == key:
+                return position, slot
+            if slot[0] == _EMPTY:
+                return None
+            number = (number + 1) % capacity
+        return None
+
+    def _slots(self) -> Iterator[_Slot]:
+        index = self._index
+        if index is None:
+            return
+        for number in range(self._capacity):
+            slot = _SLOT.unpack_from(index, _HEADER.size + number * _SLOT.size)
+            if slot[0] != _EMPTY:
+                yield slot
+
+    def _value(self, slot: _Slot) -> bytes | None:
+        key, segment, length, offset, _ = slot
+        try:
+            pack = self._segment(segment)
+            pack.seek(offset)
+            record = pack.read(_RECORD.size + length)
+        except OSError:
+            return None
+        if record[:_RECORD.size] != _RECORD.pack(key, length) or len(record) != _RECORD.size + length:
+            return None
+        return record[_RECORD.size:]
+
+    def _remapped(self) -> bool:
+        path = self._directory / 'index'
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if self._index is not None and (stat.st_dev, stat.st_ino) == self._index_id:
+            return False
+        try:
+            with path.open('r+b') as index_file:
+                index = mmap.mmap(index_file.fileno(), 0)
+        except (OSError, ValueError):
+            return False
+        header = _HEADER.unpack_from(index) if len(index) >= _HEADER.size else (b'', 0, 0, 0)
+        if header[0] != _MAGIC or len(index) != _HEADER.size + header[1] * _SLOT.size:
+            index.close()
+            return False
+        self._index = index
+        self._index_id = (stat.st_dev, stat.st_ino)
+        self._capacity = header[1]
+        return True
+
+    def _mapped_index(self) -> mmap.mmap:
+        if self._index is None:
+            raise RuntimeError('index of {0} is not mapped'.format(self._directory))
+        return self._index
+
+    def _segment(self, number: int) -> IO[bytes]:
+        pack = self._segments.get(number)
+        if pack is None:
+            pack = (self._directory / _segment_name(number)).open('rb')
+            self._segments[number] = pack
+        return pack
+
+    def _segment_sizes(self) -> list[tuple[int, int]]:
+        sizes = []
+        for segment in self._directory.glob('pack-*'):
+            with contextlib.suppress(OSError, ValueError):
+                sizes.append((int(segment.name[len('pack-'):]), segment.stat().st_size))
+        return sizes
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        with (self._directory / 'lock').open('a+b') as lock:
+            _lock(lock, locked=True)
+            try:
+                yield
+            finally:
+                _lock(lock, locked=False)
+
+
+def _lock(lock: IO[bytes], locked: bool) -> None:
+    if sys.platform == 'win32':  # pragma: no cover
+        lock.seek(0)
+        msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK if locked else msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX if locked else fcntl.LOCK_UN)
+
+
+def _segment_name(number: int) -> str:
+    return 'pack-{0:06d}'.format(number)
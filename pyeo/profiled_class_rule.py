@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""ProfiledClassRule."""
+
+import ast
+import time
+from typing import final
+
+from pyeo.class_rule_protocol import ClassRule
+from pyeo.rule_profile import RuleProfile
+from pyeo.utils.class_info import ClassInfo
+
+
+@final
+class ProfiledClassRule:
+    """Class rule, that records own timings and counters."""
+
+    def __init__(self, origin: ClassRule, profile: RuleProfile) -> None:
+        """Ctor.
+
+        :param origin: decorated rule
+        :param profile: RuleProfile
+        """
+        self._origin = origin
+        self._profile = profile
+        self.problems = origin.problems
+
+    def check_class(self, node: ast.ClassDef, info: ClassInfo) -> None:
+        """Check class and record timing.
+
+        :param node: ast.ClassDef
+        :param info: ClassInfo
+        """
+        problems_before = len(self.problems)
+        start = time.perf_counter()
+        self._origin.check_class(node, info)
+        self._profile.add(
+            type(self._origin).__name__,
+            time=time.perf_counter() - start,
+            classes=1,
+            problems=len(self.problems) - problems_before,
+        )
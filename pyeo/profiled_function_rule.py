@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""ProfiledFunctionRule."""
+
+import ast
+import time
+from typing import final
+
+from pyeo.function_rule_protocol import FunctionRule
+from pyeo.rule_profile import RuleProfile
+
+
+@final
+class ProfiledFunctionRule:
+    """Function rule, that records own timings and counters."""
+
+    def __init__(self, origin: FunctionRule, profile: RuleProfile) -> None:
+        """Ctor.
+
+        :param origin: decorated rule
+        :param profile: RuleProfile
+        """
+        self._origin = origin
+        self._profile = profile
+        self.problems = origin.problems
+
+    def check_function(self, node: ast.FunctionDef) -> None:
+        """Check function and record timing.
+
+        :param node: ast.FunctionDef
+        """
+        problems_before = len(self.problems)
+        start = time.perf_counter()
+        self._origin.check_function(node)
+        self._profile.add(
+            type(self._origin).__name__,
+            time=time.perf_counter() - start,
+            functions=1,
+            problems=len(self.problems) - problems_before,
+        )
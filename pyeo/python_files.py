@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Python files under paths."""
+
+import fnmatch
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+
+
+def python_files(paths: Iterable[Path], exclude: Sequence[str]) -> Iterator[Path]:
+    """Python files in sorted order, paths of files are yielded as is.
+
+    :param paths: files and directories
+    :param exclude: excluded names and glob patterns
+    :yield: Path
+    """
+    for path in paths:
+        if not path.is_dir():
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(name for name in dirs if not excluded(name, exclude))
+            yield from (
+                Path(root, name)
+                for name in sorted(files)
+                if name.endswith('.py') and not excluded(name, exclude)
+            )
+
+
+def excluded(name: str, exclude: Sequence[str]) -> bool:
+    """Name matches one of excluded patterns.
+
+    :param name: name of file or directory
+    :param exclude: excluded names and glob patterns
+    :return: bool
+    """
+    return any(fnmatch.fnmatch(name, pattern) for pattern in exclude)
@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""ResultCache."""
+
+import ast
+import contextlib
+import hashlib
+import json
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import final
+
+from pyeo.config import Config
+from pyeo.packed_store import PackedStore
+from pyeo.utils.skeleton import dump_skeleton, load_skeleton, module_skeleton
+from pyeo.violations import Violations, violations_of_rows
+
+
+@final
+class ResultCache:
+    """On-disk cache of file problems, keyed by source hash, pyeo version and options.
+
+    Entries are kept in PackedStore: one memory-mapped index and a few append-only segments,
+    that concurrent workers share, and that can be exported and imported as one archive.
+    Eviction keeps most recently used entries.
+    Optional parse cache keeps skeletons of modules, that don't depend on options.
+    """
+
+    def __init__(self, directory: Path, max_size: int, salt: bytes, skeletons: bool = False) -> None:
+        """Ctor.
+
+        :param directory: cache directory
+        :param max_size: size limit of entries in bytes
+        :param salt: fingerprint of pyeo version and options
+        :param skeletons: keep skeletons of parsed modules, see ``module_skeleton``
+        """
+        self._store = PackedStore(directory)
+        self._max_size = max_size
+        self._salt = salt
+        self._skeleton_salt = (
+            'skeleton {0} {1}\0'.format(_pyeo_version(), sys.version_info[:2]).encode() if skeletons else b''
+        )
+
+    def problems(self, source: bytes) -> Violations | None:
+        """Cached problems of source, None on miss.
+
+        :param source: module source
+        :return: Violations | None
+        """
+        entry = self._store.find(self._key(self._salt, source))
+        if entry is None:
+            return None
+        try:
+            return violations_of_rows(json.loads(entry))
+        except (ValueError, TypeError, KeyError):
+            return None
+
+    def save(self, source: bytes, problems: Violations) -> None:
+        """Save problems of source.
+
+        :param source: module source
+        :param problems: problems of source
+        """
+        self._store.put(self._key(self._salt, source), json.dumps(problems.rows(), separators=(',', ':')).encode())
+
+    def tree(self, source: bytes) -> ast.Module | None:
+        """Cached skeleton of module, None on miss or without parse cache.
+
+        :param source: module source
+        :return: ast.Module | None
+        """
+        if not self._skeleton_salt:
+            return None
+        entry = self._store.find(self._key(self._skeleton_salt, source))
+        if entry is None:
+            return None
+        try:
+            return load_skeleton(entry)
+        except (ValueError, RecursionError):
+            return None
+
+    def save_tree(self, source: bytes, tree: ast.Module) -> ast.Module:
+        """Save skeleton of parsed module, when parse cache is enabled.
+
+        Problems of skeleton and of the whole tree are the same, but structure of skeleton
+        is used as cache key, so loaded and parsed modules must be checked in the same form.
+
+        :param source: module source
+        :param tree: parsed module
+        :return: tree to check, skeleton with parse cache, otherwise the same tree
+        """
+        if not self._skeleton_salt:
+            return tree
+        skeleton = module_skeleton(tree)
+        with contextlib.suppress(ValueError, RecursionError):
+            self._store.put(self._key(self._skeleton_salt, source), dump_skeleton(skeleton))
+        return skeleton
+
+    def evict(self) -> None:
+        """Remove least recently used entries, that exceed size limit."""
+        self._store.evict(self._max_size)
+
+    def _key(self, salt: bytes, source: bytes) -> bytes:
+        return hashlib.blake2b(salt + source, digest_size=16).digest()
+
+
+def cache_salt(config: Config) -> bytes:
+    """Fingerprint of pyeo and python versions and options, that affect problems.
+
+    :param config: compiled options
+    :return: bytes
+    """
+    return hashlib.sha256(json.dumps({
+        'version': _pyeo_version(),
+        'python': sys.version_info[:2],
+        'er_whitelist': sorted(config.er_whitelist),
+        'codes': sorted(config.codes),
+        'baseline': hashlib.sha256('\n'.join(sorted(config.baseline)).encode()).hexdigest() if config.baseline else '',
+    }).encode()).digest()
+
+
+def _pyeo_version() -> str:
+    try:
+        return metadata.version('eo-styleguide')
+    except metadata.PackageNotFoundError:
+        return 'unknown'
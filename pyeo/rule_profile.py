@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""RuleProfile."""
+
+import contextlib
+import json
+import os
+import tempfile
+from collections import defaultdict
+from multiprocessing import parent_process, util
+from pathlib import Path
+from typing import Any, final
+
+_STAT_NAMES = ('time', 'classes', 'functions', 'problems')
+_profiles: dict[str, 'RuleProfile'] = {}
+
+
+@final
+class RuleProfile:
+    """Timings and counters of rules, aggregated over files and processes.
+
+    Worker processes dump own counters to ``<path>.<pid>.part`` files on exit,
+    main process merges them with own counters into ``path`` JSON report.
+    """
+
+    def __init__(self, path: Path, files: list[int], rules: defaultdict[str, dict[str, float]]) -> None:
+        """Ctor.
+
+        :param path: path to JSON report
+        :param files: single element list with count of checked files
+        :param rules: counters by rule name
+        """
+        self._path = path
+        self._files = files
+        self._rules = rules
+
+    def add_file(self) -> None:
+        """Count checked file."""
+        self._files[0] += 1
+
+    def add(self, rule: str, **stats: float) -> None:
+        """Add counters of rule.
+
+        :param rule: name of rule
+        :param stats: counters
+        """
+        rule_stats = self._rules[rule]
+        for name, value in stats.items():
+            rule_stats[name] += value
+
+    def reset(self) -> None:
+        """Forget counters, for example inherited by forked process."""
+        self._files[0] = 0
+        self._rules.clear()
+
+    def dump(self) -> None:
+        """Write counters of process, main process writes aggregated report."""
+        own = {'files': self._files[0], 'rules': self._rules}
+        if parent_process() is not None:
+            _write(self._path.with_name('{0}.{1}.part'.format(self._path.name, os.getpid())), own)
+            return
+        files = 0
+        rules: defaultdict[str, dict[str, float]] = defaultdict(_empty_stats)
+        parts = sorted(self._path.parent.glob('{0}.*.part'.format(self._path.name)))
+        for report in [own, *(_read(part) for part in parts)]:
+            files += report.get('files', 0)
+            for rule, rule_stats in report.get('rules', {}).items():
+                for name in _STAT_NAMES:
+                    rules[rule][name] += rule_stats.get(name, 0)
+        _write(self._path, {'files': files, 'rules': dict(sorted(rules.items()))})
+        for part in parts:
+            with contextlib.suppress(OSError):
+                part.unlink()
+
+
+def rule_profile(path: str) -> RuleProfile:
+    """Profile of current process, report is written on process exit.
+
+    :param path: path to JSON report
+    :return: RuleProfile
+    """
+    if path not in _profiles:
+        profile = RuleProfile(Path(path), [0], defaultdict(_empty_stats))
+        _register(profile)
+        util.register_after_fork(profile, _register_forked)
+        _profiles[path] = profile
+    return _profiles[path]
+
+
+def _register(profile: RuleProfile) -> None:
+    util.Finalize(None, profile.dump, exitpriority=0)
+
+
+def _register_forked(profile: RuleProfile) -> None:
+    profile.reset()
+    _register(profile)
+
+
+def _empty_stats() -> dict[str, float]:
+    return dict.fromkeys(_STAT_NAMES, 0)
+
+
+def _read(path: Path) -> dict[str, Any]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write(path: Path, report: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile('w', dir=path.parent, delete=False) as tmp:
+        json.dump(report, tmp, indent=2)
+    os.replace(tmp.name, path)
@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Rules of plugin and their codes."""
+
+import argparse
+import importlib
+import re
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from pyeo.config import Config
+from pyeo.utils.er_names import ErNames
+from pyeo.visitor_protocol import VisitorWithProblems
+
+# Rules by import path with their codes and pattern of bytes, that source must contain to have problems of rule.
+# Modules of rules are imported only when rule is enabled, so loading of plugin stays cheap.
+# Parser normalizes identifiers by NFKC, so non-ASCII source may spell identifier with other characters.
+_RULES: tuple[tuple[str, frozenset[str], bytes], ...] = (
+    ('pyeo.features.code_free_ctor_visitor.CodeFreeCtorVisitor', frozenset(('PEO101', 'PEO102')), b'class'),
+    ('pyeo.features.no_mutable_objects.NoMutableObjectsVisitor', frozenset(('PEO200',)), b'class'),
+    ('pyeo.features.no_er_suffix.NoErSuffix', frozenset(('PEO300',)), b'class'),
+    ('pyeo.features.no_public_attributes.NoPublicAttributesVisitor', frozenset(('PEO700',)), b'class'),
+    (
+        'pyeo.features.no_property_decorator.NoPropertyDecoratorVisitor',
+        frozenset(('PEO500',)),
+        b'property|[\x80-\xff]',
+    ),
+    ('pyeo.features.no_getter_methods.NoGetterMethodsVisitor', frozenset(('PEO601', 'PEO602')), b'self|[\x80-\xff]'),
+)
+ALL_CODES = frozenset(code for _, codes, _ in _RULES for code in codes)
+# Source in declared encoding may be not ASCII-compatible.
+_ENCODING_COOKIE = b'coding[:=]'
+_DEFAULT_ER_WHITELIST = frozenset(('User', 'Identifier'))
+
+
+def compiled_config(options: argparse.Namespace, codes: frozenset[str]) -> Config:
+    """Config with rules, that emit at least one of enabled codes.
+
+    :param options: parsed options
+    :param codes: enabled codes
+    :return: Config
+    """
+    er_whitelist = _DEFAULT_ER_WHITELIST | frozenset(options.available_er_names)
+    enabled = [(rule, pattern) for rule, rule_codes, pattern in _RULES if not rule_codes.isdisjoint(codes)]
+    baseline: frozenset[str] = frozenset()
+    if options.pyeo_baseline:
+        from pyeo.baseline import load_baseline  # noqa: WPS433
+        baseline = load_baseline(Path(options.pyeo_baseline))
+    changed: dict[str, tuple[tuple[int, int], ...]] | None = None
+    if options.pyeo_diff_against:
+        from pyeo.git_diff import changed_lines  # noqa: WPS433
+        changed = changed_lines(options.pyeo_diff_against)
+    return Config(
+        codes=codes,
+        rules=tuple(_imported_rule(rule) for rule, _ in enabled),
+        er_whitelist=er_whitelist,
+        profile=options.pyeo_profile,
+        max_violations=options.pyeo_max_violations,
+        baseline=baseline,
+        changed=changed,
+        prefilter=re.compile(b'|'.join(dict.fromkeys([_ENCODING_COOKIE, *(pattern for _, pattern in enabled)]))),
+        er_names=ErNames(er_whitelist),
+    )
+
+
+def selected_codes(select: Sequence[str], ignore: Sequence[str]) -> frozenset[str]:
+    """Codes, selected by prefixes.
+
+    The longest matching prefix decides, ignore wins when prefixes have same length.
+
+    :param select: selected code prefixes
+    :param ignore: ignored code prefixes
+    :return: frozenset[str]
+    """
+    return frozenset(
+        code
+        for code in ALL_CODES
+        if _longest_prefix(code, select) > _longest_prefix(code, ignore)
+    )
+
+
+def _longest_prefix(code: str, prefixes: Sequence[str]) -> int:
+    return max((len(prefix) for prefix in prefixes if code.startswith(prefix)), default=-1)
+
+
+def _imported_rule(path: str) -> Callable[[Config], VisitorWithProblems]:
+    module, _, name = path.rpartition('.')
+    return getattr(importlib.import_module(module), name)
@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""ClassInfo."""
+
+import ast
+from typing import final
+
+from pyeo.utils.class_kind import ClassKind
+
+
+@final
+class ClassInfo:
+    """Classification of class, shared by all rules."""
+
+    def __init__(self, kind: ClassKind, frozen: bool) -> None:
+        """Ctor.
+
+        :param kind: kinds of class by bases
+        :param frozen: class decorated as immutable
+        """
+        self.kind = kind
+        self.frozen = frozen
+
+
+def class_info(node: ast.ClassDef) -> ClassInfo:
+    """Classify class by one pass over bases and one pass over decorators.
+
+    :param node: ast.ClassDef
+    :return: ClassInfo
+    """
+    kind = ClassKind.PLAIN
+    for base in node.bases:
+        base_name = _base_name(base)
+        if base_name is not None:
+            kind |= _kind_by_name(base_name)
+    frozen = False
+    for deco in node.decorator_list:
+        frozen, frozen_locked = _frozen_by_decorator(deco, frozen)
+        if frozen_locked:
+            break
+    return ClassInfo(kind, frozen)
+
+
+def _base_name(base: ast.expr) -> str | None:
+    if isinstance(base, ast.Name):
+        return base.id
+    elif isinstance(base, ast.Attribute):
+        return base.attr
+    elif isinstance(base, ast.Subscript) and isinstance(base.value, ast.Name):
+        return base.value.id
+    return None
+
+
+def _kind_by_name(name: str) -> ClassKind:
+    kind = ClassKind.PLAIN
+    if name == 'Protocol':
+        kind |= ClassKind.PROTOCOL
+    elif name == 'TypedDict':
+        kind |= ClassKind.TYPEDDICT
+    if name.endswith('Enum'):
+        kind |= ClassKind.ENUM
+    if name.endswith(('Exception', 'Error')):
+        kind |= ClassKind.EXCEPTION
+    return kind
+
+
+def _frozen_by_decorator(deco: ast.expr, frozen: bool) -> tuple[bool, bool]:  # noqa: WPS212, C901
+    """Frozen flag after decorator and flag, that next decorators can't change it.
+
+    :param deco: decorator
+    :param frozen: frozen flag by previous decorators
+    :return: tuple[bool, bool]
+    """
+    if isinstance(deco, ast.Name) and deco.id == 'frozen':
+        return True, True
+    elif (
+        isinstance(deco, ast.Attribute)
+        and deco.attr == 'frozen'
+        and isinstance(deco.value, ast.Name)
+        and deco.value.id == 'attrs'
+    ):
+        return True, True
+    elif not isinstance(deco, ast.Call):
+        return frozen, False
+    func = deco.func
+    if isinstance(func, ast.Attribute) and func.attr in {'define', 'dataclass'}:
+        return _frozen_keyword(deco.keywords), False
+    elif isinstance(func, ast.Name) and func.id in {'define', 'dataclass'}:
+        return _frozen_keyword(deco.keywords), False
+    elif isinstance(func, ast.Name) and func.id == 'frozen':
+        return True, True
+    elif (
+        isinstance(func, ast.Attribute)
+        and isinstance(func.value, ast.Name)
+        and func.value.id == 'attrs'
+        and func.attr == 'frozen'
+    ):
+        return True, True
+    return frozen, False
+
+
+def _frozen_keyword(keywords: list[ast.keyword]) -> bool:
+    for keyword in keywords:
+        if keyword.arg == 'frozen' and isinstance(keyword.value, ast.Constant) and keyword.value.value:
+            return True
+    return False
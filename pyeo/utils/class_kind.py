@@ -0,0 +1,21 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""ClassKind."""
+
+import enum
+from typing import final
+
+
+@final
+class ClassKind(enum.Flag):
+    """Kinds of classes, that are not object factories.
+
+    Class may have several kinds at once, for example ``class Status(AppError, Enum)``.
+    """
+
+    PLAIN = 0
+    PROTOCOL = enum.auto()
+    ENUM = enum.auto()
+    EXCEPTION = enum.auto()
+    TYPEDDICT = enum.auto()
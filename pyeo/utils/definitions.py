@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Classes and functions of module without recursion."""
+
+import ast
+from collections.abc import Iterator
+
+BLOCKS: dict[type[ast.AST], tuple[str, ...]] = {
+    ast.Module: ('body',),
+    ast.Interactive: ('body',),
+    ast.ClassDef: ('body',),
+    ast.FunctionDef: ('body',),
+    ast.AsyncFunctionDef: ('body',),
+    ast.If: ('body', 'orelse'),
+    ast.For: ('body', 'orelse'),
+    ast.AsyncFor: ('body', 'orelse'),
+    ast.While: ('body', 'orelse'),
+    ast.With: ('body',),
+    ast.AsyncWith: ('body',),
+    ast.Try: ('body', 'handlers', 'orelse', 'finalbody'),
+    ast.ExceptHandler: ('body',),
+    ast.Match: ('cases',),
+    ast.match_case: ('body',),
+}
+if hasattr(ast, 'TryStar'):  # pragma: no cover
+    BLOCKS[ast.TryStar] = BLOCKS[ast.Try]
+
+
+def definitions(tree: ast.AST) -> Iterator[ast.ClassDef | ast.FunctionDef]:
+    """Classes and functions in same order as ast.NodeVisitor visits them.
+
+    Expressions can't contain ``class`` or ``def`` statements, so only statement
+    blocks are walked, and explicit stack keeps deeply nested code away from RecursionError.
+
+    :param tree: parsed module
+    :yield: ast.ClassDef | ast.FunctionDef
+    """
+    stack = [tree]
+    blocks = BLOCKS
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is ast.ClassDef or node_type is ast.FunctionDef:
+            yield node  # type: ignore[misc]
+        fields = blocks.get(node_type)
+        if fields is None:
+            continue
+        children: list[ast.AST] = []
+        for field in fields:
+            children.extend(getattr(node, field))
+        children.reverse()
+        stack.extend(children)
+
+
+def scopes(tree: ast.AST) -> Iterator[tuple[str, ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef]]:
+    """Classes and functions with dotted names of their scopes, e.g. ``House.area``.
+
+    :param tree: parsed module
+    :yield: qualified name and node
+    """
+    stack: list[tuple[ast.AST, str]] = [(tree, '')]
+    blocks = BLOCKS
+    while stack:
+        node, prefix = stack.pop()
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            prefix = '{0}.{1}'.format(prefix, node.name) if prefix else node.name
+            yield prefix, node
+        fields = blocks.get(type(node))
+        if fields is None:
+            continue
+        children = [(child, prefix) for field in fields for child in getattr(node, field)]
+        children.reverse()
+        stack.extend(children)
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""ErNames."""
+
+import fnmatch
+import re
+from collections.abc import Iterable
+from typing import final
+
+_MAGIC = frozenset('*?[')
+_END = ''
+
+
+@final
+class ErNames:
+    """Whitelist of "er" names.
+
+    Plain names and ``*Suffix`` globs are allowed suffixes of class name and live in reversed trie,
+    so lookup costs O(len(name)) regardless of whitelist size. Other globs (``Base*Handler``) match
+    whole class name by single compiled pattern.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """Ctor.
+
+        :param patterns: names and glob patterns
+        """
+        self._trie: dict[str, dict] = {}
+        globs = []
+        for pattern in patterns:
+            suffix = pattern.removeprefix('*')
+            if _MAGIC.isdisjoint(suffix):
+                self._insert(suffix)
+            else:
+                globs.append(fnmatch.translate(pattern))
+        self._glob = re.compile('|'.join(globs)) if globs else None
+
+    def allows(self, name: str) -> bool:
+        """Class name is allowed.
+
+        :param name: class name
+        :return: bool
+        """
+        node = self._trie
+        for char in reversed(name):
+            if _END in node:
+                return True
+            next_node = node.get(char)
+            if next_node is None:
+                break
+            node = next_node
+        else:
+            if _END in node:
+                return True
+        return self._glob is not None and self._glob.match(name) is not None
+
+    def _insert(self, suffix: str) -> None:
+        node = self._trie
+        for char in reversed(suffix):
+            node = node.setdefault(char, {})
+        node[_END] = {}
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Problems, bound to nodes instead of positions, that survive reformatting."""
+
+import ast
+import hashlib
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from pyeo.violations import Record, Violations
+
+# Child node in hashed shape of its parent, no field of node holds a tuple.
+_CHILD = ()
+
+
+def structure_key(tree: ast.AST) -> bytes:
+    """Hash of tree without line and column attributes.
+
+    Trees of the same code with other formatting, comments or position in file have the same key.
+    Explicit stack keeps deeply nested expressions, that ``ast.dump`` can't recurse into, away from RecursionError:
+    each node is hashed as its type and fields, where child nodes are replaced by a marker.
+
+    :param tree: parsed code
+    :return: bytes
+    """
+    shapes = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        shape: list[Any] = [type(node).__name__]
+        for name in node._fields:
+            value = getattr(node, name, None)
+            if isinstance(value, ast.AST):
+                stack.append(value)
+                shape.append(_CHILD)
+            elif isinstance(value, list):
+                shape.append([_CHILD if isinstance(elem, ast.AST) else elem for elem in value])
+                stack.extend(elem for elem in value if isinstance(elem, ast.AST))
+            else:
+                shape.append(value)
+        shapes.append(shape)
+    return hashlib.blake2b(repr(shapes).encode()).digest()
+
+
+def positioned_nodes(tree: ast.AST) -> list[ast.AST]:
+    """Nodes with positions in order of ``ast.walk``, the same for trees with the same structure.
+
+    :param tree: parsed code
+    :return: list[ast.AST]
+    """
+    return [node for node in ast.walk(tree) if hasattr(node, 'lineno')]
+
+
+def indexed(nodes: Sequence[ast.AST], records: Iterable[Record]) -> Violations | None:
+    """Problems with index of the first node at their position as line and 0 as column.
+
+    All rules report problems at positions of nodes.
+
+    :param nodes: nodes of tree, see ``positioned_nodes``
+    :param records: problems of tree
+    :return: Violations, None if some problem is not at position of node
+    """
+    indexes: dict[tuple[int, int], int] = {}
+    for index, node in enumerate(nodes):
+        indexes.setdefault((node.lineno, node.col_offset), index)  # type: ignore[attr-defined]
+    stored = []
+    for line, col, code_id, arg in records:
+        index = indexes.get((line, col))
+        if index is None:
+            return None
+        stored.append((index, 0, code_id, arg))
+    return Violations(stored)
+
+
+def positioned(nodes: Sequence[ast.AST], problems: Violations) -> Iterator[Record]:
+    """Problems, made by ``indexed``, with positions of nodes of other tree with the same structure.
+
+    :param nodes: nodes of tree, see ``positioned_nodes``
+    :param problems: indexed problems
+    :yield: problem
+    """
+    for index, _, code_id, arg in problems.records():
+        node = nodes[index]
+        yield (node.lineno, node.col_offset, code_id, arg)  # type: ignore[attr-defined]
@@ -0,0 +1,19 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Path of checked file, that doesn't depend on how it was passed."""
+
+import os
+from pathlib import PurePath
+
+
+def normalized_path(filename: str) -> str:
+    """Path relative to current directory with forward slashes, like git shows it.
+
+    :param filename: path to file
+    :return: str
+    """
+    try:
+        return PurePath(os.path.relpath(filename)).as_posix()
+    except ValueError:
+        return PurePath(filename).as_posix()
@@ -0,0 +1,198 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Skeleton of module: parts of tree, that rules look at, and its compact serialized form."""
+
+import ast
+import json
+from collections.abc import Sequence
+from typing import Any
+
+from pyeo.utils.definitions import BLOCKS
+
+_POSITION = ('lineno', 'col_offset', 'end_lineno', 'end_col_offset')
+_LIST = -1
+
+
+def module_skeleton(tree: ast.Module) -> ast.Module:
+    """Classes and functions of module with parts of tree, that rules look at.
+
+    Skeleton keeps headers and decorators of classes and functions, targets of class attributes,
+    whole bodies of constructors, classmethods and one-statement functions,
+    and statement blocks with nested classes and functions. Other statements are dropped,
+    and values of class attributes are replaced by None, positions are kept,
+    so problems of skeleton and of the whole tree are the same.
+
+    :param tree: parsed module
+    :return: ast.Module
+    """
+    return ast.Module(body=_pruned(tree.body), type_ignores=[])
+
+
+def dump_skeleton(tree: ast.AST) -> bytes:
+    """Compact JSON form of tree, see ``load_skeleton``.
+
+    Node is a list of index of its type in table of types, position, if the type has it, and fields.
+    Constants, that JSON lacks, are tagged lists.
+
+    :param tree: skeleton of module
+    :return: bytes
+    :raises ValueError: tree has integer, that is too long for conversion to string
+    """
+    types: dict[str, int] = {}
+    encoded = _encoded(tree, types)
+    return json.dumps([list(types), encoded], separators=(',', ':')).encode()
+
+
+def load_skeleton(dump: bytes) -> ast.Module:
+    """Tree from its JSON form, made by ``dump_skeleton``.
+
+    Only ast node types are created, so damaged or foreign dump can't run any code.
+    Nodes without fields and positions, e.g. ``ast.Load``, are shared like in parsed tree.
+
+    :param dump: JSON form of tree
+    :return: ast.Module
+    :raises ValueError: dump is not JSON form of module
+    """
+    try:
+        names, encoded = json.loads(dump)
+        types = [_node_type(name) for name in names]
+        singletons = {
+            type_id: node_type()
+            for type_id, node_type in enumerate(types)
+            if not node_type._fields and not node_type._attributes
+        }
+        tree = _decoded(encoded, types, singletons)
+    except (KeyError, IndexError, AttributeError, TypeError) as err:
+        raise ValueError('broken skeleton: {0!r}'.format(err)) from err
+    if not isinstance(tree, ast.Module):
+        raise ValueError('skeleton is not a module')
+    return tree
+
+
+def _pruned(stmts: Sequence[ast.AST]) -> list[Any]:
+    pruned = []
+    for stmt in stmts:
+        kept = _kept(stmt)
+        if kept is not None:
+            pruned.append(kept)
+    return pruned
+
+
+def _kept(stmt: ast.AST) -> ast.AST | None:
+    if isinstance(stmt, ast.ClassDef):
+        return _copied(stmt, body=_class_body(stmt.body))
+    elif isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        if len(stmt.body) == 1 or stmt.name == '__init__' or _is_classmethod(stmt):
+            return _copied(stmt, returns=None)
+        return _copied(stmt, body=_pruned(stmt.body), returns=None)
+    fields = BLOCKS.get(type(stmt))
+    if fields is None:
+        return None
+    blocks = {field: _pruned(getattr(stmt, field)) for field in fields}
+    if not any(blocks.values()):
+        return None
+    return _copied(stmt, **blocks)
+
+
+def _class_body(stmts: Sequence[ast.stmt]) -> list[Any]:
+    body: list[Any] = []
+    for stmt in stmts:
+        if isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+            value = None
+            if stmt.value is not None:
+                value = ast.copy_location(ast.Constant(value=None), stmt.value)
+            body.append(_copied(stmt, value=value))
+        else:
+            kept = _kept(stmt)
+            if kept is not None:
+                body.append(kept)
+    return body
+
+
+def _is_classmethod(node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
+    return any(
+        (isinstance(decorator, ast.Name) and decorator.id == 'classmethod')
+        or (isinstance(decorator, ast.Attribute) and decorator.attr == 'classmethod')
+        for decorator in node.decorator_list
+    )
+
+
+def _copied(node: ast.AST, **fields: Any) -> ast.AST:
+    copy = type(node)(**{
+        name: fields[name] if name in fields else getattr(node, name, None)
+        for name in node._fields
+    })
+    return ast.copy_location(copy, node)
+
+
+def _encoded(value: Any, types: dict[str, int]) -> Any:
+    if isinstance(value, ast.AST):
+        node_type = type(value)
+        encoded: list[Any] = [types.setdefault(node_type.__name__, len(types))]
+        if node_type._attributes:
+            encoded.extend(getattr(value, name, None) for name in _POSITION)
+        if node_type is ast.Constant:
+            encoded.extend((_encoded_constant(value.value), value.kind))  # type: ignore[attr-defined]
+        else:
+            encoded.extend(_encoded(getattr(value, name, None), types) for name in node_type._fields)
+        return encoded
+    elif isinstance(value, list):
+        return [_LIST, *(_encoded(elem, types) for elem in value)]
+    return value
+
+
+def _encoded_constant(value: Any) -> Any:  # noqa: WPS212
+    if value is Ellipsis:
+        return ['...']
+    elif isinstance(value, bytes):
+        return ['b', value.decode('latin-1')]
+    elif isinstance(value, float):
+        return ['f', value.hex()]
+    elif isinstance(value, complex):
+        return ['j', value.real.hex(), value.imag.hex()]
+    elif value is None or isinstance(value, (str, int)):
+        return value
+    raise ValueError('unsupported constant {0!r}'.format(value))
+
+
+def _node_type(name: str) -> type[ast.AST]:
+    node_type = getattr(ast, name)
+    if not isinstance(node_type, type) or not issubclass(node_type, ast.AST):
+        raise TypeError('{0} is not ast node'.format(name))
+    return node_type
+
+
+def _decoded(value: Any, types: list[type[ast.AST]], singletons: dict[int, ast.AST]) -> Any:
+    if value.__class__ is not list:
+        return value
+    type_id = value[0]
+    if type_id == _LIST:
+        return [_decoded(elem, types, singletons) for elem in value[1:]]
+    singleton = singletons.get(type_id)
+    if singleton is not None:
+        return singleton
+    node_type = types[type_id]
+    if node_type is ast.Constant:
+        node = ast.Constant(_decoded_constant(value[5]), value[6])
+    elif node_type._attributes:
+        node = node_type(*[_decoded(field, types, singletons) for field in value[5:]])
+    else:
+        return node_type(*[_decoded(field, types, singletons) for field in value[1:]])
+    node.lineno, node.col_offset, node.end_lineno, node.end_col_offset = value[1:5]  # type: ignore[attr-defined]
+    return node
+
+
+def _decoded_constant(value: Any) -> Any:
+    if not isinstance(value, list):
+        return value
+    tag = value[0]
+    if tag == '...':
+        return Ellipsis
+    elif tag == 'b':
+        return value[1].encode('latin-1')
+    elif tag == 'f':
+        return float.fromhex(value[1])
+    elif tag == 'j':
+        return complex(float.fromhex(value[1]), float.fromhex(value[2]))
+    raise TypeError('unknown constant tag {0!r}'.format(tag))
@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Lines of source, numbered like ast and flake8 number them."""
+
+import io
+
+
+def source_lines(text: str) -> list[str]:
+    r"""Lines of text without line breaks.
+
+    Only ``\r\n``, ``\r`` and ``\n`` break lines, unlike ``str.splitlines``,
+    that also breaks on form feed and other separators, so line numbers of ast match indexes.
+
+    :param text: source of module
+    :return: list[str]
+    """
+    return [line.removesuffix('\n') for line in io.StringIO(text, newline=None)]
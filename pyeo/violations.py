@@ -0,0 +1,174 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Violations."""
+
+import array
+import operator
+from collections.abc import Iterable, Iterator
+from typing import final
+
+_MESSAGES = (
+    ('E902', '{0}'),
+    ('E999', '{0}'),
+    ('PEO101', '__init__ method should contain only assignments'),
+    ('PEO102', '@classmethod should contain only cls() call'),
+    ('PEO200', 'class must be frozen'),
+    ('PEO300', '"er" suffix forbidden'),
+    ('PEO400', 'Staticmethod is forbidden'),
+    ('PEO500', '@property decorator is forbidden'),
+    ('PEO601', 'Method "{0}" starts with "get" and should be avoided'),
+    ('PEO602', 'Method "{0}" is a getter and should be avoided'),
+    ('PEO700', 'class attribute "{0}" should be private'),
+)
+_CODES = tuple(code for code, _ in _MESSAGES)
+_CODE_IDS = {code: code_id for code_id, code in enumerate(_CODES)}
+_TEMPLATES = tuple('{0} {1}'.format(code, template) for code, template in _MESSAGES)
+
+Record = tuple[int, int, int, str]
+
+
+@final
+class Violations:
+    """Problems, stored in columns: line, column, code id and message argument.
+
+    Message text is formatted only when problems are iterated, so collected and transferred
+    problems cost a few bytes each, and arguments are references to names in checked tree.
+    Rules record problems of one file in plain lists, see ``problem_record``,
+    store is built only for results, that are kept in bulk, cached or sent between processes.
+    """
+
+    __slots__ = ('_lines', '_cols', '_codes', '_args')
+
+    def __init__(self, records: Iterable[Record] = ()) -> None:
+        """Ctor.
+
+        :param records: initial records
+        """
+        self._lines = array.array('I')
+        self._cols = array.array('I')
+        self._codes = array.array('B')
+        self._args: list[str] = []
+        self.extend(records)
+
+    def add(self, line: int, col: int, code: str, arg: str = '') -> None:
+        """Add problem.
+
+        :param line: line number
+        :param col: column offset
+        :param code: code of problem, e.g. PEO601
+        :param arg: argument of message template
+        """
+        self._append(*problem_record(line, col, code, arg))
+
+    def extend(self, records: Iterable[Record]) -> None:
+        """Add unformatted problems.
+
+        :param records: unformatted problems
+        """
+        for record in records:
+            self._append(*record)
+
+    def records(self) -> Iterator[Record]:
+        """Unformatted problems.
+
+        :return: iterator of records
+        """
+        return zip(self._lines, self._cols, self._codes, self._args)
+
+    def sorted(self) -> 'Violations':
+        """Problems, sorted by position.
+
+        :return: Violations
+        """
+        return Violations(sorted(self.records(), key=operator.itemgetter(0, 1)))
+
+    def rows(self) -> list[tuple[int, int, str, str]]:
+        """Problems with codes as strings, that don't depend on version of code table.
+
+        :return: list of rows
+        """
+        return [(line, col, _CODES[code_id], arg) for line, col, code_id, arg in self.records()]
+
+    def clear(self) -> None:
+        """Remove all problems."""
+        del self._lines[:]
+        del self._cols[:]
+        del self._codes[:]
+        self._args.clear()
+
+    def __len__(self) -> int:
+        """Count of problems.
+
+        :return: int
+        """
+        return len(self._args)
+
+    def __getitem__(self, index: int) -> tuple[int, int, str]:
+        """Formatted problem by index.
+
+        :param index: index of problem
+        :return: tuple[int, int, str]
+        """
+        return formatted((self._lines[index], self._cols[index], self._codes[index], self._args[index]))
+
+    def __iter__(self) -> Iterator[tuple[int, int, str]]:
+        """Formatted problems.
+
+        :return: iterator of problems
+        """
+        return map(formatted, self.records())
+
+    def _append(self, line: int, col: int, code_id: int, arg: str) -> None:
+        self._lines.append(line)
+        self._cols.append(col)
+        self._codes.append(code_id)
+        self._args.append(arg)
+
+
+def problem_record(line: int, col: int, code: str, arg: str = '') -> Record:
+    """Unformatted problem.
+
+    :param line: line number
+    :param col: column offset
+    :param code: code of problem, e.g. PEO601
+    :param arg: argument of message template
+    :return: Record
+    """
+    return (line, col, _CODE_IDS[code], arg)
+
+
+def formatted(record: Record) -> tuple[int, int, str]:
+    """Problem with formatted message.
+
+    :param record: unformatted problem
+    :return: tuple[int, int, str]
+    """
+    return (record[0], record[1], _TEMPLATES[record[2]].format(record[3]))
+
+
+def record_code(record: Record) -> str:
+    """Code of problem.
+
+    :param record: unformatted problem
+    :return: str
+    """
+    return _CODES[record[2]]
+
+
+def code_ids(codes: Iterable[str]) -> frozenset[int]:
+    """Ids of known codes.
+
+    :param codes: codes of problems
+    :return: frozenset[int]
+    """
+    return frozenset(_CODE_IDS[code] for code in codes if code in _CODE_IDS)
+
+
+def violations_of_rows(rows: Iterable[Iterable]) -> Violations:
+    """Violations from rows, made by ``Violations.rows``.
+
+    :param rows: rows of line, column, code and argument
+    :return: Violations
+    """
+    return Violations((line, col, _CODE_IDS[code], arg) for line, col, code, arg in rows)
@@ -6,11 +6,13 @@
 import ast
 from typing import Protocol
 
+from pyeo.violations import Record
+
 
 class VisitorWithProblems(Protocol):
     """Protocol for visitors with problems attribute."""
 
-    problems: list[tuple[int, int, str]]
+    problems: list[Record]
 
     def visit(self, node: ast.AST) -> None:
         """Visit AST node."""
@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""WatchedFiles."""
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import final
+
+from pyeo.python_files import python_files
+from pyeo.violations import Violations
+
+
+@final
+class WatchedFiles:
+    """Problems of python files, kept in memory and rechecked only after change of file.
+
+    File is changed, when its modification time or size differs from previous refresh.
+    """
+
+    def __init__(
+        self,
+        roots: Sequence[Path],
+        exclude: Sequence[str],
+        checked: Callable[[list[Path]], Iterable[tuple[Path, Violations]]],
+    ) -> None:
+        """Ctor.
+
+        :param roots: watched files and directories
+        :param exclude: excluded names and glob patterns
+        :param checked: check of files, that yields each file with its problems
+        """
+        self._roots = [root.absolute() for root in roots]
+        self._exclude = exclude
+        self._checked = checked
+        self._stamps: dict[Path, tuple[int, int]] = {}
+        self._problems: dict[Path, Violations] = {}
+
+    def refresh(self) -> int:
+        """Recheck new and changed files, forget removed ones.
+
+        :return: count of rechecked files
+        """
+        stamps = {}
+        for path in python_files(self._roots, self._exclude):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            stamps[path] = (stat.st_mtime_ns, stat.st_size)
+        changed = [path for path, stamp in stamps.items() if self._stamps.get(path) != stamp]
+        for removed in self._problems.keys() - stamps.keys():
+            del self._problems[removed]
+        rechecked = set()
+        try:
+            for path, problems in self._checked(changed):
+                self._problems[path] = problems
+                rechecked.add(path)
+        except OSError:
+            for path in set(changed) - rechecked:
+                del stamps[path]
+        self._stamps = stamps
+        return len(rechecked)
+
+    def problems(self, paths: Sequence[Path]) -> Iterator[tuple[Path, Violations]]:
+        """Problems of watched files under paths, sorted by path.
+
+        :param paths: absolute paths of files and directories
+        :yield: absolute path of file with its problems
+        """
+        for path in sorted(self._problems):
+            if any(path == requested or requested in path.parents for requested in paths):
+                yield path, self._problems[path]
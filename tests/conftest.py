@@ -4,19 +4,14 @@
 import argparse
 import ast
 
-import attrs
 import pytest
 
+from pyeo.config import Config
 from pyeo.fk_plugin import FkPlugin
+from pyeo.rules import ALL_CODES, compiled_config
 from pyeo.visitor_protocol import VisitorWithProblems
 
 
-@attrs.define(frozen=True)
-class _Options:
-
-    available_er_names: list[str]
-
-
 @pytest.fixture
 def plugin_run():
     """Fixture for easy run plugin."""
@@ -34,19 +29,23 @@ def plugin_run():
     return _plugin_run
 
 
-@pytest.fixture
-def options_factory():
-    def _options_factory(available_er_names: list[str] | None = None) -> _Options:  # noqa: WPS430
-        if not available_er_names:
-            available_er_names = []
-        return _Options(available_er_names=available_er_names)
-    return _options_factory
-
-
 @pytest.fixture
 def namespace_factory():
     def _namespace_factory(available_er_names: list[str] | None = None) -> argparse.Namespace:  # noqa: WPS430
         if not available_er_names:
             available_er_names = []
-        return argparse.Namespace(available_er_names=available_er_names)
+        return argparse.Namespace(
+            available_er_names=available_er_names,
+            pyeo_profile='',
+            pyeo_max_violations=0,
+            pyeo_baseline='',
+            pyeo_diff_against='',
+        )
     return _namespace_factory
+
+
+@pytest.fixture
+def options_factory(namespace_factory):
+    def _options_factory(available_er_names: list[str] | None = None) -> Config:  # noqa: WPS430
+        return compiled_config(namespace_factory(available_er_names), ALL_CODES)
+    return _options_factory
@@ -107,6 +107,7 @@ def test_param_after_args(plugin_run, options_factory):
 
 @pytest.mark.parametrize('base', [
     'enum.Enum',
+    'FooEnum[T]',
     # TODO: add other
 ])
 def test_enum(plugin_run, options_factory, base):
@@ -55,3 +55,16 @@ def test_whitelist_from_options(plugin_run, suffix, options_factory):
     )
 
     assert not got
+
+
+@pytest.mark.parametrize(('pattern', 'name'), [
+    ('*Serializer', 'UserSerializer'),
+    ('Base*Handler', 'BaseHttpHandler'),
+])
+def test_whitelist_glob(plugin_run, pattern, name, options_factory):
+    got = plugin_run(
+        'class {0}(House): ...'.format(name),
+        [NoErSuffix(options_factory([pattern]))],
+    )
+
+    assert not got
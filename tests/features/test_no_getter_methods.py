@@ -7,6 +7,7 @@ import argparse
 import ast
 
 from pyeo.features.no_getter_methods import NoGetterMethodsVisitor
+from pyeo.violations import formatted
 
 
 def test_simple_getter_forbidden() -> None:
@@ -21,7 +22,7 @@ def test_simple_getter_forbidden() -> None:
     visitor = NoGetterMethodsVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 1
-    assert visitor.problems[0][2] == 'PEO601 Method "get_value" starts with "get" and should be avoided'
+    assert formatted(visitor.problems[0])[2] == 'PEO601 Method "get_value" starts with "get" and should be avoided'
 
 
 def test_chained_attribute_getter_forbidden() -> None:
@@ -36,7 +37,9 @@ def test_chained_attribute_getter_forbidden() -> None:
     visitor = NoGetterMethodsVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 1
-    assert visitor.problems[0][2] == 'PEO601 Method "get_nested_value" starts with "get" and should be avoided'
+    assert formatted(visitor.problems[0])[2] == (
+        'PEO601 Method "get_nested_value" starts with "get" and should be avoided'
+    )
 
 
 def test_getter_with_conditional_forbidden_by_name() -> None:
@@ -53,7 +56,7 @@ def test_getter_with_conditional_forbidden_by_name() -> None:
     visitor = NoGetterMethodsVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 1
-    assert visitor.problems[0][2] == 'PEO601 Method "get_value" starts with "get" and should be avoided'
+    assert formatted(visitor.problems[0])[2] == 'PEO601 Method "get_value" starts with "get" and should be avoided'
 
 
 def test_method_with_parameters_forbidden_by_name() -> None:
@@ -68,7 +71,7 @@ def test_method_with_parameters_forbidden_by_name() -> None:
     visitor = NoGetterMethodsVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 1
-    assert visitor.problems[0][2] == 'PEO601 Method "get_value" starts with "get" and should be avoided'
+    assert formatted(visitor.problems[0])[2] == 'PEO601 Method "get_value" starts with "get" and should be avoided'
 
 
 def test_non_method_function_allowed() -> None:
@@ -99,7 +102,7 @@ def test_method_with_complex_logic_forbidden_by_name() -> None:
     visitor = NoGetterMethodsVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 1
-    assert visitor.problems[0][2] == 'PEO601 Method "get_value" starts with "get" and should be avoided'
+    assert formatted(visitor.problems[0])[2] == 'PEO601 Method "get_value" starts with "get" and should be avoided'
 
 
 def test_method_returning_none_forbidden_by_name() -> None:
@@ -114,7 +117,7 @@ def test_method_returning_none_forbidden_by_name() -> None:
     visitor = NoGetterMethodsVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 1
-    assert visitor.problems[0][2] == 'PEO601 Method "get_value" starts with "get" and should be avoided'
+    assert formatted(visitor.problems[0])[2] == 'PEO601 Method "get_value" starts with "get" and should be avoided'
 
 
 def test_method_returning_literal_forbidden_by_name() -> None:
@@ -129,7 +132,7 @@ def test_method_returning_literal_forbidden_by_name() -> None:
     visitor = NoGetterMethodsVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 1
-    assert visitor.problems[0][2] == 'PEO601 Method "get_value" starts with "get" and should be avoided'
+    assert formatted(visitor.problems[0])[2] == 'PEO601 Method "get_value" starts with "get" and should be avoided'
 
 
 def test_multiple_getters_detected() -> None:
@@ -146,8 +149,8 @@ def test_multiple_getters_detected() -> None:
     visitor = NoGetterMethodsVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 2
-    assert visitor.problems[0][2] == 'PEO601 Method "get_value1" starts with "get" and should be avoided'
-    assert visitor.problems[1][2] == 'PEO601 Method "get_value2" starts with "get" and should be avoided'
+    assert formatted(visitor.problems[0])[2] == 'PEO601 Method "get_value1" starts with "get" and should be avoided'
+    assert formatted(visitor.problems[1])[2] == 'PEO601 Method "get_value2" starts with "get" and should be avoided'
 
 
 def test_get_method_forbidden() -> None:
@@ -162,7 +165,7 @@ def test_get_method_forbidden() -> None:
     visitor = NoGetterMethodsVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 1
-    assert visitor.problems[0][2] == 'PEO601 Method "get" starts with "get" and should be avoided'
+    assert formatted(visitor.problems[0])[2] == 'PEO601 Method "get" starts with "get" and should be avoided'
 
 
 def test_getter_method_forbidden() -> None:
@@ -177,7 +180,7 @@ def test_getter_method_forbidden() -> None:
     visitor = NoGetterMethodsVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 1
-    assert visitor.problems[0][2] == 'PEO601 Method "getter" starts with "get" and should be avoided'
+    assert formatted(visitor.problems[0])[2] == 'PEO601 Method "getter" starts with "get" and should be avoided'
 
 
 def test_getting_method_forbidden() -> None:
@@ -192,7 +195,7 @@ def test_getting_method_forbidden() -> None:
     visitor = NoGetterMethodsVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 1
-    assert visitor.problems[0][2] == 'PEO601 Method "getting" starts with "get" and should be avoided'
+    assert formatted(visitor.problems[0])[2] == 'PEO601 Method "getting" starts with "get" and should be avoided'
 
 
 def test_methods_not_starting_with_get_but_simple_getters_forbidden() -> None:
@@ -211,9 +214,9 @@ def test_methods_not_starting_with_get_but_simple_getters_forbidden() -> None:
     visitor = NoGetterMethodsVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 3
-    assert visitor.problems[0][2] == 'PEO602 Method "value" is a getter and should be avoided'
-    assert visitor.problems[1][2] == 'PEO602 Method "retrieve" is a getter and should be avoided'
-    assert visitor.problems[2][2] == 'PEO602 Method "fetch" is a getter and should be avoided'
+    assert formatted(visitor.problems[0])[2] == 'PEO602 Method "value" is a getter and should be avoided'
+    assert formatted(visitor.problems[1])[2] == 'PEO602 Method "retrieve" is a getter and should be avoided'
+    assert formatted(visitor.problems[2])[2] == 'PEO602 Method "fetch" is a getter and should be avoided'
 
 
 def test_methods_with_complex_logic_allowed() -> None:
@@ -251,7 +254,7 @@ def test_simple_getter_by_behavior_forbidden() -> None:
     visitor = NoGetterMethodsVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 1
-    assert visitor.problems[0][2] == 'PEO602 Method "value" is a getter and should be avoided'
+    assert formatted(visitor.problems[0])[2] == 'PEO602 Method "value" is a getter and should be avoided'
 
 
 def test_simple_getter_with_chained_attributes_forbidden() -> None:
@@ -266,4 +269,4 @@ def test_simple_getter_with_chained_attributes_forbidden() -> None:
     visitor = NoGetterMethodsVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 1
-    assert visitor.problems[0][2] == 'PEO602 Method "nested_value" is a getter and should be avoided'
+    assert formatted(visitor.problems[0])[2] == 'PEO602 Method "nested_value" is a getter and should be avoided'
@@ -7,6 +7,7 @@ import argparse
 import ast
 
 from pyeo.features.no_property_decorator import NoPropertyDecoratorVisitor
+from pyeo.violations import formatted
 
 
 def test_no_property_decorator_allowed() -> None:
@@ -36,7 +37,7 @@ def test_property_decorator_forbidden() -> None:
     visitor = NoPropertyDecoratorVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 1
-    assert visitor.problems[0][2] == 'PEO500 @property decorator is forbidden'
+    assert formatted(visitor.problems[0])[2] == 'PEO500 @property decorator is forbidden'
 
 
 def test_multiple_property_decorators() -> None:
@@ -55,7 +56,7 @@ def test_multiple_property_decorators() -> None:
     visitor = NoPropertyDecoratorVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 2
-    assert all(problem[2] == 'PEO500 @property decorator is forbidden' for problem in visitor.problems)
+    assert all(formatted(problem)[2] == 'PEO500 @property decorator is forbidden' for problem in visitor.problems)
 
 
 def test_other_decorators_allowed() -> None:
@@ -90,4 +91,4 @@ def test_property_with_other_decorators() -> None:
     visitor = NoPropertyDecoratorVisitor(argparse.Namespace())
     visitor.visit(tree)
     assert len(visitor.problems) == 1
-    assert visitor.problems[0][2] == 'PEO500 @property decorator is forbidden'
+    assert formatted(visitor.problems[0])[2] == 'PEO500 @property decorator is forbidden'
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import ast
+
+import pytest
+
+from pyeo.baseline import fingerprint_of, load_baseline, save_baseline
+from pyeo.check import file_fingerprints, tree_problems
+from pyeo.rules import ALL_CODES, compiled_config
+
+_CODE = '\n'.join([
+    'class HttpHouse:',
+    '    def __init__(self, area):',
+    '        print(area)',
+    '',
+    '    def get_area(self):',
+    '        return self._area',
+])
+
+
+def _fingerprints(code, filename, config):
+    tree = ast.parse(code)
+    lines = code.splitlines()
+    fingerprint = fingerprint_of(tree, lines, filename)
+    return [fingerprint(record) for record in tree_problems(tree, lines, filename, config).records()]
+
+
+def test_fingerprints(options_factory):
+    got = _fingerprints(_CODE, 'pkg/house.py', options_factory())
+
+    assert [fingerprint.rsplit(':', 1)[0] for fingerprint in got] == [
+        'pkg/house.py:PEO101:HttpHouse.__init__',
+        'pkg/house.py:PEO200:HttpHouse',
+        'pkg/house.py:PEO601:HttpHouse.get_area',
+    ]
+
+
+def test_survive_line_shift(options_factory):
+    shifted = '\n'.join(['import attrs', '', '', _CODE.replace('print(area)', 'print( area )')])
+
+    assert (
+        sorted(_fingerprints(shifted, 'pkg/house.py', options_factory()))
+        == sorted(_fingerprints(_CODE, 'pkg/house.py', options_factory()))
+    )
+
+
+def test_depend_on_path(options_factory):
+    config = options_factory()
+
+    assert _fingerprints(_CODE, 'house.py', config) != _fingerprints(_CODE, 'pkg/house.py', config)
+
+
+def test_suppress(options_factory, namespace_factory, tmp_path):
+    baseline = tmp_path / 'baseline.json'
+    save_baseline(baseline, _fingerprints(_CODE, 'pkg/house.py', options_factory())[:2])
+    options = namespace_factory()
+    options.pyeo_baseline = str(baseline)
+    config = compiled_config(options, ALL_CODES)
+    tree = ast.parse(_CODE)
+
+    assert list(tree_problems(tree, _CODE.splitlines(), 'pkg/house.py', config)) == [
+        (5, 4, 'PEO601 Method "get_area" starts with "get" and should be avoided'),
+    ]
+
+
+def test_form_feed(options_factory, namespace_factory, tmp_path):
+    code = '\x0c\n{0}\n'.format(_CODE)
+    module = tmp_path / 'house.py'
+    module.write_text(code)
+    baseline = tmp_path / 'baseline.json'
+    save_baseline(baseline, file_fingerprints(module, options_factory()))
+    options = namespace_factory()
+    options.pyeo_baseline = str(baseline)
+    flake8_lines = code.split('\n')
+
+    assert not tree_problems(ast.parse(code), flake8_lines, str(module), compiled_config(options, ALL_CODES))
+
+
+def test_unsupported_version(tmp_path):
+    baseline = tmp_path / 'baseline.json'
+    baseline.write_text('{"version": 0, "fingerprints": []}')
+
+    with pytest.raises(ValueError, match='unsupported baseline version'):
+        load_baseline(baseline)
+
+
+@pytest.mark.parametrize('content', ['not json', '[]', '{"version": 1}'])
+def test_broken(tmp_path, content):
+    baseline = tmp_path / 'baseline.json'
+    baseline.write_text(content)
+
+    with pytest.raises(ValueError, match='baseline'):
+        load_baseline(baseline)
@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import ast
+
+import pytest
+
+from pyeo.utils.class_info import class_info
+from pyeo.utils.class_kind import ClassKind
+
+
+def _class(code: str) -> ast.ClassDef:
+    node = ast.parse(code).body[0]
+    assert isinstance(node, ast.ClassDef)
+    return node
+
+
+@pytest.mark.parametrize(('bases', 'kind'), [
+    ('House', ClassKind.PLAIN),
+    ('Protocol[Mammal]', ClassKind.PROTOCOL),
+    ('typing.Protocol', ClassKind.PROTOCOL),
+    ('t.TypedDict', ClassKind.TYPEDDICT),
+    ('IntEnum', ClassKind.ENUM),
+    ('AppError', ClassKind.EXCEPTION),
+    ('AppError, enum.Enum', ClassKind.EXCEPTION | ClassKind.ENUM),
+    ('typing.Protocol[Mammal]', ClassKind.PLAIN),
+])
+def test_kind(bases, kind):
+    assert class_info(_class('class HttpHouse({0}): ...'.format(bases))).kind == kind
+
+
+@pytest.mark.parametrize(('decorators', 'frozen'), [
+    (['@final'], False),
+    (['@attrs.define(frozen=True)'], True),
+    (['@attrs.define'], False),
+    (['@dataclass(frozen=False)'], False),
+    (['@frozen', '@attrs.define'], True),
+    (['@attrs.define(frozen=True)', '@dataclass'], True),
+    (['@attrs.define(frozen=True)', '@dataclass()'], False),
+])
+def test_frozen(decorators, frozen):
+    got = class_info(_class('\n'.join([*decorators, 'class HttpHouse: ...'])))
+
+    assert got.frozen is frozen
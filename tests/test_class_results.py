@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import ast
+
+from pyeo.check import streamed_problems
+from pyeo.class_results import ClassResults
+from pyeo.violations import Violations
+
+_SOURCE = '\n'.join([
+    'class HttpHouse:',
+    '    area = 1',
+    '',
+    '    def get_area(self):',
+    '        return self._area',
+    '',
+])
+_REFORMATTED = '\n'.join([
+    '"""Module."""',
+    '',
+    '',
+    'class HttpHouse :',
+    '',
+    '    area=1',
+    '    def get_area(',
+    '        self,',
+    '    ):',
+    '        return self._area',
+    '',
+])
+
+
+def _problems(source, config, classes):
+    return list(Violations(streamed_problems(ast.parse(source), source.splitlines(), 'house.py', config, classes)))
+
+
+def test_moved_class_is_not_checked():
+    checked = []
+    classes = ClassResults()
+    list(classes.records(ast.parse(_SOURCE), lambda node: checked.append(node) or ()))
+    list(classes.records(ast.parse(_REFORMATTED), lambda node: checked.append(node) or ()))
+
+    assert [type(node).__name__ for node in checked] == ['ClassDef', 'Expr']
+
+
+def test_positions_of_moved_class(options_factory):
+    config = options_factory()
+    classes = ClassResults()
+    _problems(_SOURCE, config, classes)
+
+    assert _problems(_REFORMATTED, config, classes) == [
+        (4, 0, 'PEO200 class must be frozen'),
+        (6, 4, 'PEO700 class attribute "area" should be private'),
+        (7, 4, 'PEO601 Method "get_area" starts with "get" and should be avoided'),
+    ]
+
+
+def test_drops_least_recently_used():
+    checked = []
+    classes = ClassResults(size=1)
+    for source in (_SOURCE, 'class Other: ...', _SOURCE):
+        list(classes.records(ast.parse(source), lambda node: checked.append(node.name) or ()))
+
+    assert checked == ['HttpHouse', 'Other', 'HttpHouse']
+
+
+def test_deeply_nested_class(options_factory):
+    source = 'class Generated:\n    total = {0}\n'.format(' + '.join(['1'] * 1500))
+    config = options_factory()
+    classes = ClassResults()
+    _problems(source, config, classes)
+
+    assert _problems('\n\n' + source, config, classes) == [
+        (3, 0, 'PEO200 class must be frozen'),
+        (4, 4, 'PEO700 class attribute "total" should be private'),
+    ]
@@ -0,0 +1,347 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import ast
+import subprocess
+import sys
+
+import pytest
+
+from pyeo import check
+from pyeo.cli import main
+
+_GIT = ('git', '-c', 'user.name=test', '-c', 'user.email=test@example.com')
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / 'pkg').mkdir()
+    (tmp_path / 'pkg' / 'house.py').write_text('\n'.join([
+        'class HttpHouse:',
+        '    def get_area(self):',
+        '        return self._area',
+    ]))
+    (tmp_path / 'pkg' / 'handler.py').write_text('\n'.join([
+        '@attrs.frozen',
+        'class Handler:',
+        '    name = "handler"',
+    ]))
+    (tmp_path / '.git').mkdir()
+    (tmp_path / '.git' / 'hook.py').write_text('class Hook: ...')
+    (tmp_path / 'readme.txt').write_text('class Readme: ...')
+    return tmp_path
+
+
+@pytest.mark.parametrize('jobs', ['1', '2'])
+def test_check(project, capsys, jobs):
+    code = main([
+        'check', str(project / 'pkg'), '-j', jobs, '--available-er-names', 'Handler', '--no-cache',
+    ])
+
+    assert code == 1
+    assert capsys.readouterr().out.splitlines() == [
+        '{0}/pkg/handler.py:3:5: PEO700 class attribute "name" should be private'.format(project),
+        '{0}/pkg/house.py:1:1: PEO200 class must be frozen'.format(project),
+        '{0}/pkg/house.py:2:5: PEO601 Method "get_area" starts with "get" and should be avoided'.format(project),
+    ]
+
+
+def test_clean(tmp_path, capsys):
+    (tmp_path / 'module.py').write_text('VALUE = 1\n')
+
+    assert main(['check', str(tmp_path), '--no-cache']) == 0
+    assert not capsys.readouterr().out
+
+
+def test_syntax_error(tmp_path, capsys):
+    (tmp_path / 'broken.py').write_text('class :\n')
+
+    assert main(['check', str(tmp_path / 'broken.py'), '--no-cache']) == 1
+    assert capsys.readouterr().out.startswith('{0}:1:'.format(tmp_path / 'broken.py'))
+
+
+@pytest.mark.parametrize('jobs', ['1', '2'])
+def test_missing_file(project, capsys, jobs):
+    missing = project / 'missing.py'
+
+    code = main([
+        'check', str(missing), str(project / 'pkg'), '-j', jobs, '--available-er-names', 'Handler', '--no-cache',
+    ])
+
+    assert code == 1
+    assert capsys.readouterr().out.splitlines() == [
+        "{0}:0:1: E902 FileNotFoundError: [Errno 2] No such file or directory: '{0}'".format(missing),
+        '{0}/pkg/handler.py:3:5: PEO700 class attribute "name" should be private'.format(project),
+        '{0}/pkg/house.py:1:1: PEO200 class must be frozen'.format(project),
+        '{0}/pkg/house.py:2:5: PEO601 Method "get_area" starts with "get" and should be avoided'.format(project),
+    ]
+
+
+@pytest.mark.parametrize('jobs', ['1', '2'])
+def test_too_deep_for_parser(tmp_path, capsys, jobs):
+    (tmp_path / 'generated.py').write_text('class Generated:\n    total = {0}\n'.format(' + '.join(['1'] * 100000)))
+
+    assert main(['check', str(tmp_path), '--cache-dir', str(tmp_path / 'cache'), '-j', jobs]) == 1
+    assert capsys.readouterr().out.startswith('{0}:1:1: E999 RecursionError: '.format(tmp_path / 'generated.py'))
+
+
+def test_files_without_classes_are_not_parsed(tmp_path, capsys, monkeypatch):
+    (tmp_path / 'constants.py').write_text('VALUE = (\n')
+    (tmp_path / 'generated.py').write_text('VALUE = 1\n' * 30000)
+    monkeypatch.setattr(ast, 'parse', None)
+
+    assert main(['check', str(tmp_path), '--no-cache', '-j', '1']) == 0
+    assert not capsys.readouterr().out
+
+
+def test_class_in_large_file(tmp_path, capsys):
+    (tmp_path / 'generated.py').write_text('{0}class House:\n    area = 1\n'.format('VALUE = 1\n' * 30000))
+
+    assert main(['check', str(tmp_path), '--no-cache', '-j', '1']) == 1
+    assert capsys.readouterr().out.splitlines() == [
+        '{0}:30001:1: PEO200 class must be frozen'.format(tmp_path / 'generated.py'),
+        '{0}:30002:5: PEO700 class attribute "area" should be private'.format(tmp_path / 'generated.py'),
+    ]
+
+
+def test_unicode_self(tmp_path, capsys):
+    (tmp_path / 'area.py').write_text('def get_area(ｓｅｌｆ):\n    return 1\n')
+
+    assert main(['check', str(tmp_path), '--no-cache', '-j', '1']) == 1
+    assert 'PEO601' in capsys.readouterr().out
+
+
+def test_excluded(project, capsys):
+    main(['check', str(project), '--no-cache'])
+
+    assert '.git' not in capsys.readouterr().out
+
+
+def test_cached(project, capsys, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    main(['check', str(project / 'pkg'), '--cache-dir', str(cache_dir)])
+    first = capsys.readouterr().out
+    main(['check', str(project / 'pkg'), '--cache-dir', str(cache_dir)])
+
+    assert capsys.readouterr().out == first
+    assert sorted(entry.name for entry in cache_dir.iterdir()) == ['.gitignore', 'index', 'lock', 'pack-000000']
+
+
+def test_reformatted_is_not_checked(project, capsys, tmp_path, monkeypatch):
+    options = ['check', str(project / 'pkg'), '--available-er-names', 'Handler', '--cache-dir', str(tmp_path / 'cache')]
+    main(options)
+    capsys.readouterr()
+    (project / 'pkg' / 'house.py').write_text('\n'.join([
+        '# House.',
+        '',
+        '',
+        'class HttpHouse :  # noqa: WPS',
+        '',
+        '    def get_area(',
+        '        self,',
+        '    ):',
+        '        return self._area',
+        '',
+    ]))
+    monkeypatch.setattr(check, 'tree_problems', None)
+
+    assert main(options) == 1
+    assert capsys.readouterr().out.splitlines() == [
+        '{0}/pkg/handler.py:3:5: PEO700 class attribute "name" should be private'.format(project),
+        '{0}/pkg/house.py:4:1: PEO200 class must be frozen'.format(project),
+        '{0}/pkg/house.py:6:5: PEO601 Method "get_area" starts with "get" and should be avoided'.format(project),
+    ]
+
+
+def test_deeply_nested_with_cache(tmp_path, capsys):
+    (tmp_path / 'generated.py').write_text('class Generated:\n    total = {0}\n'.format(' + '.join(['1'] * 1500)))
+    options = ['check', str(tmp_path / 'generated.py'), '-j', '1', '--cache-dir', str(tmp_path / 'cache')]
+
+    assert main(options) == 1
+    first = capsys.readouterr().out
+    assert main(options) == 1
+    assert capsys.readouterr().out == first == '\n'.join([
+        '{0}:1:1: PEO200 class must be frozen'.format(tmp_path / 'generated.py'),
+        '{0}:2:5: PEO700 class attribute "total" should be private\n'.format(tmp_path / 'generated.py'),
+    ])
+
+
+def test_cache_archive(project, capsys, tmp_path, monkeypatch):
+    main(['check', str(project / 'pkg'), '--cache-dir', str(tmp_path / 'cache')])
+    first = capsys.readouterr().out
+    archive = tmp_path / 'artifacts' / 'pyeo.pack'
+
+    assert main(['cache', 'export', str(archive), '--cache-dir', str(tmp_path / 'cache')]) == 0
+    assert main(['cache', 'import', str(archive), '--cache-dir', str(tmp_path / 'restored')]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        '{0}: 4 results exported'.format(archive),
+        '{0}: 4 results imported'.format(archive),
+    ]
+    monkeypatch.setattr(check, 'tree_problems', None)
+    main(['check', str(project / 'pkg'), '--cache-dir', str(tmp_path / 'restored')])
+    assert capsys.readouterr().out == first
+
+
+def test_import_of_broken_cache_archive(tmp_path, capsys):
+    (tmp_path / 'pyeo.pack').write_text('{}')
+
+    assert main(['cache', 'import', str(tmp_path / 'pyeo.pack'), '--cache-dir', str(tmp_path / 'cache')]) == 2
+    assert 'is not pyeo cache archive' in capsys.readouterr().err
+
+
+def test_parse_cache(project, capsys, tmp_path, monkeypatch):
+    options = ['check', str(project / 'pkg'), '-j', '1', '--cache-dir', str(tmp_path / 'cache'), '--parse-cache']
+    main(options)
+    capsys.readouterr()
+    monkeypatch.setattr(ast, 'parse', None)
+
+    assert main([*options, '--available-er-names', 'Handler']) == 1
+    assert capsys.readouterr().out.splitlines() == [
+        '{0}/pkg/handler.py:3:5: PEO700 class attribute "name" should be private'.format(project),
+        '{0}/pkg/house.py:1:1: PEO200 class must be frozen'.format(project),
+        '{0}/pkg/house.py:2:5: PEO601 Method "get_area" starts with "get" and should be avoided'.format(project),
+    ]
+
+
+def test_ignore(project, capsys):
+    main(['check', str(project / 'pkg'), '--no-cache', '--available-er-names', 'Handler', '--ignore', 'PEO2,PEO7'])
+
+    assert capsys.readouterr().out.splitlines() == [
+        '{0}/pkg/house.py:2:5: PEO601 Method "get_area" starts with "get" and should be avoided'.format(project),
+    ]
+
+
+@pytest.mark.parametrize('jobs', ['1', '2'])
+def test_max_violations(project, capsys, jobs):
+    code = main([
+        'check', str(project / 'pkg'), '-j', jobs, '--available-er-names', 'Handler', '--no-cache',
+        '--max-violations', '2',
+    ])
+
+    assert code == 1
+    assert capsys.readouterr().out.splitlines() == [
+        '{0}/pkg/handler.py:3:5: PEO700 class attribute "name" should be private'.format(project),
+        '{0}/pkg/house.py:1:1: PEO200 class must be frozen'.format(project),
+    ]
+
+
+def test_baseline(project, capsys, monkeypatch):
+    monkeypatch.chdir(project)
+    (project / 'pkg' / 'house.py').write_text('\n'.join([
+        'class HttpHouse:',
+        '    def get_area(self):',
+        '        return self._area',
+    ]))
+    main(['baseline', 'create', 'pkg', '-o', 'baseline.json', '--available-er-names', 'Handler'])
+    capsys.readouterr()
+    (project / 'pkg' / 'house.py').write_text('\n'.join([
+        '',
+        'class HttpHouse:',
+        '    def get_area(self):',
+        '        return self._area',
+        '',
+        '    def get_cost(self):',
+        '        return self._cost',
+    ]))
+
+    code = main(['check', 'pkg', '--baseline', 'baseline.json', '--available-er-names', 'Handler', '--no-cache'])
+
+    assert code == 1
+    assert capsys.readouterr().out.splitlines() == [
+        'pkg/house.py:6:5: PEO601 Method "get_cost" starts with "get" and should be avoided',
+    ]
+
+
+@pytest.mark.parametrize('content', [None, '{"version": 0, "fingerprints": []}'])
+def test_unusable_baseline(project, capsys, monkeypatch, content):
+    monkeypatch.chdir(project)
+    if content is not None:
+        (project / 'baseline.json').write_text(content)
+
+    assert main(['check', 'pkg', '--baseline', 'baseline.json', '--no-cache']) == 2
+    assert capsys.readouterr().err.startswith('can not load baseline: ')
+
+
+def test_diff_against(project, capsys, monkeypatch):
+    monkeypatch.chdir(project)
+    (project / 'pkg' / 'house.py').write_text('\n'.join([
+        'class HttpHouse:',
+        '    def get_area(self):',
+        '        return self._area',
+        '',
+    ]))
+    subprocess.run([*_GIT, 'init', '-q'], check=True)
+    subprocess.run([*_GIT, 'add', 'pkg'], check=True)
+    subprocess.run([*_GIT, 'commit', '-q', '-m', 'init'], check=True)
+    (project / 'pkg' / 'house.py').write_text('\n'.join([
+        'class HttpHouse:',
+        '    def get_area(self):',
+        '        return self._area',
+        '',
+        '',
+        'class Handler:',
+        '    name = "handler"',
+        '',
+    ]))
+
+    code = main(['check', 'pkg', '--diff-against', 'HEAD', '--no-cache'])
+
+    assert code == 1
+    assert capsys.readouterr().out.splitlines() == [
+        'pkg/house.py:6:1: PEO200 class must be frozen',
+        'pkg/house.py:6:1: PEO300 "er" suffix forbidden',
+        'pkg/house.py:7:5: PEO700 class attribute "name" should be private',
+    ]
+
+
+def test_diff_against_unknown_revision(project, capsys, monkeypatch):
+    monkeypatch.chdir(project)
+    subprocess.run([*_GIT, 'init', '-q'], check=True)
+
+    assert main(['check', 'pkg', '--diff-against', 'nonexistent']) == 2
+    assert capsys.readouterr().err.startswith("can not find changed lines: git diff against 'nonexistent' failed")
+
+
+@pytest.mark.parametrize('jobs', ['1', '2'])
+def test_staged(project, capsys, monkeypatch, jobs):
+    monkeypatch.chdir(project)
+    subprocess.run([*_GIT, 'init', '-q'], check=True)
+    subprocess.run([*_GIT, 'add', 'pkg/house.py'], check=True)
+    (project / 'pkg' / 'house.py').write_text('@attrs.frozen\nclass HttpHouse: ...\n')
+
+    code = main(['check', 'pkg', '--staged', '-j', jobs, '--no-cache'])
+
+    assert code == 1
+    assert capsys.readouterr().out.splitlines() == [
+        'pkg/house.py:1:1: PEO200 class must be frozen',
+        'pkg/house.py:2:5: PEO601 Method "get_area" starts with "get" and should be avoided',
+    ]
+
+
+def test_staged_outside_of_repository(tmp_path, capsys, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('GIT_CEILING_DIRECTORIES', str(tmp_path.parent))
+
+    assert main(['check', '.', '--staged']) == 2
+    assert capsys.readouterr().err.startswith('can not read staged files: git diff --cached failed')
+
+
+def test_thin_commands_import_only_daemon_client(tmp_path):
+    imported = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            '\n'.join((
+                'import sys',
+                'from pyeo.cli import main',
+                'main(["daemon", "stop", "--socket", sys.argv[1]])',
+                'print(sorted(name for name in sys.modules if name.startswith("pyeo.")))',
+            )),
+            str(tmp_path / 'missing.sock'),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert imported.splitlines() == ["['pyeo.cli', 'pyeo.daemon']"]
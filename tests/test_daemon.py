@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import threading
+import time
+
+import pytest
+
+from pyeo import check
+from pyeo.cli import main
+from pyeo.daemon import request
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'pkg').mkdir()
+    (tmp_path / 'pkg' / 'house.py').write_text('class HttpHouse: ...\n\n\nclass Area: ...\n')
+    (tmp_path / 'readme.py').write_text('x = 1\n')
+    thread = threading.Thread(target=main, args=(['daemon', 'start', '.', '-j', '1', '--interval', '0.05'],))
+    thread.start()
+    for _ in range(500):
+        try:
+            request(tmp_path / '.pyeo.sock', {'command': 'ping'})
+        except OSError:
+            time.sleep(0.01)
+        else:
+            break
+    yield tmp_path
+    main(['daemon', 'stop'])
+    thread.join(5)
+
+
+def test_check(daemon, capsys):
+    code = main(['daemon', 'check'])
+
+    assert code == 1
+    assert capsys.readouterr().out.splitlines() == [
+        'pkg/house.py:1:1: PEO200 class must be frozen',
+        'pkg/house.py:4:1: PEO200 class must be frozen',
+    ]
+
+
+def test_recheck_changed(daemon, capsys):
+    (daemon / 'pkg' / 'house.py').write_text('@attrs.frozen\nclass HttpHouse: ...\n')
+
+    assert main(['daemon', 'check', 'pkg']) == 0
+    assert not capsys.readouterr().out
+
+
+def test_only_changed_class_is_rechecked(daemon, capsys, monkeypatch):
+    checked = []
+    origin = check._rule_records  # noqa: WPS437
+
+    def _rule_records(tree, config):  # noqa: WPS430
+        checked.append(getattr(tree, 'name', type(tree).__name__))
+        return origin(tree, config)
+    monkeypatch.setattr(check, '_rule_records', _rule_records)
+    (daemon / 'pkg' / 'house.py').write_text('class HttpHouse: ...\n\n\n@attrs.frozen\nclass Area: ...\n')
+
+    assert main(['daemon', 'check', 'pkg']) == 1
+    assert capsys.readouterr().out.splitlines() == ['pkg/house.py:1:1: PEO200 class must be frozen']
+    assert checked == ['Area']
+
+
+def test_already_started(daemon, capsys):
+    assert main(['daemon', 'start', '.']) == 2
+    assert capsys.readouterr().err.startswith('can not start pyeo daemon: pyeo daemon already listens on')
+
+
+def test_stopped(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+
+    assert main(['daemon', 'check']) == 2
+    assert 'pyeo daemon is not available' in capsys.readouterr().err
@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import pickle
+
+import pytest
+
+from pyeo.utils.er_names import ErNames
+
+
+@pytest.mark.parametrize(('patterns', 'name', 'allowed'), [
+    (['User'], 'User', True),
+    (['User'], 'AdminUser', True),
+    (['User'], 'Answer', False),
+    (['User', 'Answer'], 'Answer', True),
+    (['*Serializer'], 'UserSerializer', True),
+    (['*Serializer'], 'Serializer', True),
+    (['*Serializer'], 'Sorter', False),
+    (['Base*Handler'], 'BaseHttpHandler', True),
+    (['Base*Handler'], 'HttpHandler', False),
+    (['Http?andler'], 'HttpHandler', True),
+    (['*'], 'Anyer', True),
+    ([], 'User', False),
+])
+def test_allows(patterns, name, allowed):
+    assert ErNames(patterns).allows(name) is allowed
+
+
+def test_many_names():
+    names = ErNames('Vendor{0}Consumer'.format(idx) for idx in range(1000))
+
+    assert names.allows('Vendor999Consumer')
+    assert not names.allows('Vendor1000Consumer')
+
+
+def test_picklable():
+    assert pickle.loads(pickle.dumps(ErNames(['User', 'Base*Handler']))).allows('BaseHttpHandler')
@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import ast
+
+from pyeo.features.code_free_ctor_visitor import CodeFreeCtorVisitor
+from pyeo.features.no_er_suffix import NoErSuffix
+from pyeo.features.no_getter_methods import NoGetterMethodsVisitor
+from pyeo.features.no_mutable_objects import NoMutableObjectsVisitor
+from pyeo.features.no_property_decorator import NoPropertyDecoratorVisitor
+from pyeo.features.no_public_attributes import NoPublicAttributesVisitor
+from pyeo.fused_visitor import FusedVisitor
+from pyeo.utils.definitions import definitions
+from pyeo.violations import formatted
+
+_CODE = '\n'.join([
+    'class HttpHandler(House):',
+    '    name = "test"',
+    '',
+    '    def __init__(self, cost):',
+    '        print(cost)',
+    '',
+    '    @property',
+    '    def cost(self):',
+    '        return self._cost',
+    '',
+    '    class Nested:',
+    '        value: int = 1',
+    '',
+    '        def get_value(self):',
+    '            return self.value',
+    '',
+    '',
+    'def wrapper():',
+    '    class Inner(Enum):',
+    '        first = 1',
+    '',
+    '    @property',
+    '    def area(self):',
+    '        return self._area',
+])
+
+
+def _rules(options):
+    return [
+        CodeFreeCtorVisitor(options),
+        NoMutableObjectsVisitor(options),
+        NoErSuffix(options),
+        NoPublicAttributesVisitor(options),
+        NoPropertyDecoratorVisitor(options),
+        NoGetterMethodsVisitor(options),
+    ]
+
+
+def test_same_problems_as_separate_visitors(options_factory):
+    separate = _rules(options_factory())
+    fused = _rules(options_factory())
+    for visitor in separate:
+        visitor.visit(ast.parse(_CODE))
+    FusedVisitor(fused).visit(ast.parse(_CODE))
+
+    assert [rule.problems for rule in fused] == [visitor.problems for visitor in separate]
+
+
+def test_nested_nodes(options_factory):
+    rules = _rules(options_factory())
+    FusedVisitor(rules).visit(ast.parse(_CODE))
+
+    assert list(map(formatted, rules[4].problems)) == [
+        (8, 4, 'PEO500 @property decorator is forbidden'),
+        (23, 4, 'PEO500 @property decorator is forbidden'),
+    ]
+
+
+def test_order_of_definitions():
+    code = '\n'.join([
+        'try:',
+        '    class First: ...',
+        'except Error:',
+        '    def second(): ...',
+        'else:',
+        '    with ctx:',
+        '        class Third:',
+        '            def fourth(self): ...',
+        'finally:',
+        '    match value:',
+        '        case 1:',
+        '            async def fifth():',
+        '                def sixth(): ...',
+        'x = [lambda: 1 for _ in range(2)]',
+    ])
+
+    assert [node.name for node in definitions(ast.parse(code))] == ['First', 'second', 'Third', 'fourth', 'sixth']
+
+
+def test_deeply_nested_expression(options_factory):
+    rules = _rules(options_factory())
+    FusedVisitor(rules).visit(ast.parse('x = {0}\nclass Parser: ...'.format(' + '.join(['1'] * 900))))
+
+    assert list(map(formatted, rules[2].problems)) == [(2, 0, 'PEO300 "er" suffix forbidden')]
+
+
+def test_deeply_nested_blocks(options_factory):
+    depth = 80
+    code = '\n'.join(
+        ['{0}if x:'.format('    ' * level) for level in range(depth)]
+        + ['{0}class Parser: ...'.format('    ' * depth)],
+    )
+    rules = _rules(options_factory())
+    FusedVisitor(rules).visit(ast.parse(code))
+
+    assert list(map(formatted, rules[2].problems)) == [(depth + 1, depth * 4, 'PEO300 "er" suffix forbidden')]
+
+
+def test_streamed_problems(options_factory):
+    rules = _rules(options_factory())
+    problems = FusedVisitor(rules).problems(ast.parse(_CODE))
+
+    assert formatted(next(problems)) == (5, 8, 'PEO101 __init__ method should contain only assignments')
+    assert not rules[5].problems
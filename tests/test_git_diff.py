@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import ast
+import subprocess
+
+import pytest
+
+from pyeo.git_diff import changed_lines, staged_sources, touched_by
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    _git(tmp_path, 'init', '-q')
+    (tmp_path / 'house.py').write_text('\n'.join(['class HttpHouse:', '    area = 1', '', 'x = 1', 'y = 2', '']))
+    (tmp_path / 'readme.txt').write_text('readme\n')
+    _git(tmp_path, 'add', '.')
+    _git(tmp_path, 'commit', '-q', '-m', 'init')
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_changed_lines(repo):
+    (repo / 'house.py').write_text('\n'.join(['class HttpHouse:', '    area = 2', '', 'x = 1', '']))
+    (repo / 'readme.txt').write_text('changed\n')
+    (repo / 'new.py').write_text('a = 1\n')
+    _git(repo, 'add', 'new.py')
+
+    assert changed_lines('HEAD') == {'house.py': ((2, 2), (4, 5)), 'new.py': ((1, 1),)}
+
+
+@pytest.mark.parametrize('option', ['diff.noprefix=true', 'diff.mnemonicPrefix=true'])
+def test_changed_lines_with_prefix_config(repo, option):
+    _git(repo, 'config', *option.split('='))
+    (repo / 'house.py').write_text('\n'.join(['class HttpHouse:', '    area = 2', '', 'x = 1', 'y = 2', '']))
+
+    assert changed_lines('HEAD') == {'house.py': ((2, 2),)}
+
+
+@pytest.mark.parametrize('name', ['b c.py', 'sub/\u00fc.py', 'a\\"b.py'])
+def test_changed_lines_of_special_path(repo, name):
+    (repo / 'sub').mkdir()
+    (repo / name).write_text('a = 1\n')
+    _git(repo, 'add', name)
+
+    assert changed_lines('HEAD') == {name: ((1, 1),)}
+
+
+def test_staged_sources(repo):
+    (repo / 'house.py').write_text('class HttpHouse: ...\n')
+    (repo / 'new.py').write_text('a = 1\n')
+    (repo / 'unstaged.py').write_text('b = 1\n')
+    _git(repo, 'add', 'house.py', 'new.py')
+    (repo / 'house.py').write_text('changed = 1\n')
+
+    assert list(staged_sources(['.'])) == [('house.py', b'class HttpHouse: ...\n'), ('new.py', b'a = 1\n')]
+
+
+def test_nothing_staged(repo):
+    assert not list(staged_sources(['.']))
+
+
+def test_unknown_revision(repo):
+    with pytest.raises(RuntimeError, match='git diff against'):
+        changed_lines('unknown')
+
+
+@pytest.mark.parametrize(('ranges', 'lines'), [
+    (((3, 3),), [2, 3]),
+    (((1, 1),), [2, 3]),
+    (((8, 8),), [6, 7, 8]),
+    (((10, 10),), [10]),
+    (((9, 9),), []),
+])
+def test_touched_by(ranges, lines):
+    tree = ast.parse('\n'.join([
+        '@attrs.define',
+        'class HttpHouse:',
+        '    area = 1',
+        '    def get_area(self): ...',
+        '',
+        'class Handler:',
+        '    def get_cost(self):',
+        '        return 1',
+        '',
+        'Public = 1',
+    ]))
+    touched = touched_by(tree, ranges)
+
+    assert [line for line in (2, 3, 4, 6, 7, 8, 10) if touched((line, 0, 0, ''))] == lines
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from pyeo import check
+from pyeo.check import source_problems
+from pyeo.incremental_module import IncrementalModule
+
+_SOURCE = '\n'.join([
+    'import attrs',
+    '',
+    '',
+    '@attrs.frozen',
+    'class HttpHouse:',
+    '    def get_area(self):',
+    '        return self._area',
+    '',
+    '',
+    'class Handler:',
+    '    name = "handler"',
+    '',
+    '',
+    'def wrapper():',
+    '    class Inner: ...',
+    '',
+])
+
+
+@pytest.fixture
+def checked_nodes(monkeypatch):
+    nodes = []
+    origin = check._rule_records  # noqa: WPS437
+
+    def _rule_records(tree, config):  # noqa: WPS430
+        nodes.append(getattr(tree, 'name', type(tree).__name__))
+        return origin(tree, config)
+    monkeypatch.setattr(check, '_rule_records', _rule_records)
+    return nodes
+
+
+def test_same_as_full_check(options_factory):
+    config = options_factory()
+
+    assert list(IncrementalModule(config, 'house.py').problems(_SOURCE)) == list(
+        source_problems(_SOURCE.encode(), 'house.py', config),
+    )
+
+
+def test_recheck_only_changed_class(options_factory, checked_nodes):
+    module = IncrementalModule(options_factory(), 'house.py')
+    module.problems(_SOURCE)
+    checked_nodes.clear()
+    edited = _SOURCE.replace('import attrs\n', 'import attrs\nimport typing\n').replace('"handler"', '"other"')
+
+    assert list(module.problems(edited)) == [
+        (7, 4, 'PEO601 Method "get_area" starts with "get" and should be avoided'),
+        (11, 0, 'PEO200 class must be frozen'),
+        (11, 0, 'PEO300 "er" suffix forbidden'),
+        (12, 4, 'PEO700 class attribute "name" should be private'),
+        (16, 4, 'PEO200 class must be frozen'),
+        (16, 4, 'PEO300 "er" suffix forbidden'),
+    ]
+    assert checked_nodes == ['Import', 'Import', 'Handler', 'wrapper']
+
+
+def test_syntax_error(options_factory):
+    assert list(IncrementalModule(options_factory(), 'house.py').problems('class (')) == [
+        (1, 6, 'E999 SyntaxError: invalid syntax'),
+    ]
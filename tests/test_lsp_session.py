@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import io
+import json
+
+from pyeo.lsp_session import LspSession
+
+_URI = 'file:///project/house.py'
+
+
+def _framed(*messages):
+    stream = b''
+    for message in messages:
+        body = json.dumps({'jsonrpc': '2.0', **message}).encode()
+        stream += b'Content-Length: ' + str(len(body)).encode() + b'\r\n\r\n' + body
+    return io.BytesIO(stream)
+
+
+def _messages(stream):
+    messages = []
+    data = stream.getvalue()
+    while data:
+        header, _, data = data.partition(b'\r\n\r\n')
+        length = int(header.split(b':')[1])
+        messages.append(json.loads(data[:length]))
+        data = data[length:]
+    return messages
+
+
+def _diagnostics(message):
+    return [
+        (diagnostic['range']['start']['line'], diagnostic['range']['start']['character'], diagnostic['code'])
+        for diagnostic in message['params']['diagnostics']
+    ]
+
+
+def test_session(options_factory):
+    writer = io.BytesIO()
+    code = LspSession(options_factory(), _framed(
+        {'id': 1, 'method': 'initialize', 'params': {}},
+        {'method': 'initialized', 'params': {}},
+        {'method': 'textDocument/didOpen', 'params': {'textDocument': {
+            'uri': _URI, 'languageId': 'python', 'version': 1, 'text': 'class HttpHouse: ...\n',
+        }}},
+        {'method': 'textDocument/didChange', 'params': {
+            'textDocument': {'uri': _URI, 'version': 2},
+            'contentChanges': [{'text': '# éé\n@attrs.frozen\nclass HttpHouse:\n    é = 1; x = 1\n'}],
+        }},
+        {'method': 'textDocument/didClose', 'params': {'textDocument': {'uri': _URI}}},
+        {'id': 2, 'method': 'unknown'},
+        {'id': 3, 'method': 'shutdown'},
+        {'method': 'exit'},
+    ), writer).serve()
+    messages = _messages(writer)
+
+    assert code == 0
+    assert messages[0]['result']['capabilities']['textDocumentSync']['change'] == 1
+    assert _diagnostics(messages[1]) == [(0, 0, 'PEO200')]
+    assert _diagnostics(messages[2]) == [(3, 4, 'PEO700'), (3, 11, 'PEO700')]
+    assert _diagnostics(messages[3]) == []
+    assert messages[4]['error']['code'] == -32601
+    assert messages[5] == {'jsonrpc': '2.0', 'id': 3, 'result': None}
+
+
+def test_exit_without_shutdown(options_factory):
+    assert LspSession(options_factory(), _framed({'method': 'exit'}), io.BytesIO()).serve() == 1
+
+
+def test_deeply_nested_change(options_factory):
+    writer = io.BytesIO()
+    LspSession(options_factory(), _framed(
+        {'method': 'textDocument/didOpen', 'params': {'textDocument': {
+            'uri': _URI, 'languageId': 'python', 'version': 1, 'text': '',
+        }}},
+        {'method': 'textDocument/didChange', 'params': {
+            'textDocument': {'uri': _URI, 'version': 2},
+            'contentChanges': [{'text': 'class Generated:\n    total = {0}\n'.format(' + '.join(['1'] * 1500))}],
+        }},
+    ), writer).serve()
+
+    assert _diagnostics(_messages(writer)[1]) == [(0, 0, 'PEO200'), (1, 4, 'PEO700')]
+
+
+def test_broken_messages(options_factory):
+    writer = io.BytesIO()
+    reader = _framed(
+        {'method': 'textDocument/didChange', 'params': {'textDocument': {'uri': _URI}}},
+        {'id': 1, 'method': 'textDocument/didOpen', 'params': {}},
+    )
+    broken = b'Content-Length: 5\r\n\r\n{oops' + b'Content-Length: 2\r\n\r\n[]'
+    reader = io.BytesIO(reader.getvalue() + broken + _framed(
+        {'method': 'textDocument/didOpen', 'params': {'textDocument': {
+            'uri': _URI, 'languageId': 'python', 'version': 1, 'text': 'class HttpHouse: ...\n',
+        }}},
+        {'id': 2, 'method': 'shutdown'},
+        {'method': 'exit'},
+    ).getvalue())
+    code = LspSession(options_factory(), reader, writer).serve()
+    messages = _messages(writer)
+
+    assert code == 0
+    assert messages[0]['method'] == 'window/logMessage'
+    assert messages[0]['params']['message'].startswith('textDocument/didChange failed: KeyError')
+    assert messages[1]['id'] == 1
+    assert messages[1]['error']['code'] == -32603
+    assert messages[2]['error']['code'] == -32700
+    assert messages[3]['error']['code'] == -32600
+    assert _diagnostics(messages[4]) == [(0, 0, 'PEO200')]
+    assert messages[5] == {'jsonrpc': '2.0', 'id': 2, 'result': None}
@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import argparse
+import ast
+import subprocess
+import sys
+
+import pytest
+
+from pyeo.main import Plugin
+
+_LINES = [
+    'class HttpHouse:\n',
+    '    def get_area(self):\n',
+    '        return self._area\n',
+]
+
+
+@pytest.fixture
+def plugin_options():
+    def _plugin_options(  # noqa: WPS430
+        pyeo_cache_dir: str = '',
+        extend_ignore: list[str] | None = None,
+        pyeo_max_violations: int = 0,
+        pyeo_baseline: str = '',
+    ) -> argparse.Namespace:
+        return argparse.Namespace(
+            select=None,
+            extend_select=None,
+            ignore=None,
+            extend_ignore=extend_ignore,
+            extended_default_select=['PEO'],
+            extended_default_ignore=[],
+            available_er_names=[],
+            pyeo_cache_dir=pyeo_cache_dir,
+            pyeo_cache_size=1,
+            pyeo_profile='',
+            pyeo_max_violations=pyeo_max_violations,
+            pyeo_baseline=pyeo_baseline,
+            pyeo_diff_against='',
+        )
+    return _plugin_options
+
+
+def test_run(plugin_options):
+    Plugin.parse_options(plugin_options())
+
+    assert [problem[:3] for problem in Plugin(ast.parse(''.join(_LINES)), _LINES, 'house.py').run()] == [
+        (1, 0, 'PEO200 class must be frozen'),
+        (2, 4, 'PEO601 Method "get_area" starts with "get" and should be avoided'),
+    ]
+
+
+def test_cached_run(plugin_options, tmp_path):
+    Plugin.parse_options(plugin_options(str(tmp_path)))
+    list(Plugin(ast.parse(''.join(_LINES)), _LINES, 'house.py').run())
+
+    assert [problem[:3] for problem in Plugin(ast.Module(body=[], type_ignores=[]), _LINES, 'house.py').run()] == [
+        (1, 0, 'PEO200 class must be frozen'),
+        (2, 4, 'PEO601 Method "get_area" starts with "get" and should be avoided'),
+    ]
+
+
+def test_cached_deeply_nested(plugin_options, tmp_path):
+    lines = ['class Generated:\n', '    total = {0}\n'.format(' + '.join(['1'] * 1500))]
+    Plugin.parse_options(plugin_options(str(tmp_path)))
+
+    assert [problem[:3] for problem in Plugin(ast.parse(''.join(lines)), lines, 'generated.py').run()] == [
+        (1, 0, 'PEO200 class must be frozen'),
+        (2, 4, 'PEO700 class attribute "total" should be private'),
+    ]
+
+
+def test_ignored_rules(plugin_options):
+    Plugin.parse_options(plugin_options(extend_ignore=['PEO6']))
+
+    assert [problem[:3] for problem in Plugin(ast.parse(''.join(_LINES)), _LINES, 'house.py').run()] == [
+        (1, 0, 'PEO200 class must be frozen'),
+    ]
+
+
+def test_max_violations(plugin_options):
+    Plugin.parse_options(plugin_options(pyeo_max_violations=1))
+
+    assert [problem[:3] for problem in Plugin(ast.parse(''.join(_LINES)), _LINES, 'house.py').run()] == [
+        (1, 0, 'PEO200 class must be frozen'),
+    ]
+
+
+def test_cut_problems_are_not_cached(plugin_options, tmp_path):
+    Plugin.parse_options(plugin_options(str(tmp_path), pyeo_max_violations=1))
+    list(Plugin(ast.parse(''.join(_LINES)), _LINES, 'house.py').run())
+    Plugin.parse_options(plugin_options(str(tmp_path)))
+
+    assert len(list(Plugin(ast.parse(''.join(_LINES)), _LINES, 'house.py').run())) == 2
+
+
+def test_rules_are_imported_when_enabled():
+    imported = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            '\n'.join((
+                'import argparse, sys',
+                'from pyeo.main import Plugin',
+                'print(sorted(name for name in sys.modules if name.startswith("pyeo.features.")))',
+                'Plugin.parse_options(argparse.Namespace(',
+                '    select=["PEO200"], extend_select=None, ignore=None, extend_ignore=None,',
+                '    extended_default_select=["PEO"], extended_default_ignore=[], available_er_names=[],',
+                '    pyeo_cache_dir="", pyeo_cache_size=1, pyeo_profile="", pyeo_max_violations=0,',
+                '    pyeo_baseline="", pyeo_diff_against="",',
+                '))',
+                'print(sorted(name for name in sys.modules if name.startswith("pyeo.features.")))',
+            )),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()
+
+    assert imported == ['[]', "['pyeo.features.no_mutable_objects']"]
+
+
+def test_disabled_plugin(plugin_options):
+    Plugin.parse_options(plugin_options(extend_ignore=['PEO']))
+
+    assert not list(Plugin(ast.parse(''.join(_LINES)), _LINES, 'house.py').run())
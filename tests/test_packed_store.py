@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import hashlib
+import multiprocessing
+import pickle
+
+import pytest
+
+from pyeo.packed_store import PackedStore
+
+
+def _key(name):
+    return hashlib.blake2b(name.encode(), digest_size=16).digest()
+
+
+def _put_many(task):
+    directory, worker = task
+    store = PackedStore(directory)
+    for idx in range(100):
+        store.put(_key('{0}-{1}'.format(worker, idx)), str(idx).encode())
+
+
+def test_miss(tmp_path):
+    assert PackedStore(tmp_path / 'cache').find(_key('house')) is None
+
+
+def test_hit_in_other_instance(tmp_path):
+    PackedStore(tmp_path).put(_key('house'), b'[]')
+
+    assert PackedStore(tmp_path).find(_key('house')) == b'[]'
+
+
+def test_grows_index(tmp_path):
+    store = PackedStore(tmp_path)
+    reader = PackedStore(tmp_path)
+    reader.find(_key('house'))
+    for idx in range(3000):
+        store.put(_key(str(idx)), str(idx).encode())
+
+    assert all(reader.find(_key(str(idx))) == str(idx).encode() for idx in range(3000))
+
+
+def test_concurrent_writers(tmp_path):
+    with multiprocessing.Pool(4) as pool:
+        pool.map(_put_many, [(tmp_path, worker) for worker in range(4)])
+    store = PackedStore(tmp_path)
+
+    assert all(
+        store.find(_key('{0}-{1}'.format(worker, idx))) == str(idx).encode()
+        for worker in range(4)
+        for idx in range(100)
+    )
+    assert [segment.name for segment in tmp_path.glob('pack-*')] == ['pack-000000']
+
+
+def test_pickled(tmp_path):
+    store = PackedStore(tmp_path)
+    store.put(_key('house'), b'[]')
+
+    assert pickle.loads(pickle.dumps(store)).find(_key('house')) == b'[]'
+
+
+def test_evict_keeps_recently_used(tmp_path):
+    store = PackedStore(tmp_path)
+    for name in ('first', 'second', 'third'):
+        store.put(_key(name), b'0123456789')
+    store.find(_key('first'))
+    store.evict(80)
+
+    assert store.find(_key('first')) == b'0123456789'
+    assert store.find(_key('second')) is None
+    assert store.find(_key('third')) == b'0123456789'
+    assert [segment.name for segment in tmp_path.glob('pack-*')] == ['pack-000001']
+
+
+def test_archive(tmp_path):
+    store = PackedStore(tmp_path / 'first')
+    store.put(_key('house'), b'[]')
+    store.put(_key('handler'), b'[[1,0,"PEO300",""]]')
+    other = PackedStore(tmp_path / 'second')
+    other.put(_key('house'), b'[]')
+
+    assert store.export_archive(tmp_path / 'cache.pack') == 2
+    assert other.import_archive(tmp_path / 'cache.pack') == 1
+    assert other.find(_key('handler')) == b'[[1,0,"PEO300",""]]'
+
+
+@pytest.mark.parametrize('content', [b'', b'PEOPACK1\0\0', b'PEOPACK1' + bytes(16) + b'\x05\0\0\0[]'])
+def test_broken_archive(tmp_path, content):
+    (tmp_path / 'cache.pack').write_bytes(content)
+
+    with pytest.raises(ValueError, match='cache.pack'):
+        PackedStore(tmp_path / 'cache').import_archive(tmp_path / 'cache.pack')
@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+from pyeo.result_cache import ResultCache, cache_salt
+from pyeo.rules import ALL_CODES, compiled_config
+from pyeo.violations import Violations
+
+
+def test_miss(tmp_path):
+    assert ResultCache(tmp_path, 1024, b'salt').problems(b'class A: ...') is None
+
+
+def test_hit(tmp_path):
+    cache = ResultCache(tmp_path, 1024, b'salt')
+    problems = Violations()
+    problems.add(1, 0, 'PEO700', 'name')
+    cache.save(b'class A: ...', problems)
+
+    assert list(cache.problems(b'class A: ...')) == [(1, 0, 'PEO700 class attribute "name" should be private')]
+
+
+def test_other_salt(tmp_path):
+    ResultCache(tmp_path, 1024, b'salt').save(b'class A: ...', Violations())
+
+    assert ResultCache(tmp_path, 1024, b'other').problems(b'class A: ...') is None
+
+
+def test_salt_depends_on_options(namespace_factory):
+    assert (
+        cache_salt(compiled_config(namespace_factory(['Handler']), ALL_CODES))
+        != cache_salt(compiled_config(namespace_factory(), ALL_CODES))
+    )
+
+
+def test_salt_depends_on_codes(namespace_factory):
+    assert (
+        cache_salt(compiled_config(namespace_factory(), ALL_CODES))
+        != cache_salt(compiled_config(namespace_factory(), frozenset(('PEO200',))))
+    )
+
+
+def test_evict_least_recently_used(tmp_path):
+    cache = ResultCache(tmp_path, 60, b'salt')
+    for source in (b'first', b'second', b'third'):
+        cache.save(source, Violations())
+    cache.problems(b'first')
+    cache.evict()
+
+    assert list(cache.problems(b'first')) == []
+    assert cache.problems(b'second') is None
+    assert list(cache.problems(b'third')) == []
+
+
+def test_corrupted_entry_is_miss(tmp_path):
+    cache = ResultCache(tmp_path, 1024, b'salt')
+    cache.save(b'class A: ...', Violations())
+    for segment in tmp_path.glob('pack-*'):
+        segment.write_bytes(bytes(segment.stat().st_size))
+
+    assert ResultCache(tmp_path, 1024, b'salt').problems(b'class A: ...') is None
@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import json
+import subprocess
+import sys
+from collections import defaultdict
+
+from pyeo.rule_profile import RuleProfile
+
+
+def _profile(path):
+    return RuleProfile(path, [0], defaultdict(lambda: dict.fromkeys(('time', 'classes'), 0)))
+
+
+def test_dump_merges_parts(tmp_path):
+    report = tmp_path / 'profile.json'
+    (tmp_path / 'profile.json.42.part').write_text(json.dumps({
+        'files': 2,
+        'rules': {'NoErSuffix': {'time': 0.5, 'classes': 3}},
+    }))
+    profile = _profile(report)
+    profile.add_file()
+    profile.add('NoErSuffix', time=0.25, classes=1)
+    profile.dump()
+
+    assert json.loads(report.read_text()) == {
+        'files': 3,
+        'rules': {
+            'NoErSuffix': {'time': 0.75, 'classes': 4, 'functions': 0, 'problems': 0},
+        },
+    }
+    assert list(tmp_path.iterdir()) == [report]
+
+
+def test_cli_workers(tmp_path):
+    for idx in range(4):
+        (tmp_path / 'module{0}.py'.format(idx)).write_text('class HttpHouse:\n    def area(self): ...\n')
+    report = tmp_path / 'report' / 'profile.json'
+    subprocess.run(
+        [sys.executable, '-m', 'pyeo', 'check', str(tmp_path), '-j', '2', '--no-cache', '--profile', str(report)],
+        check=False,
+    )
+
+    got = json.loads(report.read_text())
+    assert got['files'] == 4
+    assert got['rules']['NoMutableObjectsVisitor']['problems'] == 4
+    assert got['rules']['NoGetterMethodsVisitor']['functions'] == 4
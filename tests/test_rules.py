@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import pickle
+
+import pytest
+
+from pyeo.features.code_free_ctor_visitor import CodeFreeCtorVisitor
+from pyeo.features.no_getter_methods import NoGetterMethodsVisitor
+from pyeo.rules import ALL_CODES, compiled_config, selected_codes
+
+
+@pytest.mark.parametrize(('select', 'ignore', 'expected'), [
+    (['PEO'], [], ALL_CODES),
+    (['PEO'], ['PEO'], frozenset()),
+    (['PEO'], ['PEO1', 'PEO2', 'PEO3', 'PEO5', 'PEO7'], frozenset(('PEO601', 'PEO602'))),
+    (['PEO602'], ['PEO6'], frozenset(('PEO602',))),
+    ([], [], frozenset()),
+])
+def test_selected_codes(select, ignore, expected):
+    assert selected_codes(select, ignore) == expected
+
+
+def test_enabled_rules(namespace_factory):
+    got = compiled_config(namespace_factory(), frozenset(('PEO102', 'PEO601')))
+
+    assert got.rules == (CodeFreeCtorVisitor, NoGetterMethodsVisitor)
+
+
+def test_er_whitelist(namespace_factory):
+    got = compiled_config(namespace_factory(['Handler']), ALL_CODES)
+
+    assert got.er_whitelist == frozenset(('User', 'Identifier', 'Handler'))
+
+
+def test_config_is_picklable(namespace_factory):
+    config = compiled_config(namespace_factory(['Handler']), ALL_CODES)
+
+    assert pickle.loads(pickle.dumps(config)) == config
+
+
+def test_unique_codes():
+    assert len(ALL_CODES) == 8
+
+
+@pytest.mark.parametrize(('codes', 'source', 'expected'), [
+    (ALL_CODES, b'VALUE = 1\n', False),
+    (ALL_CODES, b'# no class here\n', True),
+    (ALL_CODES, b'def area(self): ...\n', True),
+    (frozenset(('PEO200',)), b'def area(self): ...\n', False),
+    (frozenset(('PEO200',)), 'NAME = "дом"\n'.encode(), False),
+    (frozenset(('PEO601',)), 'def get_area(ｓｅｌｆ): ...\n'.encode(), True),
+    (frozenset(('PEO601',)), b'# -*- coding: latin-1 -*-\n', True),
+    (frozenset(), b'class House: ...\n', False),
+])
+def test_prefilter(namespace_factory, codes, source, expected):
+    assert (compiled_config(namespace_factory(), codes).prefilter.search(source) is not None) is expected
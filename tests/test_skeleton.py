@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import ast
+from pathlib import Path
+
+import pytest
+
+from pyeo.check import tree_problems
+from pyeo.utils.skeleton import dump_skeleton, load_skeleton, module_skeleton
+
+_SOURCE = '\n'.join([
+    'import attrs',
+    'TABLE = {"key": [1, 2, 3]}',
+    '',
+    '',
+    '@attrs.define(frozen=True)',
+    'class HttpHouse(Base[int], metaclass=Meta):',
+    '    """House."""',
+    '',
+    '    area: int = compute(1, 2)',
+    '    name = "house"',
+    '',
+    '    def __init__(self, area, name):',
+    '        self._area = area',
+    '        print(name)',
+    '',
+    '    @classmethod',
+    '    def of(cls, area):',
+    '        return cls(Area(area), 1.5, b"x", ..., 1j)',
+    '',
+    '    def size(self):',
+    '        if self._area:',
+    '            return self._area',
+    '        return 0',
+    '',
+    '    def area(self):',
+    '        if self._area:',
+    '            return self._area',
+    '        else:',
+    '            return self._fallback',
+    '',
+    '    def window(self):',
+    '        width = 1',
+    '        try:',
+    '            class Window: ...',
+    '        except ValueError:',
+    '            pass',
+    '        return width',
+    '',
+    '',
+    'match command:',
+    '    case "build":',
+    '        class Builder:',
+    '            def get_plan(self):',
+    '                return 1',
+])
+
+
+def _problems(tree, source, config):
+    return list(tree_problems(tree, source.splitlines(), 'house.py', config))
+
+
+@pytest.mark.parametrize('path', [
+    *Path(__file__).parent.parent.glob('pyeo/**/*.py'),
+    *Path(__file__).parent.glob('**/*.py'),
+], ids=str)
+def test_problems_of_repo_files(options_factory, path):
+    config = options_factory()
+    source = path.read_text()
+    tree = ast.parse(source)
+
+    assert _problems(load_skeleton(dump_skeleton(module_skeleton(tree))), source, config) == _problems(
+        tree, source, config,
+    )
+
+
+def test_problems_of_sample(options_factory):
+    config = options_factory()
+    tree = ast.parse(_SOURCE)
+    problems = _problems(tree, _SOURCE, config)
+
+    assert len(problems) == 8
+    assert _problems(module_skeleton(tree), _SOURCE, config) == problems
+
+
+def test_drops_statements():
+    skeleton = module_skeleton(ast.parse(_SOURCE))
+
+    assert [type(stmt).__name__ for stmt in skeleton.body] == ['ClassDef', 'Match']
+    assert [type(stmt).__name__ for stmt in skeleton.body[0].body[-1].body] == ['Try']
+
+
+def test_round_trip():
+    limits = 'class Limits:\n    def __init__(self):\n        self._max = 1e999 + "\\ud800"\n'
+    skeleton = module_skeleton(ast.parse('{0}\n\n\n{1}'.format(_SOURCE, limits)))
+
+    assert ast.dump(load_skeleton(dump_skeleton(skeleton)), include_attributes=True) == ast.dump(
+        skeleton, include_attributes=True,
+    )
+
+
+@pytest.mark.parametrize('dump', [
+    b'not json',
+    b'[["system"], [0]]',
+    b'[["Name"], [0, 1, 0, 1, 1, "x", [-1]]]',
+    b'[["Module"], [0, [-1], [-1]], "extra"]',
+    b'[["Constant"], [0, 1, 0, 1, 1, ["unknown"], null]]',
+])
+def test_broken_dump(dump):
+    with pytest.raises(ValueError):
+        load_skeleton(dump)
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import pickle
+
+from pyeo.violations import Violations, code_ids, formatted, violations_of_rows
+
+
+def _violations():
+    violations = Violations()
+    violations.add(3, 4, 'PEO601', 'get_area')
+    violations.add(1, 0, 'PEO200')
+    violations.add(3, 0, 'E999', 'SyntaxError: {invalid}')
+    return violations
+
+
+def test_formatted():
+    assert list(_violations()) == [
+        (3, 4, 'PEO601 Method "get_area" starts with "get" and should be avoided'),
+        (1, 0, 'PEO200 class must be frozen'),
+        (3, 0, 'E999 SyntaxError: {invalid}'),
+    ]
+
+
+def test_index():
+    assert _violations()[1] == (1, 0, 'PEO200 class must be frozen')
+
+
+def test_sorted():
+    assert [problem[:2] for problem in _violations().sorted()] == [(1, 0), (3, 0), (3, 4)]
+
+
+def test_rows():
+    assert list(violations_of_rows(_violations().rows())) == list(_violations())
+
+
+def test_clear():
+    violations = _violations()
+    violations.clear()
+
+    assert not violations
+
+
+def test_picklable():
+    assert list(pickle.loads(pickle.dumps(_violations()))) == list(_violations())
+
+
+def test_filter_by_code_ids():
+    enabled = code_ids(['PEO200', 'PEO999'])
+
+    assert [formatted(record) for record in _violations().records() if record[2] in enabled] == [
+        (1, 0, 'PEO200 class must be frozen'),
+    ]
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+import os
+
+import pytest
+
+from pyeo.check import file_problems
+from pyeo.watched_files import WatchedFiles
+
+
+@pytest.fixture
+def watched(tmp_path, options_factory):
+    (tmp_path / 'house.py').write_text('class HttpHouse: ...\n')
+    (tmp_path / 'area.py').write_text('x = 1\n')
+    config = options_factory()
+    return WatchedFiles(
+        [tmp_path],
+        [],
+        lambda paths: ((path, file_problems(path, config, None)) for path in paths),
+    )
+
+
+def _messages(watched, paths):
+    return [(path.name, list(problems)) for path, problems in watched.problems(paths)]
+
+
+def test_first_refresh(watched, tmp_path):
+    assert watched.refresh() == 2
+    assert _messages(watched, [tmp_path]) == [
+        ('area.py', []),
+        ('house.py', [(1, 0, 'PEO200 class must be frozen')]),
+    ]
+
+
+def test_unchanged(watched):
+    watched.refresh()
+
+    assert watched.refresh() == 0
+
+
+def test_changed(watched, tmp_path):
+    watched.refresh()
+    house = tmp_path / 'house.py'
+    house.write_text('@attrs.frozen\nclass HttpHouse: ...\n')
+    os.utime(house, ns=(1, 1))
+
+    assert watched.refresh() == 1
+    assert _messages(watched, [house]) == [('house.py', [])]
+
+
+def test_removed(watched, tmp_path):
+    watched.refresh()
+    (tmp_path / 'house.py').unlink()
+    watched.refresh()
+
+    assert _messages(watched, [tmp_path]) == [('area.py', [])]